@@ -0,0 +1,4 @@
+"""
+Benchmarks and comparison harnesses for the backend
+Run from the backend directory, e.g. `python -m benchmarks.precision_comparison --help`
+"""
@@ -0,0 +1,159 @@
+"""
+Insert and history-read throughput of DatabaseManager
+
+Compares the original connection handling (a new connection per call, rollback
+journal) against pooled per-thread connections with WAL and the tuned pragmas.
+Bulk inserts go through store_translations_bulk (one transaction per call).
+Each mode runs against its own temporary database.
+
+Usage (from the backend directory):
+    python -m benchmarks.db_benchmark --inserts 5000 --reads 500 --threads 4
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict
+
+from database import DatabaseManager
+
+
+class UnpooledDatabaseManager(DatabaseManager):
+    """DatabaseManager with the previous behaviour: fresh default connection per call"""
+
+    def get_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+
+def timed(fn, count: int) -> float:
+    """Run fn count times and return operations per second"""
+    start = time.perf_counter()
+    for i in range(count):
+        fn(i)
+    elapsed = time.perf_counter() - start
+    return count / elapsed if elapsed else 0.0
+
+
+def insert(db: DatabaseManager, i: int):
+    db.store_translation(
+        f"Cotton saree number {i} with handloom border",
+        f"हैंडलूम बॉर्डर वाली सूती साड़ी नंबर {i}",
+        "en",
+        "hi",
+        0.9
+    )
+
+
+def insert_bulk(db: DatabaseManager, i: int, batch_size: int):
+    db.store_translations_bulk([
+        {
+            "original_text": f"Cotton saree number {i}-{j} with handloom border",
+            "translated_text": f"हैंडलूम बॉर्डर वाली सूती साड़ी नंबर {i}-{j}",
+            "source_language": "en",
+            "target_language": "hi",
+            "model_confidence": 0.9
+        }
+        for j in range(batch_size)
+    ])
+
+
+def read_history(db: DatabaseManager, i: int, page_size: int):
+    db.get_translation_history(limit=page_size, offset=(i * page_size) % 1000)
+
+
+def mixed_workload(db: DatabaseManager, threads: int, operations: int, page_size: int) -> Dict[str, float]:
+    """One writer thread inserting while reader threads page through history"""
+    errors = []
+    reads = [0]
+    reads_lock = threading.Lock()
+    stop = threading.Event()
+
+    def writer():
+        for i in range(operations):
+            try:
+                insert(db, i)
+            except Exception as e:
+                errors.append(str(e))
+        stop.set()
+
+    def reader():
+        i = 0
+        while not stop.is_set():
+            try:
+                read_history(db, i, page_size)
+            except Exception as e:
+                errors.append(str(e))
+            i += 1
+        with reads_lock:
+            reads[0] += i
+
+    workers = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mixed_inserts_per_s": operations / elapsed,
+        "mixed_reads_per_s": reads[0] / elapsed,
+        "mixed_errors": len(errors),
+    }
+
+
+def run_mode(manager_class, args) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = manager_class(os.path.join(tmp, "translations.db"))
+        db.initialize_database()
+
+        bulk_batches = max(1, args.inserts // args.bulk_size)
+        results = {
+            "inserts_per_s": timed(lambda i: insert(db, i), args.inserts),
+            "bulk_inserts_per_s": args.bulk_size * timed(
+                lambda i: insert_bulk(db, i, args.bulk_size), bulk_batches
+            ),
+            "history_reads_per_s": timed(lambda i: read_history(db, i, args.page_size), args.reads),
+        }
+        results.update(mixed_workload(db, args.threads, args.inserts // 5, args.page_size))
+
+        db.close()
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DatabaseManager insert and history-read throughput")
+    parser.add_argument("--inserts", type=int, default=2000, help="Sequential store_translation calls")
+    parser.add_argument("--bulk-size", type=int, default=1000, help="Rows per store_translations_bulk call")
+    parser.add_argument("--reads", type=int, default=500, help="Sequential get_translation_history calls")
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--threads", type=int, default=4, help="Reader threads in the mixed workload")
+    args = parser.parse_args()
+
+    # Per-insert info logging would dominate the measurement
+    logging.getLogger("database").setLevel(logging.WARNING)
+
+    modes = {"before": UnpooledDatabaseManager, "after": DatabaseManager}
+    results = {}
+    for name, manager_class in modes.items():
+        print(f"Running {name}...", flush=True)
+        results[name] = run_mode(manager_class, args)
+
+    metrics = list(results["before"].keys())
+    header = f"{'metric':<24}{'before':>12}{'after':>12}{'speedup':>10}"
+    print(header)
+    print("-" * len(header))
+    for metric in metrics:
+        before, after = results["before"][metric], results["after"][metric]
+        speedup = f"{after / before:.2f}x" if before and metric != "mixed_errors" else "-"
+        print(f"{metric:<24}{before:>12.1f}{after:>12.1f}{speedup:>10}")
+
+
+if __name__ == "__main__":
+    main()
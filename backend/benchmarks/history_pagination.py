@@ -0,0 +1,124 @@
+"""
+Page latency of /history queries by depth: OFFSET paging vs keyset cursors
+
+Builds (or reuses) a synthetic translations database and times one page at
+increasing depths with both strategies. Keyset latency should stay flat while
+OFFSET latency grows with the number of skipped rows.
+
+Usage (from the backend directory):
+    python -m benchmarks.history_pagination --rows 10000000 --db /tmp/history_10m.db
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import time
+from typing import List
+
+from database import DatabaseManager
+
+LANGUAGE_PAIRS = [("en", "hi"), ("en", "ta"), ("hi", "en"), ("en", "bn"), ("ta", "en"), ("en", "mr")]
+
+
+def build_database(db: DatabaseManager, rows: int, corrections_every: int, chunk: int = 500000):
+    """Fill the translations table with synthetic rows, a few seconds apart"""
+    conn = db.get_connection()
+    existing = conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+    if existing >= rows:
+        print(f"Reusing database with {existing:,} rows")
+        return
+
+    pairs = " UNION ALL ".join(
+        f"SELECT {i} AS k, '{src}' AS src, '{tgt}' AS tgt" for i, (src, tgt) in enumerate(LANGUAGE_PAIRS)
+    )
+    start = time.perf_counter()
+    for first in range(existing, rows, chunk):
+        count = min(chunk, rows - first)
+        with conn:
+            conn.execute(f"""
+                WITH RECURSIVE seq(x) AS (
+                    SELECT ? UNION ALL SELECT x + 1 FROM seq WHERE x < ?
+                ),
+                pairs AS ({pairs})
+                INSERT INTO translations
+                    (original_text, translated_text, source_language, target_language,
+                     model_confidence, created_at, updated_at)
+                SELECT
+                    'Synthetic product description number ' || x,
+                    'सिंथेटिक उत्पाद विवरण संख्या ' || x,
+                    pairs.src, pairs.tgt, 0.9,
+                    datetime(1600000000 + x * 3, 'unixepoch'),
+                    datetime(1600000000 + x * 3, 'unixepoch')
+                FROM seq JOIN pairs ON pairs.k = x % {len(LANGUAGE_PAIRS)}
+            """, (first, first + count - 1))
+        print(f"  {first + count:,} rows ({time.perf_counter() - start:.0f}s)", flush=True)
+
+    with conn:
+        conn.execute(f"""
+            INSERT INTO corrections (translation_id, corrected_text, feedback)
+            SELECT id, 'Corrected ' || translated_text, 'synthetic'
+            FROM translations WHERE id % {corrections_every} = 0
+        """)
+    conn.execute("ANALYZE")
+
+
+def time_page(fn, repeats: int) -> float:
+    """Median latency of fn in milliseconds"""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+def cursor_at_depth(db: DatabaseManager, depth: int) -> str:
+    """Cursor for the record just before the page at the given depth (setup, not timed)"""
+    row = db.get_connection().execute("""
+        SELECT created_at, id FROM translations
+        ORDER BY created_at DESC, id DESC
+        LIMIT 1 OFFSET ?
+    """, (depth - 1,)).fetchone()
+    return db.encode_history_cursor({"created_at": row["created_at"], "id": row["id"]})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare OFFSET and keyset paging latency for /history")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--db", default="history_benchmark.db", help="Database file (reused if already filled)")
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--corrections-every", type=int, default=20, help="Add a correction to every Nth row")
+    args = parser.parse_args()
+
+    logging.getLogger("database").setLevel(logging.WARNING)
+    db = DatabaseManager(os.path.abspath(args.db))
+    db.initialize_database()
+    build_database(db, args.rows, args.corrections_every)
+
+    depths: List[int] = [0]
+    depth = 1000
+    while depth < args.rows:
+        depths.append(depth)
+        depth *= 10
+    depths.append(args.rows - args.page_size)
+
+    header = f"{'depth':>12}{'offset ms':>12}{'keyset ms':>12}"
+    print(header)
+    print("-" * len(header))
+    for depth in depths:
+        offset_ms = time_page(
+            lambda: db.get_translation_history(limit=args.page_size, offset=depth), args.repeats
+        )
+        cursor = cursor_at_depth(db, depth) if depth else None
+        keyset_ms = time_page(
+            lambda: db.get_translation_history(limit=args.page_size, cursor=cursor), args.repeats
+        )
+        print(f"{depth:>12,}{offset_ms:>12.2f}{keyset_ms:>12.2f}")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Placeholder extraction and restoration: per-pattern findall + variant maps vs one compiled scan
+
+The baseline reproduces the previous normalize_regex_inference behaviour (one re.findall
+per uncompiled pattern, ~30 variant keys per entity, and a str.replace per key when
+restoring). The new path uses normalize() and restore_placeholders(). Restoration runs on
+text where some placeholders were mangled the way the model does ("< ID1 >", "<आईडी1>"),
+and the round-trip outputs of both paths are compared.
+
+Usage (from the backend directory):
+    python -m benchmarks.placeholder_extraction --texts 5000
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+import regex as re
+
+from indictrans2.normalize_regex_inference import (
+    EMAIL_PATTERN,
+    INDIC_FAILURE_CASES,
+    NUMERAL_PATTERN,
+    OTHER_PATTERN,
+    URL_PATTERN,
+    normalize,
+    normalize_indic_numerals,
+    restore_placeholders,
+)
+
+PATTERNS = [EMAIL_PATTERN, URL_PATTERN, NUMERAL_PATTERN, OTHER_PATTERN]
+
+TEMPLATES = [
+    "Samsung Galaxy M34 5G (6GB RAM, 128GB) - 6000mAh battery, 120Hz display, 25% off till 31/12/2024",
+    "Buy now at www.example-store.in/products/saree-123 or mail support@example-store.in",
+    "Dimensions 30.5 x 20.2 x 10.0 cm, weight 1.25 kg, ratio 16:9, SKU 4521-889-01",
+    "Offer valid 10:00-18:00 on 15/08/2024. Pay via UPI shop@okaxis, follow @examplestore #FestiveSale",
+    "Visit https://shop.example.com/deals?id=42&ref=app for 10-15% cashback up to Rs 1,500",
+    "Pure cotton kurta with printed motifs, machine wash, size chart on the product page",
+    "Model No. XR-2024/11, warranty 2 years, call 1800-123-4567 between 9:30 and 17:30",
+]
+
+MANGLED_FORMATS = ["<ID{}>", "< ID{} >"] + [
+    form.format(case, "{}") for case in INDIC_FAILURE_CASES for form in ("<{}{}>", "< {}{} >")
+]
+
+
+def legacy_wrap(text: str, patterns: list) -> Tuple[str, dict]:
+    """Previous wrap_with_placeholders, kept verbatim for comparison"""
+    serial_no = 1
+    placeholder_entity_map = dict()
+    for pattern in patterns:
+        matches = set(re.findall(pattern, text))
+        for match in matches:
+            if pattern == URL_PATTERN:
+                temp = match.replace(".", '')
+                if len(temp) < 4:
+                    continue
+            if pattern == NUMERAL_PATTERN:
+                temp = match.replace(" ", '').replace(".", '').replace(":", '')
+                if len(temp) < 4:
+                    continue
+            placeholder = "<ID{}>".format(serial_no)
+            alternate_placeholder = "< ID{} >".format(serial_no)
+            placeholder_entity_map[placeholder] = match
+            placeholder_entity_map[alternate_placeholder] = match
+            for i in INDIC_FAILURE_CASES:
+                placeholder_entity_map["<{}{}>".format(i, serial_no)] = match
+                placeholder_entity_map["< {}{} >".format(i, serial_no)] = match
+                placeholder_entity_map["< {} {} >".format(i, serial_no)] = match
+            text = text.replace(match, placeholder)
+            serial_no += 1
+    text = re.sub(r"\s+", " ", text)
+    text = text.replace(">/", ">")
+    return text, placeholder_entity_map
+
+
+def legacy_normalize(text: str) -> Tuple[str, dict]:
+    return legacy_wrap(normalize_indic_numerals(text.strip("\n")), PATTERNS)
+
+
+def legacy_restore(text: str, placeholder_entity_map: dict) -> str:
+    for key in placeholder_entity_map.keys():
+        text = text.replace(key, placeholder_entity_map[key])
+    return text
+
+
+def make_inputs(count: int, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    return [rng.choice(TEMPLATES) for _ in range(count)]
+
+
+def mangle(text: str, rng: random.Random) -> str:
+    """Rewrite some placeholders into the spaced/translated forms seen in model output"""
+    def replace(match):
+        if rng.random() < 0.3:
+            return rng.choice(MANGLED_FORMATS).format(match.group(1))
+        return match.group(0)
+    return re.sub(r"<ID(\d+)>", replace, text)
+
+
+def timed(fn: Callable, items: List) -> Tuple[List, float]:
+    start = time.perf_counter()
+    results = [fn(*item) for item in items]
+    return results, time.perf_counter() - start
+
+
+def run(name: str, extract: Callable, restore: Callable, texts: List[str]) -> Tuple[List[str], Dict]:
+    wrapped, extract_seconds = timed(extract, [(text,) for text in texts])
+    rng = random.Random(11)
+    mangled = [(mangle(sent, rng), entity_map) for sent, entity_map in wrapped]
+    restored, restore_seconds = timed(restore, mangled)
+    keys = sum(len(entity_map) for _, entity_map in wrapped)
+    print(
+        f"{name:<18} extract {extract_seconds * 1000:8.1f}ms  restore {restore_seconds * 1000:8.1f}ms  "
+        f"map keys {keys:8d}"
+    )
+    return restored, {"extract": extract_seconds, "restore": restore_seconds}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark placeholder extraction and restoration")
+    parser.add_argument("--texts", type=int, default=5000)
+    args = parser.parse_args()
+
+    texts = make_inputs(args.texts)
+    print(f"{len(texts)} numeral- and URL-heavy catalog texts\n")
+
+    legacy, legacy_times = run("findall + variants", legacy_normalize, legacy_restore, texts)
+    single, single_times = run("single scan", normalize, restore_placeholders, texts)
+
+    mismatches = sum(a != b for a, b in zip(legacy, single))
+    print(f"\nExtraction speed-up: {legacy_times['extract'] / single_times['extract']:.1f}x")
+    print(f"Restoration speed-up: {legacy_times['restore'] / single_times['restore']:.1f}x")
+    print(f"Round-trip mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Quality/speed comparison of MODEL_PRECISION settings for the Hugging Face IndicTrans2 path
+
+Each precision is loaded in its own subprocess so resident memory numbers are not
+polluted by previously loaded models. Outputs are scored against the fp32 run with
+chrF and exact-match rate.
+
+Usage (from the backend directory):
+    python -m benchmarks.precision_comparison \\
+        --model-path ../models/indictrans2/indictrans2-en-indic-1B \\
+        --src-lang eng_Latn --tgt-lang hin_Deva
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Dict, List
+
+SAMPLE_TEXTS = [
+    "Pure cotton saree with traditional handloom border.",
+    "Wash in cold water. Do not bleach.",
+    "Stainless steel water bottle, 1 litre, keeps drinks cold for 24 hours.",
+    "Men's slim fit denim jeans in dark blue.",
+    "Wireless Bluetooth earphones with noise cancellation and 20 hours of battery life.",
+    "Handmade brass diya for Diwali puja decoration.",
+    "Organic green tea, 100 tea bags per pack.",
+    "Non-stick frying pan with heat resistant handle, suitable for gas and induction.",
+    "Kids' cotton t-shirt, pack of 3, assorted colours.",
+    "Imported.",
+    "This smartphone has a 6.5 inch display, 128 GB storage and a 5000 mAh battery.",
+    "Leather wallet with RFID protection and 8 card slots.",
+]
+
+
+def chrf(hypothesis: str, reference: str, max_order: int = 6, beta: float = 2.0) -> float:
+    """Sentence-level character n-gram F-score (chrF) on whitespace-stripped text"""
+    hyp = hypothesis.replace(" ", "")
+    ref = reference.replace(" ", "")
+    precisions, recalls = [], []
+    for n in range(1, max_order + 1):
+        hyp_ngrams = Counter(hyp[i:i + n] for i in range(len(hyp) - n + 1))
+        ref_ngrams = Counter(ref[i:i + n] for i in range(len(ref) - n + 1))
+        if not hyp_ngrams or not ref_ngrams:
+            continue
+        overlap = sum((hyp_ngrams & ref_ngrams).values())
+        precisions.append(overlap / sum(hyp_ngrams.values()))
+        recalls.append(overlap / sum(ref_ngrams.values()))
+    if not precisions:
+        return 100.0 if hyp == ref else 0.0
+    p = sum(precisions) / len(precisions)
+    r = sum(recalls) / len(recalls)
+    if p + r == 0:
+        return 0.0
+    return 100.0 * (1 + beta ** 2) * p * r / (beta ** 2 * p + r)
+
+
+def run_worker(args) -> Dict:
+    """Load one precision, translate the inputs and report timings"""
+    import torch
+    from model_precision import load_seq2seq_model, resolve_precision, resident_memory_mb
+
+    precision = resolve_precision(args.precision, args.device)
+    tokenizer, model, load_stats = load_seq2seq_model(args.model_path, args.device, precision)
+    texts = load_texts(args.input)
+    input_texts = [f"{args.src_lang} {args.tgt_lang} {text}" for text in texts]
+
+    # Warm-up so one-off kernel initialisation is not measured
+    warmup = tokenizer(input_texts[:1], return_tensors="pt", padding=True).to(args.device)
+    with torch.no_grad():
+        model.generate(**warmup, max_length=32, num_beams=1)
+
+    outputs: List[str] = []
+    latencies: List[float] = []
+    for i in range(0, len(input_texts), args.batch_size):
+        chunk = input_texts[i:i + args.batch_size]
+        inputs = tokenizer(chunk, return_tensors="pt", padding=True, truncation=True, max_length=512)
+        inputs = {k: v.to(args.device) for k, v in inputs.items()}
+        start = time.perf_counter()
+        with torch.no_grad():
+            generated = model.generate(**inputs, max_length=512, num_beams=args.num_beams, do_sample=False)
+        latencies.append(time.perf_counter() - start)
+        outputs.extend(tokenizer.batch_decode(generated, skip_special_tokens=True))
+
+    total = sum(latencies)
+    return {
+        **load_stats,
+        "peak_rss_mb": round(resident_memory_mb(), 1),
+        "total_seconds": round(total, 3),
+        "sentences_per_second": round(len(texts) / total, 2) if total else 0.0,
+        "mean_batch_latency_ms": round(1000 * total / len(latencies), 1) if latencies else 0.0,
+        "outputs": outputs,
+    }
+
+
+def load_texts(path: str) -> List[str]:
+    if not path:
+        return list(SAMPLE_TEXTS)
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def compare(args):
+    """Run every precision in a subprocess and print a comparison table"""
+    results = {}
+    for precision in args.precisions:
+        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
+            output_path = tmp.name
+        command = [
+            sys.executable, "-m", "benchmarks.precision_comparison", "--worker",
+            "--precision", precision, "--output", output_path,
+            "--model-path", args.model_path, "--src-lang", args.src_lang, "--tgt-lang", args.tgt_lang,
+            "--device", args.device, "--batch-size", str(args.batch_size), "--num-beams", str(args.num_beams),
+        ]
+        if args.input:
+            command += ["--input", args.input]
+        print(f"Running {precision}...", flush=True)
+        subprocess.run(command, check=True)
+        with open(output_path, encoding="utf-8") as f:
+            results[precision] = json.load(f)
+        os.remove(output_path)
+
+    reference = results.get("fp32", next(iter(results.values())))["outputs"]
+    header = f"{'precision':<14}{'load s':>8}{'weights MB':>12}{'RSS +MB':>10}{'sent/s':>9}{'chrF':>8}{'exact':>8}"
+    print(header)
+    print("-" * len(header))
+    for precision, result in results.items():
+        scores = [chrf(hyp, ref) for hyp, ref in zip(result["outputs"], reference)]
+        exact = sum(hyp == ref for hyp, ref in zip(result["outputs"], reference)) / len(reference)
+        result["chrf_vs_reference"] = round(sum(scores) / len(scores), 2)
+        result["exact_match_vs_reference"] = round(exact, 3)
+        print(
+            f"{precision:<14}{result['load_seconds']:>8}{result['model_size_mb']:>12}"
+            f"{result['rss_delta_mb']:>10}{result['sentences_per_second']:>9}"
+            f"{result['chrf_vs_reference']:>8}{result['exact_match_vs_reference']:>8}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare MODEL_PRECISION settings for speed and quality")
+    parser.add_argument("--model-path", required=True, help="Hugging Face IndicTrans2 checkpoint directory")
+    parser.add_argument("--src-lang", default="eng_Latn", help="Flores source language code")
+    parser.add_argument("--tgt-lang", default="hin_Deva", help="Flores target language code")
+    parser.add_argument("--precisions", nargs="+", default=["fp32", "bf16", "dynamic-int8"])
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--input", help="Text file with one source sentence per line (default: built-in catalog sample)")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--num-beams", type=int, default=5)
+    parser.add_argument("--output", help="Write full results (including outputs) as JSON")
+    parser.add_argument("--precision", help=argparse.SUPPRESS)
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        result = run_worker(args)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False)
+    else:
+        compare(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Sentence-splitting cost of English preprocessing: one Moses process per paragraph vs pooled splitters
+
+The baseline reproduces the previous engine behaviour (start a MosesSentenceSplitter
+for every paragraph and also run NLTK). The pooled run uses SentenceSplitterPool with
+the short-sentence fast path. Both runs are checked for identical sentence counts.
+
+Usage (from the backend directory):
+    python -m benchmarks.sentence_splitting --paragraphs 2000 --pool-size 2
+"""
+
+import argparse
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+from mosestokenizer import MosesSentenceSplitter
+from nltk.tokenize import sent_tokenize
+
+from indictrans2.engine import SentenceSplitterPool, is_single_sentence, split_sentences
+
+TITLES = [
+    "Pure cotton saree with traditional handloom border",
+    "Men's slim fit denim jeans in dark blue",
+    "Handmade brass diya for Diwali puja decoration",
+    "Organic green tea, 100 tea bags per pack.",
+    "Leather wallet with RFID protection and 8 card slots",
+    "Kids' cotton t-shirt, pack of 3, assorted colours",
+]
+
+DESCRIPTIONS = [
+    "Wash in cold water. Do not bleach. Dry in shade.",
+    "This smartphone has a 6.5 inch display and 128 GB storage. The 5000 mAh battery lasts two days.",
+    "Non-stick frying pan with heat resistant handle. Suitable for gas and induction stoves. Dishwasher safe.",
+    "Wireless earphones with noise cancellation. Up to 20 hours of battery life! Includes a charging case.",
+    "Made by artisans in Jaipur. Each piece is unique, so colours may vary slightly.",
+]
+
+
+def legacy_split(paragraph: str) -> List[str]:
+    """Previous behaviour: one Perl subprocess per paragraph plus NLTK"""
+    with MosesSentenceSplitter("en") as splitter:
+        sents_moses = splitter([paragraph])
+    sents_nltk = sent_tokenize(paragraph)
+    sents = sents_nltk if len(sents_nltk) < len(sents_moses) else sents_moses
+    return [sent.replace("\xad", "") for sent in sents]
+
+
+def make_inputs(count: int, title_share: float, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    return [
+        rng.choice(TITLES) if rng.random() < title_share else rng.choice(DESCRIPTIONS)
+        for _ in range(count)
+    ]
+
+
+def run(name: str, split: Callable[[str], List[str]], paragraphs: List[str], threads: int):
+    start = time.perf_counter()
+    latencies: List[float] = []
+
+    def timed(paragraph: str) -> List[str]:
+        t0 = time.perf_counter()
+        result = split(paragraph)
+        latencies.append((time.perf_counter() - t0) * 1000.0)
+        return result
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(timed, paragraphs))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(
+        f"{name:<22} {elapsed:8.2f}s {len(paragraphs) / elapsed:10.1f} para/s "
+        f"p50 {statistics.median(latencies):7.2f}ms p99 {latencies[int(len(latencies) * 0.99) - 1]:7.2f}ms"
+    )
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark English sentence splitting in preprocessing")
+    parser.add_argument("--paragraphs", type=int, default=2000)
+    parser.add_argument("--title-share", type=float, default=0.6,
+                        help="Fraction of inputs that are short single-sentence titles")
+    parser.add_argument("--pool-size", type=int, default=1)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+
+    paragraphs = make_inputs(args.paragraphs, args.title_share)
+    fast_path = sum(is_single_sentence(paragraph) for paragraph in paragraphs)
+    print(f"{len(paragraphs)} paragraphs, {fast_path} eligible for the single-sentence fast path\n")
+
+    legacy, legacy_seconds = run("process per paragraph", legacy_split, paragraphs, args.threads)
+
+    pool = SentenceSplitterPool("en", size=args.pool_size)
+    try:
+        pooled, pooled_seconds = run(
+            "pooled + fast path", lambda paragraph: split_sentences(paragraph, "eng_Latn", pool),
+            paragraphs, args.threads
+        )
+    finally:
+        pool.close()
+
+    mismatches = sum(len(a) != len(b) for a, b in zip(legacy, pooled))
+    print(f"\nSpeed-up: {legacy_seconds / pooled_seconds:.1f}x")
+    print(f"Splitter processes started: {pool.stats['processes_started']} (legacy: {len(paragraphs)})")
+    print(f"Sentence-count mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
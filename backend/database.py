@@ -3,19 +3,67 @@ Database manager for storing translations and corrections
 Uses SQLite for simplicity
 """
 
+import base64
+import json
 import sqlite3
 import logging
-from datetime import datetime
-from typing import List, Dict, Optional, Any
+import threading
+import unicodedata
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, List, Dict, Optional, Any, Tuple
 import os
 
+from partitions import HistoryPartitions
+
 logger = logging.getLogger(__name__)
 
+# Full-text index over translation history. Combining marks (M*) count as token
+# characters so Indic words are not split at vowel signs and viramas.
+SEARCH_INDEX_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS {alias}.translations_fts USING fts5(
+        original_text,
+        translated_text,
+        content='translations',
+        content_rowid='id',
+        tokenize="unicode61 remove_diacritics 2 categories 'L* N* Co M*'"
+    )
+"""
+
+SEARCH_FIELDS = {
+    "original": "{original_text}",
+    "translated": "{translated_text}",
+    "both": "{original_text translated_text}",
+}
+
 class DatabaseManager:
     """Manages SQLite database for translation storage"""
     
     def __init__(self, db_path: str = "../data/translations.db"):
         self.db_path = db_path
+        
+        # Connection tuning
+        self.journal_mode = os.getenv("DB_JOURNAL_MODE", "WAL")
+        self.synchronous = os.getenv("DB_SYNCHRONOUS", "NORMAL")
+        self.busy_timeout_ms = int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000"))
+        self.cache_size_kb = int(os.getenv("DB_CACHE_SIZE_KB", "16384"))
+        self.mmap_size = int(os.getenv("DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+        
+        # One long-lived connection per thread; all of them are tracked for close()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        
+        # Monthly history partitions (separate files next to the main database)
+        self.partitions = HistoryPartitions(
+            partition_dir=os.getenv(
+                "PARTITION_DIR",
+                os.path.join(os.path.dirname(os.path.abspath(db_path)), "partitions")
+            ),
+            hot_months=int(os.getenv("PARTITION_HOT_MONTHS", "2")),
+            chunk_size=int(os.getenv("PARTITION_CHUNK_SIZE", "5000")),
+            search_index_sql=SEARCH_INDEX_SQL
+        )
+        
         self.ensure_db_directory()
     
     def ensure_db_directory(self):
@@ -23,11 +71,62 @@ class DatabaseManager:
         os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
     
     def get_connection(self) -> sqlite3.Connection:
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
+        """
+        Get the calling thread's database connection
+        
+        The connection is opened and configured on first use and then reused by
+        every later call from the same thread. Using it as a context manager
+        commits or rolls back the current transaction but keeps it open.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection with the configured pragmas"""
+        # Each connection is only used by its own thread; close() may run elsewhere
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000.0,
+            check_same_thread=False
+        )
         conn.row_factory = sqlite3.Row  # Enable column access by name
+        
+        # WAL lets readers proceed while a writer commits; NORMAL sync is safe in WAL mode
+        conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms}")
+        conn.execute(f"PRAGMA cache_size=-{self.cache_size_kb}")
+        conn.execute(f"PRAGMA mmap_size={self.mmap_size}")
+        conn.execute("PRAGMA temp_store=MEMORY")
         return conn
     
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """Return the number of open connections and the active pragmas"""
+        return {
+            "open_connections": len(self._connections),
+            "journal_mode": self.journal_mode,
+            "synchronous": self.synchronous,
+            "busy_timeout_ms": self.busy_timeout_ms,
+            "cache_size_kb": self.cache_size_kb,
+            "mmap_size": self.mmap_size,
+        }
+    
+    def close(self):
+        """Close every pooled connection"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            # Threads still holding a closed connection reconnect on next use
+            self._local = threading.local()
+        
+        for conn in connections:
+            conn.close()
+        logger.info(f"Closed {len(connections)} database connections")
+    
     def initialize_database(self):
         """Initialize database tables"""
         try:
@@ -59,21 +158,40 @@ class DatabaseManager:
                 """)
                 
                 # Create indexes for better performance
+                # History pages are ordered by (created_at, id); id is the rowid, so
+                # both indexes carry the full sort key and support keyset seeks
                 conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_translations_languages 
-                    ON translations (source_language, target_language)
+                    CREATE INDEX IF NOT EXISTS idx_translations_created 
+                    ON translations (created_at)
                 """)
                 
+                # Language-pair filtered history; also serves the pair statistics
                 conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_translations_created 
-                    ON translations (created_at)
+                    CREATE INDEX IF NOT EXISTS idx_translations_pair_created 
+                    ON translations (source_language, target_language, created_at)
                 """)
+                conn.execute("DROP INDEX IF EXISTS idx_translations_languages")
                 
                 conn.execute("""
                     CREATE INDEX IF NOT EXISTS idx_corrections_translation 
                     ON corrections (translation_id)
                 """)
                 
+                # Create persistent tier of the translation cache
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS translation_cache (
+                        cache_key TEXT PRIMARY KEY,
+                        translated_text TEXT NOT NULL,
+                        source_language TEXT NOT NULL,
+                        target_language TEXT NOT NULL,
+                        created_at REAL NOT NULL
+                    )
+                """)
+                
+                self._create_statistics_tables(conn)
+                self._create_search_index(conn)
+                self.partitions.create_catalog(conn)
+                
                 conn.commit()
                 logger.info("Database initialized successfully")
                 
@@ -81,6 +199,206 @@ class DatabaseManager:
             logger.error(f"Database initialization error: {str(e)}")
             raise
     
+    def _create_statistics_tables(self, conn: sqlite3.Connection):
+        """
+        Create the materialized statistics tables and the triggers that maintain them
+        
+        Counters are updated by triggers on every insert/delete, so reading
+        statistics never scans the translations or corrections tables.
+        """
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS stats_totals (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                translation_count INTEGER NOT NULL DEFAULT 0,
+                correction_count INTEGER NOT NULL DEFAULT 0,
+                confidence_sum REAL NOT NULL DEFAULT 0.0
+            )
+        """)
+        
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS stats_language_pairs (
+                source_language TEXT NOT NULL,
+                target_language TEXT NOT NULL,
+                translation_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (source_language, target_language)
+            ) WITHOUT ROWID
+        """)
+        
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS stats_daily (
+                day TEXT PRIMARY KEY,
+                translation_count INTEGER NOT NULL DEFAULT 0,
+                correction_count INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+        """)
+        
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_stats_translation_insert
+            AFTER INSERT ON translations
+            BEGIN
+                UPDATE stats_totals
+                SET translation_count = translation_count + 1,
+                    confidence_sum = confidence_sum + COALESCE(NEW.model_confidence, 0.0)
+                WHERE id = 1;
+                
+                INSERT INTO stats_language_pairs (source_language, target_language, translation_count)
+                VALUES (NEW.source_language, NEW.target_language, 1)
+                ON CONFLICT (source_language, target_language)
+                DO UPDATE SET translation_count = translation_count + 1;
+                
+                INSERT INTO stats_daily (day, translation_count)
+                VALUES (date(NEW.created_at), 1)
+                ON CONFLICT (day) DO UPDATE SET translation_count = translation_count + 1;
+            END
+        """)
+        
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_stats_translation_delete
+            AFTER DELETE ON translations
+            BEGIN
+                UPDATE stats_totals
+                SET translation_count = translation_count - 1,
+                    confidence_sum = confidence_sum - COALESCE(OLD.model_confidence, 0.0)
+                WHERE id = 1;
+                
+                UPDATE stats_language_pairs
+                SET translation_count = translation_count - 1
+                WHERE source_language = OLD.source_language AND target_language = OLD.target_language;
+                
+                DELETE FROM stats_language_pairs
+                WHERE source_language = OLD.source_language AND target_language = OLD.target_language
+                  AND translation_count <= 0;
+                
+                UPDATE stats_daily
+                SET translation_count = translation_count - 1
+                WHERE day = date(OLD.created_at);
+                
+                DELETE FROM stats_daily
+                WHERE day = date(OLD.created_at) AND translation_count <= 0 AND correction_count <= 0;
+            END
+        """)
+        
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_stats_correction_insert
+            AFTER INSERT ON corrections
+            BEGIN
+                UPDATE stats_totals SET correction_count = correction_count + 1 WHERE id = 1;
+                
+                INSERT INTO stats_daily (day, correction_count)
+                VALUES (date(NEW.created_at), 1)
+                ON CONFLICT (day) DO UPDATE SET correction_count = correction_count + 1;
+            END
+        """)
+        
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_stats_correction_delete
+            AFTER DELETE ON corrections
+            BEGIN
+                UPDATE stats_totals SET correction_count = correction_count - 1 WHERE id = 1;
+                
+                UPDATE stats_daily
+                SET correction_count = correction_count - 1
+                WHERE day = date(OLD.created_at);
+                
+                DELETE FROM stats_daily
+                WHERE day = date(OLD.created_at) AND translation_count <= 0 AND correction_count <= 0;
+            END
+        """)
+        
+        # Databases created before the statistics tables existed need a one-time backfill
+        if conn.execute("SELECT 1 FROM stats_totals WHERE id = 1").fetchone() is None:
+            self._rebuild_statistics(conn)
+    
+    def _rebuild_statistics(self, conn: sqlite3.Connection):
+        """Recompute every statistics table from the base tables"""
+        conn.execute("DELETE FROM stats_totals")
+        conn.execute("DELETE FROM stats_language_pairs")
+        conn.execute("DELETE FROM stats_daily")
+        
+        conn.execute("""
+            INSERT INTO stats_totals (id, translation_count, correction_count, confidence_sum)
+            SELECT
+                1,
+                (SELECT COUNT(*) FROM translations),
+                (SELECT COUNT(*) FROM corrections),
+                (SELECT COALESCE(SUM(model_confidence), 0.0) FROM translations)
+        """)
+        
+        conn.execute("""
+            INSERT INTO stats_language_pairs (source_language, target_language, translation_count)
+            SELECT source_language, target_language, COUNT(*)
+            FROM translations
+            GROUP BY source_language, target_language
+        """)
+        
+        conn.execute("""
+            INSERT INTO stats_daily (day, translation_count, correction_count)
+            SELECT day, SUM(translation_count), SUM(correction_count)
+            FROM (
+                SELECT date(created_at) AS day, COUNT(*) AS translation_count, 0 AS correction_count
+                FROM translations GROUP BY day
+                UNION ALL
+                SELECT date(created_at) AS day, 0, COUNT(*)
+                FROM corrections GROUP BY day
+            )
+            GROUP BY day
+        """)
+        logger.info("Statistics tables rebuilt from translation history")
+    
+    def rebuild_statistics(self):
+        """Recompute the materialized statistics, e.g. after manual edits to the database"""
+        try:
+            with self.get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                self._rebuild_statistics(conn)
+                conn.commit()
+                
+        except Exception as e:
+            logger.error(f"Error rebuilding statistics: {str(e)}")
+            raise
+    
+    def _create_search_index(self, conn: sqlite3.Connection):
+        """Create the FTS5 index over translations and the triggers that keep it in sync"""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'translations_fts'"
+        ).fetchone()
+        
+        conn.execute(SEARCH_INDEX_SQL.format(alias="main"))
+        
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_fts_translation_insert
+            AFTER INSERT ON translations
+            BEGIN
+                INSERT INTO translations_fts (rowid, original_text, translated_text)
+                VALUES (NEW.id, NEW.original_text, NEW.translated_text);
+            END
+        """)
+        
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_fts_translation_delete
+            AFTER DELETE ON translations
+            BEGIN
+                INSERT INTO translations_fts (translations_fts, rowid, original_text, translated_text)
+                VALUES ('delete', OLD.id, OLD.original_text, OLD.translated_text);
+            END
+        """)
+        
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_fts_translation_update
+            AFTER UPDATE OF original_text, translated_text ON translations
+            BEGIN
+                INSERT INTO translations_fts (translations_fts, rowid, original_text, translated_text)
+                VALUES ('delete', OLD.id, OLD.original_text, OLD.translated_text);
+                INSERT INTO translations_fts (rowid, original_text, translated_text)
+                VALUES (NEW.id, NEW.original_text, NEW.translated_text);
+            END
+        """)
+        
+        # Index rows that existed before the search index was added
+        if exists is None:
+            conn.execute("INSERT INTO translations_fts (translations_fts) VALUES ('rebuild')")
+            logger.info("Full-text search index built from translation history")
+    
     def store_translation(
         self,
         original_text: str,
@@ -120,6 +438,124 @@ class DatabaseManager:
             logger.error(f"Error storing translation: {str(e)}")
             raise
     
+    def store_translations_bulk(self, records: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Store many translations with one executemany in a single transaction
+        
+        Args:
+            records: Dictionaries with original_text, translated_text, source_language,
+                target_language and optional model_confidence
+            
+        Returns:
+            Tuple of (first_id, last_id); the rows received consecutive IDs in record order
+        """
+        if not records:
+            return 0, -1
+        
+        try:
+            with self.get_connection() as conn:
+                # Hold the write lock for the whole insert so the IDs stay contiguous
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany("""
+                    INSERT INTO translations 
+                    (original_text, translated_text, source_language, target_language, model_confidence)
+                    VALUES (?, ?, ?, ?, ?)
+                """, [
+                    (
+                        record["original_text"],
+                        record["translated_text"],
+                        record["source_language"],
+                        record["target_language"],
+                        record.get("model_confidence", 0.0)
+                    )
+                    for record in records
+                ])
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                conn.commit()
+                
+                first_id = last_id - len(records) + 1
+                logger.info(f"Stored {len(records)} translations with IDs {first_id}-{last_id}")
+                return first_id, last_id
+                
+        except Exception as e:
+            logger.error(f"Error storing translations: {str(e)}")
+            raise
+    
+    def reserve_translation_ids(self, count: int) -> int:
+        """
+        Reserve a block of translation IDs for rows that will be inserted later
+        
+        Advances the AUTOINCREMENT sequence past the block, so rows inserted
+        without an explicit ID never collide with reserved ones.
+        
+        Args:
+            count: Number of IDs to reserve
+            
+        Returns:
+            First ID of the block (the block is first_id .. first_id + count - 1)
+        """
+        try:
+            with self.get_connection() as conn:
+                # Take the write lock before reading the sequence
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute("""
+                    SELECT MAX(
+                        COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'translations'), 0),
+                        COALESCE((SELECT MAX(id) FROM translations), 0)
+                    )
+                """).fetchone()
+                first_id = row[0] + 1
+                last_id = first_id + count - 1
+                
+                cursor = conn.execute(
+                    "UPDATE sqlite_sequence SET seq = ? WHERE name = 'translations'", (last_id,)
+                )
+                if cursor.rowcount == 0:
+                    conn.execute(
+                        "INSERT INTO sqlite_sequence (name, seq) VALUES ('translations', ?)", (last_id,)
+                    )
+                
+                conn.commit()
+                return first_id
+                
+        except Exception as e:
+            logger.error(f"Error reserving translation IDs: {str(e)}")
+            raise
+    
+    def insert_translations_with_ids(self, records: List[Dict[str, Any]]):
+        """
+        Insert translations with pre-assigned IDs in a single transaction
+        
+        Args:
+            records: Dictionaries with id, original_text, translated_text, source_language,
+                target_language, model_confidence and created_at
+        """
+        try:
+            with self.get_connection() as conn:
+                conn.executemany("""
+                    INSERT INTO translations 
+                    (id, original_text, translated_text, source_language, target_language,
+                     model_confidence, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, [
+                    (
+                        record["id"],
+                        record["original_text"],
+                        record["translated_text"],
+                        record["source_language"],
+                        record["target_language"],
+                        record.get("model_confidence", 0.0),
+                        record["created_at"],
+                        record["created_at"]
+                    )
+                    for record in records
+                ])
+                conn.commit()
+                
+        except Exception as e:
+            logger.error(f"Error inserting translations: {str(e)}")
+            raise
+    
     def store_correction(
         self,
         translation_id: int,
@@ -154,82 +590,377 @@ class DatabaseManager:
             logger.error(f"Error storing correction: {str(e)}")
             raise
     
+    def get_cached_translations(self, cache_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several persisted translation cache entries in one read
+        
+        Args:
+            cache_keys: Content-addressed cache keys
+            
+        Returns:
+            Mapping of each found key to a dictionary with translated_text and created_at
+        """
+        found = {}
+        try:
+            with self.get_connection() as conn:
+                # Stay below SQLite's bound-parameter limit
+                for start in range(0, len(cache_keys), 500):
+                    chunk = cache_keys[start:start + 500]
+                    placeholders = ",".join("?" for _ in chunk)
+                    cursor = conn.execute(f"""
+                        SELECT cache_key, translated_text, created_at
+                        FROM translation_cache
+                        WHERE cache_key IN ({placeholders})
+                    """, chunk)
+                    for row in cursor.fetchall():
+                        found[row["cache_key"]] = {
+                            "translated_text": row["translated_text"],
+                            "created_at": row["created_at"]
+                        }
+                
+                return found
+                
+        except Exception as e:
+            logger.error(f"Error reading translation cache: {str(e)}")
+            raise
+    
+    def store_cached_translations(self, entries: List[Tuple[str, str, str, str, float]]):
+        """
+        Insert or replace several persisted translation cache entries in one transaction
+        
+        Args:
+            entries: (cache_key, translated_text, source_language, target_language, created_at) tuples
+        """
+        if not entries:
+            return
+        try:
+            with self.get_connection() as conn:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO translation_cache
+                    (cache_key, translated_text, source_language, target_language, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """, entries)
+                conn.commit()
+                
+        except Exception as e:
+            logger.error(f"Error writing translation cache: {str(e)}")
+            raise
+    
+    def delete_cached_translations(self, cache_keys: List[str]):
+        """
+        Delete several persisted translation cache entries in one transaction
+        
+        Args:
+            cache_keys: Content-addressed cache keys
+        """
+        if not cache_keys:
+            return
+        try:
+            with self.get_connection() as conn:
+                conn.executemany(
+                    "DELETE FROM translation_cache WHERE cache_key = ?",
+                    [(cache_key,) for cache_key in cache_keys]
+                )
+                conn.commit()
+                
+        except Exception as e:
+            logger.error(f"Error deleting translation cache entries: {str(e)}")
+            raise
+    
+    def get_frequent_translations(self, limit: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Get the most frequently translated (text, language pair) combinations
+        
+        Args:
+            limit: Maximum number of combinations to return
+            
+        Returns:
+            List of records with original_text, source_language, target_language and count,
+            most frequent first
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.execute("""
+                    SELECT original_text, source_language, target_language, COUNT(*) as count
+                    FROM translations
+                    GROUP BY original_text, source_language, target_language
+                    ORDER BY count DESC
+                    LIMIT ?
+                """, (limit,))
+                
+                return [
+                    {
+                        "original_text": row["original_text"],
+                        "source_language": row["source_language"],
+                        "target_language": row["target_language"],
+                        "count": row["count"]
+                    }
+                    for row in cursor.fetchall()
+                ]
+                
+        except Exception as e:
+            logger.error(f"Error retrieving frequent translations: {str(e)}")
+            raise
+    
+    def iter_translation_memory(
+        self,
+        batch_size: int = 5000,
+        limit: Optional[int] = None,
+        max_confidence: Optional[float] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream translations with their latest correction, newest first
+        
+        Walks the hot table by ID in keyset batches so loading a large translation
+        memory never holds one long read transaction.
+        
+        Args:
+            batch_size: Rows fetched per query
+            limit: Maximum number of rows to yield (None for all)
+            max_confidence: Skip uncorrected rows whose model_confidence is at or above
+                this (rows that were themselves served from the translation memory)
+        
+        Returns:
+            Iterator of records with id, original_text, translated_text, source_language,
+            target_language and corrected_text
+        """
+        last_id = None
+        remaining = limit
+        try:
+            while remaining is None or remaining > 0:
+                size = batch_size if remaining is None else min(batch_size, remaining)
+                with self.get_connection() as conn:
+                    rows = conn.execute("""
+                        SELECT
+                            t.id,
+                            t.original_text,
+                            t.translated_text,
+                            t.source_language,
+                            t.target_language,
+                            c.corrected_text
+                        FROM translations t
+                        LEFT JOIN corrections c ON c.id = (
+                            SELECT MAX(id) FROM corrections WHERE translation_id = t.id
+                        )
+                        WHERE (? IS NULL OR t.id < ?)
+                          AND (? IS NULL OR t.model_confidence < ? OR c.corrected_text IS NOT NULL)
+                        ORDER BY t.id DESC
+                        LIMIT ?
+                    """, (last_id, last_id, max_confidence, max_confidence, size)).fetchall()
+        
+                if not rows:
+                    return
+                for row in rows:
+                    yield dict(row)
+                last_id = rows[-1]["id"]
+                if remaining is not None:
+                    remaining -= len(rows)
+        
+        except Exception as e:
+            logger.error(f"Error reading translation memory rows: {str(e)}")
+            raise
+
+    @staticmethod
+    def encode_history_cursor(record: Dict[str, Any]) -> str:
+        """
+        Build an opaque pagination cursor pointing just after a history record
+        
+        Args:
+            record: History record with created_at and id
+            
+        Returns:
+            URL-safe cursor string
+        """
+        payload = json.dumps([str(record["created_at"]), record["id"]])
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+    
+    @staticmethod
+    def decode_history_cursor(cursor: str) -> Tuple[str, int]:
+        """
+        Decode a cursor from encode_history_cursor
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        try:
+            created_at, translation_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            return str(created_at), int(translation_id)
+        except Exception as e:
+            raise ValueError(f"Invalid history cursor: {cursor}") from e
+    
+    @staticmethod
+    def _history_filters(
+        source_language: Optional[str],
+        target_language: Optional[str],
+        cursor_key: Optional[Tuple[str, int]]
+    ) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause shared by history queries"""
+        where_conditions = []
+        params: List[Any] = []
+        
+        if source_language:
+            where_conditions.append("t.source_language = ?")
+            params.append(source_language)
+        
+        if target_language:
+            where_conditions.append("t.target_language = ?")
+            params.append(target_language)
+        
+        if cursor_key:
+            where_conditions.append("(t.created_at, t.id) < (?, ?)")
+            params.extend(cursor_key)
+        
+        where_clause = ""
+        if where_conditions:
+            where_clause = "WHERE " + " AND ".join(where_conditions)
+        return where_clause, params
+    
+    def _query_history(
+        self,
+        conn: sqlite3.Connection,
+        limit: int,
+        offset: int,
+        source_language: Optional[str],
+        target_language: Optional[str],
+        cursor_key: Optional[Tuple[str, int]]
+    ) -> List[Dict[str, Any]]:
+        """Run one history page query against the main database or a partition file"""
+        where_clause, params = self._history_filters(source_language, target_language, cursor_key)
+        
+        # Page the translations first, then attach only the latest correction
+        query = f"""
+            SELECT 
+                t.id,
+                t.original_text,
+                t.translated_text,
+                t.source_language,
+                t.target_language,
+                t.model_confidence,
+                t.created_at,
+                c.corrected_text,
+                c.feedback as correction_feedback
+            FROM (
+                SELECT t.id
+                FROM translations t
+                {where_clause}
+                ORDER BY t.created_at DESC, t.id DESC
+                LIMIT ? OFFSET ?
+            ) page
+            JOIN translations t ON t.id = page.id
+            LEFT JOIN corrections c ON c.id = (
+                SELECT MAX(id) FROM corrections WHERE translation_id = t.id
+            )
+            ORDER BY t.created_at DESC, t.id DESC
+        """
+        
+        params.extend([limit, offset])
+        return [self._history_record(row) for row in conn.execute(query, params).fetchall()]
+    
+    @staticmethod
+    def _history_record(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "original_text": row["original_text"],
+            "translated_text": row["translated_text"],
+            "source_language": row["source_language"],
+            "target_language": row["target_language"],
+            "model_confidence": row["model_confidence"],
+            "created_at": row["created_at"],
+            "corrected_text": row["corrected_text"],
+            "correction_feedback": row["correction_feedback"]
+        }
+    
+    def _apply_recent_corrections(self, conn: sqlite3.Connection, records: List[Dict[str, Any]]):
+        """Overlay corrections submitted to the main database after a partition was rolled over"""
+        if not records:
+            return
+        placeholders = ",".join("?" for _ in records)
+        rows = conn.execute(f"""
+            SELECT translation_id, corrected_text, feedback, created_at
+            FROM corrections
+            WHERE id IN (
+                SELECT MAX(id) FROM corrections
+                WHERE translation_id IN ({placeholders})
+                GROUP BY translation_id
+            )
+        """, [record["id"] for record in records]).fetchall()
+        latest = {row["translation_id"]: row for row in rows}
+        for record in records:
+            row = latest.get(record["id"])
+            if row is not None:
+                record["corrected_text"] = row["corrected_text"]
+                record["correction_feedback"] = row["feedback"]
+                if "corrected_at" in record:
+                    record["corrected_at"] = row["created_at"]
+    
     def get_translation_history(
         self,
         limit: int = 50,
         offset: int = 0,
         source_language: Optional[str] = None,
-        target_language: Optional[str] = None
+        target_language: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
-        Get translation history
+        Get translation history, newest first
+        
+        Pages are located with a keyset seek on (created_at, id) when a cursor is
+        given, so deep pages cost the same as the first one. Each translation
+        appears once, with its latest correction if any. Pages that run past the
+        hot table continue into attached monthly partitions, newest month first.
         
         Args:
             limit: Maximum number of records to return
-            offset: Number of records to skip
+            offset: Number of records to skip (ignored when a cursor is given)
             source_language: Filter by source language
             target_language: Filter by target language
+            cursor: Cursor from encode_history_cursor for the previous page's last record
             
         Returns:
             List of translation history records
         """
+        cursor_key = self.decode_history_cursor(cursor) if cursor else None
+        if cursor_key:
+            offset = 0
+        
         try:
             with self.get_connection() as conn:
-                # Build query with optional filters
-                where_conditions = []
-                params = []
-                
-                if source_language:
-                    where_conditions.append("t.source_language = ?")
-                    params.append(source_language)
-                
-                if target_language:
-                    where_conditions.append("t.target_language = ?")
-                    params.append(target_language)
-                
-                where_clause = ""
-                if where_conditions:
-                    where_clause = "WHERE " + " AND ".join(where_conditions)
-                
-                query = f"""
-                    SELECT 
-                        t.id,
-                        t.original_text,
-                        t.translated_text,
-                        t.source_language,
-                        t.target_language,
-                        t.model_confidence,
-                        t.created_at,
-                        c.corrected_text,
-                        c.feedback as correction_feedback
-                    FROM translations t
-                    LEFT JOIN corrections c ON t.id = c.translation_id
-                    {where_clause}
-                    ORDER BY t.created_at DESC
-                    LIMIT ? OFFSET ?
-                """
+                if not self.partitions.has_attached(conn):
+                    return self._query_history(
+                        conn, limit, offset, source_language, target_language, cursor_key
+                    )
                 
-                params.extend([limit, offset])
+                # Late rows for already rolled-over months can still sit in the hot table,
+                # so take the top of every source and merge them
+                window = limit + offset
+                hot_rows = self._query_history(
+                    conn, window, 0, source_language, target_language, cursor_key
+                )
                 
-                cursor = conn.execute(query, params)
-                rows = cursor.fetchall()
+                partition_rows: List[Dict[str, Any]] = []
+                for partition in self.partitions.list(conn, state="attached"):
+                    if len(partition_rows) >= window:
+                        break
+                    if not partition["row_count"]:
+                        continue
+                    if len(hot_rows) >= window and str(hot_rows[-1]["created_at"]) > partition["last_created_at"]:
+                        break
+                    if cursor_key and partition["first_created_at"] > cursor_key[0]:
+                        continue
+                    with self.partitions.open(partition) as part_conn:
+                        page = self._query_history(
+                            part_conn, window - len(partition_rows), 0,
+                            source_language, target_language, cursor_key
+                        )
+                    self._apply_recent_corrections(conn, page)
+                    partition_rows.extend(page)
                 
-                # Convert to dictionaries
-                results = []
-                for row in rows:
-                    results.append({
-                        "id": row["id"],
-                        "original_text": row["original_text"],
-                        "translated_text": row["translated_text"],
-                        "source_language": row["source_language"],
-                        "target_language": row["target_language"],
-                        "model_confidence": row["model_confidence"],
-                        "created_at": row["created_at"],
-                        "corrected_text": row["corrected_text"],
-                        "correction_feedback": row["correction_feedback"]
-                    })
-                
-                return results
+                merged = sorted(
+                    hot_rows + partition_rows,
+                    key=lambda record: (str(record["created_at"]), record["id"]),
+                    reverse=True
+                )
+                return merged[offset:offset + limit]
                 
         except Exception as e:
             logger.error(f"Error retrieving translation history: {str(e)}")
@@ -245,38 +976,41 @@ class DatabaseManager:
         Returns:
             Translation record or None if not found
         """
+        query = """
+            SELECT 
+                t.id,
+                t.original_text,
+                t.translated_text,
+                t.source_language,
+                t.target_language,
+                t.model_confidence,
+                t.created_at,
+                c.corrected_text,
+                c.feedback as correction_feedback
+            FROM translations t
+            LEFT JOIN corrections c ON c.id = (
+                SELECT MAX(id) FROM corrections WHERE translation_id = t.id
+            )
+            WHERE t.id = ?
+        """
         try:
             with self.get_connection() as conn:
-                cursor = conn.execute("""
-                    SELECT 
-                        t.id,
-                        t.original_text,
-                        t.translated_text,
-                        t.source_language,
-                        t.target_language,
-                        t.model_confidence,
-                        t.created_at,
-                        c.corrected_text,
-                        c.feedback as correction_feedback
-                    FROM translations t
-                    LEFT JOIN corrections c ON t.id = c.translation_id
-                    WHERE t.id = ?
-                """, (translation_id,))
-                
-                row = cursor.fetchone()
+                row = conn.execute(query, (translation_id,)).fetchone()
                 
                 if row:
-                    return {
-                        "id": row["id"],
-                        "original_text": row["original_text"],
-                        "translated_text": row["translated_text"],
-                        "source_language": row["source_language"],
-                        "target_language": row["target_language"],
-                        "model_confidence": row["model_confidence"],
-                        "created_at": row["created_at"],
-                        "corrected_text": row["corrected_text"],
-                        "correction_feedback": row["correction_feedback"]
-                    }
+                    return self._history_record(row)
+                
+                # Rolled-over translations live in a partition covering their ID; bounds of
+                # different months overlap (write-behind ID blocks), so check each candidate
+                for partition in self.partitions.list(conn, state="attached"):
+                    if partition["min_id"] is None or not partition["min_id"] <= translation_id <= partition["max_id"]:
+                        continue
+                    with self.partitions.open(partition) as part_conn:
+                        row = part_conn.execute(query, (translation_id,)).fetchone()
+                        record = self._history_record(row) if row else None
+                    if record:
+                        self._apply_recent_corrections(conn, [record])
+                        return record
                 
                 return None
                 
@@ -284,6 +1018,119 @@ class DatabaseManager:
             logger.error(f"Error retrieving translation {translation_id}: {str(e)}")
             raise
     
+    @staticmethod
+    def _search_expression(query: str, field: str, prefix: bool) -> str:
+        """
+        Turn free text into an FTS5 expression: every word must match, in the chosen columns
+        
+        Words are quoted so user input never hits FTS5 query syntax.
+        """
+        if field not in SEARCH_FIELDS:
+            raise ValueError(f"Unknown search field: {field}")
+        terms = ['"' + term.replace('"', '""') + '"' for term in unicodedata.normalize("NFC", query).split()]
+        if not terms:
+            raise ValueError("Search query is empty")
+        if prefix:
+            terms[-1] += "*"
+        return f"{SEARCH_FIELDS[field]} : ({' '.join(terms)})"
+    
+    def _query_search(
+        self,
+        conn: sqlite3.Connection,
+        expression: str,
+        source_language: Optional[str],
+        target_language: Optional[str],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """Run one ranked search against the main database or a partition file"""
+        where_conditions = ["translations_fts MATCH ?"]
+        params: List[Any] = [expression]
+        
+        if source_language:
+            where_conditions.append("t.source_language = ?")
+            params.append(source_language)
+        
+        if target_language:
+            where_conditions.append("t.target_language = ?")
+            params.append(target_language)
+        
+        params.append(limit)
+        rows = conn.execute(f"""
+            SELECT 
+                t.id,
+                t.original_text,
+                t.translated_text,
+                t.source_language,
+                t.target_language,
+                t.model_confidence,
+                t.created_at,
+                c.corrected_text,
+                c.feedback as correction_feedback,
+                bm25(translations_fts) AS score,
+                snippet(translations_fts, -1, '[', ']', '…', 16) AS snippet
+            FROM translations_fts
+            JOIN translations t ON t.id = translations_fts.rowid
+            LEFT JOIN corrections c ON c.id = (
+                SELECT MAX(id) FROM corrections WHERE translation_id = t.id
+            )
+            WHERE {" AND ".join(where_conditions)}
+            ORDER BY score
+            LIMIT ?
+        """, params).fetchall()
+        
+        # bm25() is lower for better matches; report higher-is-better
+        return [
+            {**self._history_record(row), "score": -row["score"], "snippet": row["snippet"]}
+            for row in rows
+        ]
+    
+    def search_translations(
+        self,
+        query: str,
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None,
+        field: str = "both",
+        prefix: bool = False,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Full-text search over translation history, best matches first
+        
+        Args:
+            query: Words to look for; all of them must match
+            source_language: Filter by source language
+            target_language: Filter by target language
+            field: Columns to search: original, translated or both
+            prefix: Treat the last word as a prefix (for search-as-you-type)
+            limit: Maximum number of results
+            
+        Returns:
+            Translation records with a relevance score and a highlighted snippet
+            
+        Raises:
+            ValueError: If the query is empty or the field is unknown
+        """
+        expression = self._search_expression(query, field, prefix)
+        
+        try:
+            with self.get_connection() as conn:
+                results = self._query_search(conn, expression, source_language, target_language, limit)
+                
+                for partition in self.partitions.list(conn, state="attached"):
+                    with self.partitions.open(partition) as part_conn:
+                        if not self.partitions.has_search_index(part_conn):
+                            continue
+                        page = self._query_search(part_conn, expression, source_language, target_language, limit)
+                    self._apply_recent_corrections(conn, page)
+                    results.extend(page)
+                
+                results.sort(key=lambda record: record["score"], reverse=True)
+                return results[:limit]
+                
+        except Exception as e:
+            logger.error(f"Error searching translations: {str(e)}")
+            raise
+    
     def get_corrections_for_training(self, limit: int = 1000) -> List[Dict[str, Any]]:
         """
         Get corrections that can be used for model fine-tuning
@@ -328,51 +1175,213 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Error retrieving corrections for training: {str(e)}")
             raise
+
+    def iter_export(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None,
+        corrected_only: bool = False,
+        batch_size: int = 5000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream translation + correction pairs, oldest first
+        
+        Rows are read in keyset batches on (created_at, id), one short read per
+        batch, so memory stays constant and writers are never blocked for the
+        length of the export. Attached monthly partitions in the range are read
+        first, then the hot table.
+        
+        Args:
+            start_date: First day to include (YYYY-MM-DD), None for no lower bound
+            end_date: Last day to include (YYYY-MM-DD), None for no upper bound
+            source_language: Filter by source language
+            target_language: Filter by target language
+            corrected_only: Only translations that have a correction
+            batch_size: Rows fetched per query
+        
+        Returns:
+            Iterator of export records with the translation, its latest correction
+            (corrected_text, correction_feedback, corrected_at) and created_at
+        """
+        try:
+            with self.get_connection() as conn:
+                partitions = [
+                    partition for partition in reversed(self.partitions.list(conn, state="attached"))
+                    if partition["row_count"]
+                    and not (start_date and partition["last_created_at"] < start_date)
+                    and not (end_date and partition["first_created_at"][:10] > end_date)
+                ]
+        
+            for partition in partitions:
+                for batch in self._export_batches(
+                    start_date, end_date, source_language, target_language, corrected_only,
+                    batch_size, partition
+                ):
+                    yield from batch
+        
+            for batch in self._export_batches(
+                start_date, end_date, source_language, target_language, corrected_only, batch_size
+            ):
+                yield from batch
+        
+        except Exception as e:
+            logger.error(f"Error exporting translations: {str(e)}")
+            raise
     
-    def get_statistics(self) -> Dict[str, Any]:
+    def _export_batches(
+        self,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        source_language: Optional[str],
+        target_language: Optional[str],
+        corrected_only: bool,
+        batch_size: int,
+        partition: Optional[Dict[str, Any]] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Keyset-walk the main database or one partition file in export order"""
+        conditions = []
+        base_params: List[Any] = []
+        if source_language:
+            conditions.append("t.source_language = ?")
+            base_params.append(source_language)
+        if target_language:
+            conditions.append("t.target_language = ?")
+            base_params.append(target_language)
+        if start_date:
+            conditions.append("t.created_at >= ?")
+            base_params.append(start_date)
+        if end_date:
+            conditions.append("t.created_at < date(?, '+1 day')")
+            base_params.append(end_date)
+        # Partition rows may have been corrected after the rollover, so they are
+        # filtered after the main-database corrections are overlaid
+        if corrected_only and partition is None:
+            conditions.append("EXISTS (SELECT 1 FROM corrections WHERE translation_id = t.id)")
+        conditions.append("(t.created_at, t.id) > (?, ?)")
+        
+        query = f"""
+            SELECT
+                t.id,
+                t.original_text,
+                t.translated_text,
+                t.source_language,
+                t.target_language,
+                t.model_confidence,
+                t.created_at,
+                c.corrected_text,
+                c.feedback as correction_feedback,
+                c.created_at as corrected_at
+            FROM translations t
+            LEFT JOIN corrections c ON c.id = (
+                SELECT MAX(id) FROM corrections WHERE translation_id = t.id
+            )
+            WHERE {" AND ".join(conditions)}
+            ORDER BY t.created_at, t.id
+            LIMIT ?
         """
-        Get database statistics
         
+        last_key: Tuple[str, int] = ("", 0)
+        while True:
+            params = base_params + [last_key[0], last_key[1], batch_size]
+            with self.get_connection() as conn:
+                if partition is None:
+                    rows = conn.execute(query, params).fetchall()
+                    records = [dict(row) for row in rows]
+                else:
+                    # Opened per batch: a streaming response may resume on another thread
+                    with self.partitions.open(partition) as part_conn:
+                        rows = part_conn.execute(query, params).fetchall()
+                    records = [dict(row) for row in rows]
+                    self._apply_recent_corrections(conn, records)
+        
+            if not rows:
+                return
+            last_key = (rows[-1]["created_at"], rows[-1]["id"])
+        
+            if corrected_only and partition is not None:
+                records = [record for record in records if record["corrected_text"] is not None]
+            if records:
+                yield records
+
+    def get_statistics(self, days: int = 30) -> Dict[str, Any]:
+        """
+        Get database statistics from the materialized counters
+        
+        Hot-table counters are combined with the statistics recorded in the
+        catalog for each attached partition, so no history table is scanned.
+        
+        Args:
+            days: Number of most recent days to include in the daily series
+            
         Returns:
             Dictionary with various statistics
         """
         try:
             with self.get_connection() as conn:
-                # Total translations
-                cursor = conn.execute("SELECT COUNT(*) FROM translations")
-                total_translations = cursor.fetchone()[0]
-                
-                # Total corrections
-                cursor = conn.execute("SELECT COUNT(*) FROM corrections")
-                total_corrections = cursor.fetchone()[0]
+                row = conn.execute("""
+                    SELECT translation_count, correction_count, confidence_sum
+                    FROM stats_totals WHERE id = 1
+                """).fetchone()
+                totals = {
+                    "translation_count": row["translation_count"] if row else 0,
+                    "correction_count": row["correction_count"] if row else 0,
+                    "confidence_sum": row["confidence_sum"] if row else 0.0
+                }
                 
                 # Translations by language pair
-                cursor = conn.execute("""
-                    SELECT source_language, target_language, COUNT(*) as count
-                    FROM translations
-                    GROUP BY source_language, target_language
-                    ORDER BY count DESC
-                """)
-                language_pairs = cursor.fetchall()
+                pairs = {
+                    (row["source_language"], row["target_language"]): row["translation_count"]
+                    for row in conn.execute("""
+                        SELECT source_language, target_language, translation_count
+                        FROM stats_language_pairs
+                    """)
+                }
+                
+                # Daily activity
+                first_day = conn.execute("SELECT date('now', '-' || ? || ' days')", (max(days, 7),)).fetchone()[0]
+                daily = {
+                    row["day"]: [row["translation_count"], row["correction_count"]]
+                    for row in conn.execute("""
+                        SELECT day, translation_count, correction_count
+                        FROM stats_daily
+                        WHERE day >= ?
+                    """, (first_day,))
+                }
+                
+                self.partitions.merge_statistics(conn, totals, pairs, daily)
+                daily_series = sorted(
+                    ((day, counts) for day, counts in daily.items() if day >= first_day), reverse=True
+                )
                 
                 # Recent activity (last 7 days)
-                cursor = conn.execute("""
-                    SELECT COUNT(*) FROM translations
-                    WHERE created_at >= datetime('now', '-7 days')
-                """)
-                recent_translations = cursor.fetchone()[0]
+                week_start = conn.execute("SELECT date('now', '-7 days')").fetchone()[0]
+                recent_translations = sum(
+                    counts[0] for day, counts in daily_series if day >= week_start
+                )
                 
+                total_translations = totals["translation_count"]
                 return {
                     "total_translations": total_translations,
-                    "total_corrections": total_corrections,
+                    "total_corrections": totals["correction_count"],
                     "recent_translations": recent_translations,
+                    "average_confidence": (totals["confidence_sum"] / total_translations) if total_translations else 0.0,
                     "language_pairs": [
                         {
-                            "source": row["source_language"],
-                            "target": row["target_language"],
-                            "count": row["count"]
+                            "source": source,
+                            "target": target,
+                            "count": count
                         }
-                        for row in language_pairs
+                        for (source, target), count in sorted(pairs.items(), key=lambda item: -item[1])
+                    ],
+                    "daily": [
+                        {
+                            "date": day,
+                            "translations": counts[0],
+                            "corrections": counts[1]
+                        }
+                        for day, counts in daily_series[:days]
                     ]
                 }
                 
@@ -380,38 +1389,170 @@ class DatabaseManager:
             logger.error(f"Error retrieving statistics: {str(e)}")
             raise
     
-    def cleanup_old_records(self, days: int = 30):
+    def delete_expired_chunk(
+        self,
+        cutoff: str,
+        chunk_size: int = 1000,
+        archive: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+    ) -> Tuple[int, int]:
         """
-        Clean up old translation records
+        Delete the oldest expired translations (and their corrections) in one short transaction
+        
+        The chunk is the exact IDs of the chunk_size oldest expired rows, located through
+        the created_at index, so the write lock is held for at most chunk_size rows even
+        though write-behind IDs do not increase with created_at.
         
         Args:
-            days: Number of days to keep records
+            cutoff: Rows with created_at before this timestamp ("YYYY-MM-DD HH:MM:SS") expire
+            chunk_size: Maximum number of translations to delete
+            archive: Optional callable receiving the expired rows (with a "corrections"
+                list each) before they are deleted; if it raises, nothing is deleted
+            
+        Returns:
+            Tuple of (deleted translations, deleted corrections); (0, 0) when nothing is left
+        """
+        # Re-evaluated by each statement; stable because BEGIN IMMEDIATE blocks other writers
+        chunk_ids = """
+            SELECT id FROM translations
+            WHERE created_at < ?
+            ORDER BY created_at, id
+            LIMIT ?
         """
         try:
             with self.get_connection() as conn:
-                # Delete old corrections first (due to foreign key constraint)
-                cursor = conn.execute("""
-                    DELETE FROM corrections
-                    WHERE translation_id IN (
-                        SELECT id FROM translations
-                        WHERE created_at < datetime('now', '-' || ? || ' days')
-                    )
-                """, (days,))
+                conn.execute("BEGIN IMMEDIATE")
+                first = conn.execute(chunk_ids, (cutoff, 1)).fetchone()
                 
+                if first is None:
+                    conn.rollback()
+                    return 0, 0
+                
+                if archive is not None:
+                    rows = [dict(row) for row in conn.execute(f"""
+                        SELECT * FROM translations
+                        WHERE id IN ({chunk_ids})
+                        ORDER BY id
+                    """, (cutoff, chunk_size))]
+                    corrections: Dict[int, List[Dict[str, Any]]] = {}
+                    for row in conn.execute(f"""
+                        SELECT * FROM corrections
+                        WHERE translation_id IN ({chunk_ids})
+                        ORDER BY id
+                    """, (cutoff, chunk_size)):
+                        corrections.setdefault(row["translation_id"], []).append(dict(row))
+                    for row in rows:
+                        row["corrections"] = corrections.get(row["id"], [])
+                    archive(rows)
+                
+                # Delete corrections first (due to foreign key constraint)
+                cursor = conn.execute(f"""
+                    DELETE FROM corrections
+                    WHERE translation_id IN ({chunk_ids})
+                """, (cutoff, chunk_size))
                 deleted_corrections = cursor.rowcount
                 
-                # Delete old translations
-                cursor = conn.execute("""
+                cursor = conn.execute(f"""
                     DELETE FROM translations
-                    WHERE created_at < datetime('now', '-' || ? || ' days')
-                """, (days,))
-                
+                    WHERE id IN ({chunk_ids})
+                """, (cutoff, chunk_size))
                 deleted_translations = cursor.rowcount
                 
                 conn.commit()
-                
-                logger.info(f"Cleaned up {deleted_translations} translations and {deleted_corrections} corrections older than {days} days")
+                return deleted_translations, deleted_corrections
                 
+        except Exception as e:
+            logger.error(f"Error deleting expired records: {str(e)}")
+            raise
+    
+    def cleanup_old_records(self, days: int = 30, chunk_size: int = 1000):
+        """
+        Clean up old translation records
+        
+        Args:
+            days: Number of days to keep records
+            chunk_size: Translations deleted per transaction
+        """
+        try:
+            cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+            deleted_translations = 0
+            deleted_corrections = 0
+            
+            while True:
+                translations, corrections = self.delete_expired_chunk(cutoff, chunk_size)
+                if translations == 0:
+                    break
+                deleted_translations += translations
+                deleted_corrections += corrections
+            
+            logger.info(f"Cleaned up {deleted_translations} translations and {deleted_corrections} corrections older than {days} days")
+            
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
             raise
+    
+    def roll_over_partitions(self) -> List[Dict[str, Any]]:
+        """
+        Move months older than the hot window into monthly partition files
+        
+        Returns:
+            Catalog entries of the partitions that received rows
+        """
+        try:
+            return self.partitions.roll_over(self.get_connection())
+        except Exception as e:
+            logger.error(f"Error rolling over partitions: {str(e)}")
+            raise
+    
+    def list_partitions(self) -> List[Dict[str, Any]]:
+        """List history partitions, newest month first"""
+        return self.partitions.list(self.get_connection())
+    
+    def detach_partition(self, month: str, compress: bool = True) -> Dict[str, Any]:
+        """
+        Remove a monthly partition from history and statistics queries
+        
+        Args:
+            month: Partition month ("YYYY-MM")
+            compress: Gzip the partition file
+            
+        Returns:
+            Updated catalog entry
+        """
+        try:
+            return self.partitions.detach(self.get_connection(), month, compress)
+        except Exception as e:
+            logger.error(f"Error detaching partition {month}: {str(e)}")
+            raise
+    
+    def attach_partition(self, month: str) -> Dict[str, Any]:
+        """
+        Bring a detached monthly partition back into queries
+        
+        Args:
+            month: Partition month ("YYYY-MM")
+            
+        Returns:
+            Updated catalog entry
+        """
+        try:
+            return self.partitions.attach(self.get_connection(), month)
+        except Exception as e:
+            logger.error(f"Error attaching partition {month}: {str(e)}")
+            raise
+    
+    def drop_expired_partitions(self, cutoff: str, archive_dir: Optional[str] = None) -> List[str]:
+        """
+        Remove partitions whose newest translation is older than the cutoff
+        
+        Args:
+            cutoff: Retention cutoff ("YYYY-MM-DD HH:MM:SS")
+            archive_dir: Keep the partition files here instead of deleting them
+            
+        Returns:
+            Months that were dropped
+        """
+        try:
+            return self.partitions.drop_expired(self.get_connection(), cutoff, archive_dir)
+        except Exception as e:
+            logger.error(f"Error dropping expired partitions: {str(e)}")
+            raise
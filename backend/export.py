@@ -0,0 +1,153 @@
+"""
+Streaming serializers for translation exports
+Turn an iterator of export records into JSONL, CSV or Parquet byte chunks with constant memory
+"""
+
+import csv
+import io
+import json
+import logging
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+EXPORT_COLUMNS = [
+    "id",
+    "original_text",
+    "translated_text",
+    "source_language",
+    "target_language",
+    "model_confidence",
+    "created_at",
+    "corrected_text",
+    "correction_feedback",
+    "corrected_at",
+]
+
+EXPORT_FORMATS = {
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "csv": ("text/csv", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+def _batches(records: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(records)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def stream_jsonl(records: Iterable[Dict[str, Any]], chunk_rows: int = 1000) -> Iterator[bytes]:
+    """One JSON object per line, emitted every chunk_rows records"""
+    for batch in _batches(records, chunk_rows):
+        yield "".join(
+            json.dumps({column: record.get(column) for column in EXPORT_COLUMNS}, ensure_ascii=False) + "\n"
+            for record in batch
+        ).encode("utf-8")
+
+
+def stream_csv(records: Iterable[Dict[str, Any]], chunk_rows: int = 1000) -> Iterator[bytes]:
+    """CSV with a header row, emitted every chunk_rows records"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS, extrasaction="ignore")
+    # UTF-8 BOM so spreadsheet tools detect the encoding of Indic text
+    yield "\ufeff".encode("utf-8")
+    writer.writeheader()
+    for batch in _batches(records, chunk_rows):
+        writer.writerows(batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object whose contents are drained after every row group"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_parquet(records: Iterable[Dict[str, Any]], chunk_rows: int = 50000) -> Iterator[bytes]:
+    """
+    Parquet file written one row group per chunk_rows records
+
+    Raises:
+        RuntimeError: If pyarrow is not installed
+    """
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("Parquet export requires pyarrow")
+
+    schema = pa.schema([
+        ("id", pa.int64()),
+        ("original_text", pa.string()),
+        ("translated_text", pa.string()),
+        ("source_language", pa.string()),
+        ("target_language", pa.string()),
+        ("model_confidence", pa.float64()),
+        ("created_at", pa.string()),
+        ("corrected_text", pa.string()),
+        ("correction_feedback", pa.string()),
+        ("corrected_at", pa.string()),
+    ])
+
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    try:
+        for batch in _batches(records, chunk_rows):
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def stream_export(records: Iterable[Dict[str, Any]], export_format: str) -> Iterator[bytes]:
+    """
+    Serialize export records in the requested format
+
+    Args:
+        records: Iterator of export records (e.g. DatabaseManager.iter_export)
+        export_format: "jsonl", "csv" or "parquet"
+
+    Returns:
+        Iterator of byte chunks
+    """
+    if export_format == "jsonl":
+        return stream_jsonl(records)
+    if export_format == "csv":
+        return stream_csv(records)
+    if export_format == "parquet":
+        return stream_parquet(records)
+    raise ValueError(f"Unsupported export format: {export_format}")
@@ -1,7 +1,16 @@
 import hashlib
+import multiprocessing
 import os
+import queue
+import sys
+import threading
+import time
 import uuid
-from typing import List, Tuple, Union, Dict
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
 import regex as re
 import sentencepiece as spm
@@ -16,25 +25,174 @@ from tqdm import tqdm
 
 from .flores_codes_map_indic import flores_codes, iso_to_flores
 from .normalize_punctuation import punc_norm
-from .normalize_regex_inference import EMAIL_PATTERN, normalize
+from .normalize_regex_inference import EMAIL_PATTERN, normalize, restore_placeholders
 
 
-def split_sentences(paragraph: str, lang: str) -> List[str]:
+# Inputs up to this many characters with no sentence delimiter before their final
+# punctuation are treated as a single sentence without running a splitter
+SHORT_SENTENCE_MAX_CHARS = 200
+SENTENCE_DELIMITERS = ".?!\u0964\u0965\u06d4\u061f"
+
+
+def is_single_sentence(paragraph: str) -> bool:
+    """
+    Cheap check for short inputs that cannot contain more than one sentence, such as
+    product titles and attribute values.
+
+    Args:
+        paragraph (str): input text paragraph.
+
+    Returns:
+        bool -> True if the paragraph can skip sentence splitting.
+    """
+    text = paragraph.strip()
+    if not text or len(text) > SHORT_SENTENCE_MAX_CHARS or "\n" in text:
+        return False
+    body = text.rstrip(SENTENCE_DELIMITERS + "\"')” ")
+    return not any(char in SENTENCE_DELIMITERS for char in body)
+
+
+class SentenceSplitterPool:
+    """
+    Long-lived Moses sentence splitter processes for one language.
+
+    Each `MosesSentenceSplitter` wraps a Perl subprocess, so starting one per paragraph
+    dominates preprocessing of short texts. The pool keeps up to `size` splitters alive,
+    lends each to one thread at a time and replaces a splitter whose process failed.
+    """
+
+    def __init__(self, lang: str, size: int = 1, max_restarts: int = 1):
+        """
+        Args:
+            lang (str): iso language code understood by the Moses splitter.
+            size (int, optional): maximum number of splitter processes (defaults: 1).
+            max_restarts (int, optional): retries with a fresh process per call (defaults: 1).
+        """
+        self.lang = lang
+        self.size = max(1, size)
+        self.max_restarts = max_restarts
+        self._idle = []
+        self._created = 0
+        # signalled whenever a splitter is returned, a slot frees up or the pool closes
+        self._available = threading.Condition(threading.Lock())
+        self._closed = False
+        self.stats = {"calls": 0, "processes_started": 0, "restarts": 0}
+
+    def _acquire(self) -> MosesSentenceSplitter:
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError(f"Sentence splitter pool for '{self.lang}' is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                self._available.wait()
+        try:
+            splitter = MosesSentenceSplitter(self.lang)
+        except Exception:
+            self._release_slot()
+            raise
+        with self._available:
+            self.stats["processes_started"] += 1
+        return splitter
+
+    def _release(self, splitter: MosesSentenceSplitter):
+        with self._available:
+            if not self._closed:
+                self._idle.append(splitter)
+                self._available.notify()
+                return
+        self._discard(splitter)
+
+    def _release_slot(self):
+        with self._available:
+            self._created -= 1
+            # a waiter may now start a replacement process
+            self._available.notify()
+
+    def _discard(self, splitter: MosesSentenceSplitter):
+        self._release_slot()
+        try:
+            splitter.close()
+        except Exception:
+            pass
+
+    def split(self, paragraph: str) -> List[str]:
+        """
+        Splits a paragraph into sentences with one of the pooled processes.
+
+        Args:
+            paragraph (str): input text paragraph.
+
+        Returns:
+            List[str] -> list of sentences.
+
+        Raises:
+            RuntimeError: if the pool was closed.
+        """
+        with self._available:
+            self.stats["calls"] += 1
+        for attempt in range(self.max_restarts + 1):
+            splitter = self._acquire()
+            try:
+                sents = splitter([paragraph])
+            except Exception:
+                # the subprocess died or its pipe broke: start a fresh one
+                self._discard(splitter)
+                if attempt == self.max_restarts:
+                    raise
+                with self._available:
+                    self.stats["restarts"] += 1
+                continue
+            self._release(splitter)
+            return sents
+
+    def close(self):
+        """
+        Stops every idle splitter process and wakes waiting threads, which then raise;
+        splitters in use are stopped when returned.
+        """
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._available.notify_all()
+        for splitter in idle:
+            self._discard(splitter)
+
+
+def split_sentences(
+    paragraph: str, lang: str, moses_splitter: Union[SentenceSplitterPool, None] = None
+) -> List[str]:
     """
     Splits the input text paragraph into sentences. It uses `moses` for English and
-    `indic-nlp` for Indic languages.
+    `indic-nlp` for Indic languages. Short single-sentence inputs are returned as is.
 
     Args:
         paragraph (str): input text paragraph.
         lang (str): flores language code.
+        moses_splitter (SentenceSplitterPool, optional): pooled English splitter; a
+            temporary splitter process is started when it is not given.
 
     Returns:
         List[str] -> list of sentences.
     """
+    if is_single_sentence(paragraph):
+        return [paragraph.strip().replace("\xad", "")] if lang == "eng_Latn" else [paragraph.strip()]
+
     if lang == "eng_Latn":
-        with MosesSentenceSplitter(flores_codes[lang]) as splitter:
-            sents_moses = splitter([paragraph])
+        # nltk is pure Python; moses only matters when nltk finds more than one
+        # sentence, since the split with fewer sentences is kept
         sents_nltk = sent_tokenize(paragraph)
+        if len(sents_nltk) <= 1:
+            return [sent.replace("\xad", "") for sent in sents_nltk]
+
+        if moses_splitter is not None:
+            sents_moses = moses_splitter.split(paragraph)
+        else:
+            with MosesSentenceSplitter(flores_codes[lang]) as splitter:
+                sents_moses = splitter([paragraph])
         if len(sents_nltk) < len(sents_moses):
             sents = sents_nltk
         else:
@@ -115,6 +273,251 @@ def truncate_long_sentences(
     return new_sents, placeholders
 
 
+# Normalizers, Moses tools and the transliterator are memoized per iso language code and shared
+# by every TextProcessor (and so every Model) in the process; several flores codes map to the
+# same iso code and reuse one instance.
+@lru_cache(maxsize=None)
+def get_indic_normalizer(iso_lang: str) -> indic_normalize.BaseNormalizer:
+    return indic_normalize.IndicNormalizerFactory().get_normalizer(iso_lang)
+
+
+@lru_cache(maxsize=None)
+def get_moses_tokenizer(iso_lang: str) -> MosesTokenizer:
+    return MosesTokenizer(lang=iso_lang)
+
+
+@lru_cache(maxsize=None)
+def get_moses_punct_normalizer(iso_lang: str) -> MosesPunctNormalizer:
+    return MosesPunctNormalizer(lang=iso_lang)
+
+
+@lru_cache(maxsize=None)
+def get_moses_detokenizer(iso_lang: str) -> MosesDetokenizer:
+    return MosesDetokenizer(lang=iso_lang)
+
+
+@lru_cache(maxsize=None)
+def get_transliterator() -> unicode_transliterate.UnicodeIndicTransliterator:
+    return unicode_transliterate.UnicodeIndicTransliterator()
+
+
+class TextProcessor:
+    """
+    Sentence-level pre- and postprocessing (punctuation normalization, placeholder wrapping,
+    tokenization and transliteration) without the sentencepiece and translation models, so
+    it can be instantiated once per worker process.
+    """
+
+    def __init__(self):
+        self.en_tok = get_moses_tokenizer("en")
+        self.en_normalizer = get_moses_punct_normalizer("en")
+        self.en_detok = get_moses_detokenizer("en")
+        self.xliterator = get_transliterator()
+
+    def get_normalizer(self, lang: str) -> Union[indic_normalize.BaseNormalizer, None]:
+        """
+        Returns the memoized indic-nlp normalizer for a language (None for English).
+
+        Args:
+            lang (str): flores language code.
+        """
+        if lang == "eng_Latn":
+            return None
+        return get_indic_normalizer(flores_codes[lang])
+
+    def warm_up(self, langs: List[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Builds the normalizer of every language and runs one sample sentence through pre- and
+        postprocessing, so lazily compiled patterns and tables are ready before the first request.
+
+        Args:
+            langs (List[str]): flores language codes.
+
+        Returns:
+            Dict[str, Dict[str, float]]: per language, milliseconds spent creating the normalizer
+                and on the first preprocess and postprocess calls (or the error message).
+        """
+        report = {}
+        for lang in langs:
+            try:
+                start = time.perf_counter()
+                normalizer = self.get_normalizer(lang)
+                normalizer_done = time.perf_counter()
+                self.preprocess_sent("Warm-up sentence 1.", normalizer, lang)
+                preprocess_done = time.perf_counter()
+                self.postprocess(["▁Warm - up ▁1"], [{}], lang)
+                postprocess_done = time.perf_counter()
+            except Exception as e:
+                report[lang] = {"error": str(e)}
+                continue
+            report[lang] = {
+                "normalizer_ms": round((normalizer_done - start) * 1000, 2),
+                "preprocess_ms": round((preprocess_done - normalizer_done) * 1000, 2),
+                "postprocess_ms": round((postprocess_done - preprocess_done) * 1000, 2),
+            }
+        return report
+
+    def preprocess_sent(
+        self,
+        sent: str,
+        normalizer: Union[MosesPunctNormalizer, indic_normalize.IndicNormalizerFactory],
+        lang: str,
+    ) -> Tuple[str, Dict]:
+        """
+        Preprocess an input text sentence by normalizing, tokenization, and possibly transliterating it.
+
+        Args:
+            sent (str): input text sentence to preprocess.
+            normalizer (Union[MosesPunctNormalizer, indic_normalize.IndicNormalizerFactory]): an object that performs normalization on the text.
+            lang (str): flores language code of the input text sentence.
+
+        Returns:
+            Tuple[str, Dict]: A tuple containing the preprocessed input text sentence and a corresponding dictionary
+            mapping placeholders to their original values.
+        """
+        iso_lang = flores_codes[lang]
+        sent = punc_norm(sent, iso_lang)
+        sent, placeholder_entity_map = normalize(sent)
+
+        transliterate = True
+        if lang.split("_")[1] in ["Arab", "Aran", "Olck", "Mtei", "Latn"]:
+            transliterate = False
+
+        if iso_lang == "en":
+            processed_sent = " ".join(
+                self.en_tok.tokenize(self.en_normalizer.normalize(sent.strip()), escape=False)
+            )
+        elif transliterate:
+            # transliterates from the any specific language to devanagari
+            # which is why we specify lang2_code as "hi".
+            processed_sent = self.xliterator.transliterate(
+                " ".join(
+                    indic_tokenize.trivial_tokenize(normalizer.normalize(sent.strip()), iso_lang)
+                ),
+                iso_lang,
+                "hi",
+            ).replace(" ् ", "्")
+        else:
+            # we only need to transliterate for joint training
+            processed_sent = " ".join(
+                indic_tokenize.trivial_tokenize(normalizer.normalize(sent.strip()), iso_lang)
+            )
+
+        return processed_sent, placeholder_entity_map
+
+    def preprocess(self, sents: List[str], lang: str):
+        """
+        Preprocess an array of sentences by normalizing, tokenization, and possibly transliterating it.
+
+        Args:
+            batch (List[str]): input list of sentences to preprocess.
+            lang (str): flores language code of the input text sentences.
+
+        Returns:
+            Tuple[List[str], List[Dict]]: a tuple of list of preprocessed input text sentences and also a corresponding list of dictionary
+                mapping placeholders to their original values.
+        """
+        processed_sents, placeholder_entity_map_sents = [], []
+
+        normalizer = self.get_normalizer(lang)
+
+        for sent in sents:
+            sent, placeholder_entity_map = self.preprocess_sent(sent, normalizer, lang)
+            processed_sents.append(sent)
+            placeholder_entity_map_sents.append(placeholder_entity_map)
+
+        return processed_sents, placeholder_entity_map_sents
+
+    def postprocess(
+        self,
+        sents: List[str],
+        placeholder_entity_map: List[Dict],
+        lang: str,
+        common_lang: str = "hin_Deva",
+    ) -> List[str]:
+        """
+        Postprocesses a batch of input sentences after the translation generations.
+
+        Args:
+            sents (List[str]): batch of translated sentences to postprocess.
+            placeholder_entity_map (List[Dict]): dictionary mapping placeholders to the original entity values.
+            lang (str): flores language code of the input sentences.
+            common_lang (str, optional): flores language code of the transliterated language (defaults: hin_Deva).
+
+        Returns:
+            List[str]: postprocessed batch of input sentences.
+        """
+
+        lang_code, script_code = lang.split("_")
+        # SPM decode
+        for i in range(len(sents)):
+            # sent_tokens = sents[i].split(" ")
+            # sents[i] = self.sp_tgt.decode(sent_tokens)
+
+            sents[i] = sents[i].replace(" ", "").replace("▁", " ").strip()
+
+            # Fixes for Perso-Arabic scripts
+            # TODO: Move these normalizations inside indic-nlp-library
+            if script_code in {"Arab", "Aran"}:
+                # UrduHack adds space before punctuations. Since the model was trained without fixing this issue, let's fix it now
+                sents[i] = sents[i].replace(" ؟", "؟").replace(" ۔", "۔").replace(" ،", "،")
+                # Kashmiri bugfix for palatalization: https://github.com/AI4Bharat/IndicTrans2/issues/11
+                sents[i] = sents[i].replace("ٮ۪", "ؠ")
+
+        assert len(sents) == len(placeholder_entity_map)
+
+        for i in range(0, len(sents)):
+            sents[i] = restore_placeholders(sents[i], placeholder_entity_map[i])
+
+        # Detokenize and transliterate to native scripts if applicable
+        postprocessed_sents = []
+
+        if lang == "eng_Latn":
+            for sent in sents:
+                postprocessed_sents.append(self.en_detok.detokenize(sent.split(" ")))
+        else:
+            for sent in sents:
+                outstr = indic_detokenize.trivial_detokenize(
+                    self.xliterator.transliterate(
+                        sent, flores_codes[common_lang], flores_codes[lang]
+                    ),
+                    flores_codes[lang],
+                )
+                
+                # Oriya bug: indic-nlp-library produces ଯ଼ instead of ୟ when converting from Devanagari to Odia
+                # TODO: Find out what's the issue with unicode transliterator for Oriya and fix it
+                if lang_code == "ory":
+                    outstr = outstr.replace("ଯ଼", 'ୟ')
+
+                postprocessed_sents.append(outstr)
+
+        return postprocessed_sents
+
+
+# Text processor of a preprocessing worker process, built once by the pool initializer
+_worker_processor: Union[TextProcessor, None] = None
+
+
+def _init_text_worker(warm_up_languages: List[str]):
+    global _worker_processor
+    _worker_processor = TextProcessor()
+    _worker_processor.warm_up(warm_up_languages)
+
+
+def _preprocess_chunk(args: Tuple[List[str], str]) -> Tuple[List[str], List[Dict]]:
+    sents, lang = args
+    return _worker_processor.preprocess(sents, lang)
+
+
+def _postprocess_chunk(args: Tuple[List[str], List[Dict], str]) -> List[str]:
+    sents, placeholder_entity_map, lang = args
+    return _worker_processor.postprocess(sents, placeholder_entity_map, lang)
+
+
+# end-of-stream marker passed between the pipeline stages
+_PIPELINE_DONE = object()
+
+
 class Model:
     """
     Model class to run the IndicTransv2 models using python interface.
@@ -126,6 +529,12 @@ class Model:
         device: str = "cuda",
         input_lang_code_format: str = "flores",
         model_type: str = "ctranslate2",
+        sentence_cache_size: int = 10000,
+        compute_type: str = "default",
+        sentence_splitter_pool_size: int = 1,
+        preprocess_workers: int = 0,
+        preprocess_min_batch: int = 64,
+        warm_up_languages: Union[List[str], None] = None,
     ):
         """
         Initialize the model class.
@@ -133,12 +542,45 @@ class Model:
         Args:
             ckpt_dir (str): path of the model checkpoint directory.
             device (str, optional): where to load the model (defaults: cuda).
+            sentence_cache_size (int, optional): maximum number of preprocessed sentences whose
+                translations are kept in the LRU sentence cache, 0 disables caching (defaults: 10000).
+            sentence_splitter_pool_size (int, optional): Moses sentence splitter processes kept
+                alive per language, shared by all threads using this model (defaults: 1).
+            preprocess_workers (int, optional): worker processes for sentence pre/postprocessing,
+                0 keeps everything in this process (defaults: 0).
+            preprocess_min_batch (int, optional): smallest batch (in sentences) sent to the worker
+                pool; smaller batches are processed serially (defaults: 64).
+            warm_up_languages (List[str], optional): flores codes whose normalizers and text
+                processing paths are initialized up front; None means every supported language.
         """
         self.ckpt_dir = ckpt_dir
-        self.en_tok = MosesTokenizer(lang="en")
-        self.en_normalizer = MosesPunctNormalizer()
-        self.en_detok = MosesDetokenizer(lang="en")
-        self.xliterator = unicode_transliterate.UnicodeIndicTransliterator()
+        self.processor = TextProcessor()
+        self.en_tok = self.processor.en_tok
+        self.en_normalizer = self.processor.en_normalizer
+        self.en_detok = self.processor.en_detok
+        self.xliterator = self.processor.xliterator
+
+        # initialize per-language text processing now instead of on the first request
+        self.warm_up_languages = (
+            list(flores_codes) if warm_up_languages is None else list(warm_up_languages)
+        )
+        self.text_init_report = self.processor.warm_up(self.warm_up_languages)
+        self._print_text_init_report()
+
+        # worker processes holding their own TextProcessor, started up front so the
+        # first large batch does not pay for their initialization
+        self.text_pool_workers = preprocess_workers
+        self.text_pool_min_batch = max(1, preprocess_min_batch)
+        self.text_pool_min_chunk = 16
+        # chunks submitted to the pool and not finished yet, cancelled by close()
+        self._text_pool_futures = set()
+        self._text_pool_futures_lock = threading.Lock()
+        self.text_pool = self._start_text_pool()
+
+        # flores lang code -> long-lived sentence splitter processes, started on first use
+        self.sentence_splitter_pool_size = sentence_splitter_pool_size
+        self.sentence_splitters: Dict[str, SentenceSplitterPool] = {}
+        self._sentence_splitters_lock = threading.Lock()
 
         print("Initializing sentencepiece model for SRC and TGT")
         self.sp_src = spm.SentencePieceProcessor(
@@ -150,14 +592,22 @@ class Model:
 
         self.input_lang_code_format = input_lang_code_format
 
+        # preprocessed (tagged) sentence -> raw model output, in LRU order; shared by the
+        # inference threads and the pipeline threads, so every access holds the lock
+        self.sentence_cache_size = sentence_cache_size
+        self.sentence_cache = OrderedDict()
+        self.sentence_cache_lock = threading.Lock()
+        self.sentence_cache_stats = {"sentences": 0, "unique_sentences": 0, "cache_hits": 0}
+        self.last_batch_stats = {}
+
         print("Initializing model for translation")
         # initialize the model
         if model_type == "ctranslate2":
             import ctranslate2
 
             self.translator = ctranslate2.Translator(
-                self.ckpt_dir, device=device
-            )  # , compute_type="auto")
+                self.ckpt_dir, device=device, compute_type=compute_type
+            )
             self.translate_lines = self.ctranslate2_translate_lines
         elif model_type == "fairseq":
             from .custom_interactive import Translator
@@ -171,6 +621,97 @@ class Model:
         else:
             raise NotImplementedError(f"Unknown model_type: {model_type}")
 
+    def _print_text_init_report(self):
+        timings = {
+            lang: sum(report.values())
+            for lang, report in self.text_init_report.items()
+            if "error" not in report
+        }
+        failed = sorted(lang for lang, report in self.text_init_report.items() if "error" in report)
+        slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)[:3]
+        print(
+            f"Initialized text processing for {len(timings)} languages in {sum(timings.values()):.1f} ms"
+            + (f" (slowest: {', '.join(f'{lang} {ms:.1f} ms' for lang, ms in slowest)})" if slowest else "")
+            + (f"; failed: {', '.join(failed)}" if failed else "")
+        )
+
+    def get_text_init_report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the per-language initialization cost measured when the model was loaded.
+        """
+        return dict(self.text_init_report)
+
+    def _start_text_pool(self) -> Union[ProcessPoolExecutor, None]:
+        if self.text_pool_workers <= 0:
+            return None
+        print(f"Starting {self.text_pool_workers} preprocessing worker processes")
+        # spawn: forking a process that already runs translator threads is unsafe
+        pool = ProcessPoolExecutor(
+            max_workers=self.text_pool_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_text_worker,
+            initargs=(self.warm_up_languages,),
+        )
+        list(pool.map(_preprocess_chunk, [([], "eng_Latn")] * self.text_pool_workers))
+        return pool
+
+    def get_sentence_splitter(self, lang: str) -> Union[SentenceSplitterPool, None]:
+        """
+        Returns the pooled Moses splitter for a language, or None for languages split by indic-nlp.
+
+        Args:
+            lang (str): flores language code.
+        """
+        if lang != "eng_Latn":
+            return None
+        pool = self.sentence_splitters.get(lang)
+        if pool is None:
+            with self._sentence_splitters_lock:
+                pool = self.sentence_splitters.get(lang)
+                if pool is None:
+                    pool = SentenceSplitterPool(flores_codes[lang], size=self.sentence_splitter_pool_size)
+                    self.sentence_splitters[lang] = pool
+        return pool
+
+    def split_sentences(self, paragraph: str, lang: str) -> List[str]:
+        """
+        Splits a paragraph into sentences using this model's pooled splitters.
+
+        Args:
+            paragraph (str): input text paragraph.
+            lang (str): flores language code.
+
+        Returns:
+            List[str] -> list of sentences.
+        """
+        return split_sentences(paragraph, lang, self.get_sentence_splitter(lang))
+
+    def get_sentence_splitter_stats(self) -> Dict[str, Any]:
+        """
+        Returns call, process start and restart counters of the sentence splitter pools.
+        """
+        return {lang: dict(pool.stats) for lang, pool in self.sentence_splitters.items()}
+
+    def close(self):
+        """
+        Stops the sentence splitter and preprocessing worker processes owned by this model.
+        """
+        with self._sentence_splitters_lock:
+            pools, self.sentence_splitters = self.sentence_splitters, {}
+        for pool in pools.values():
+            pool.close()
+        if self.text_pool is not None:
+            if sys.version_info >= (3, 9):
+                self.text_pool.shutdown(wait=False, cancel_futures=True)
+            else:
+                # shutdown() has no cancel_futures before Python 3.9
+                with self._text_pool_futures_lock:
+                    pending = list(self._text_pool_futures)
+                for future in pending:
+                    future.cancel()
+                self.text_pool.shutdown(wait=False)
+            self.text_pool = None
+
     def ctranslate2_translate_lines(self, lines: List[str]) -> List[str]:
         tokenized_sents = [x.strip().split(" ") for x in lines]
         translations = self.translator.translate_batch(
@@ -187,6 +728,79 @@ class Model:
     def fairseq_translate_lines(self, lines: List[str]) -> List[str]:
         return self.translator.translate(lines)
 
+    def translate_lines_cached(self, lines: List[str]) -> List[str]:
+        """
+        Translates preprocessed lines, sending each distinct line to the model at most once.
+        Identical lines within the batch are deduplicated and previously seen lines are
+        served from the bounded sentence cache; only the misses go to `translate_lines`.
+
+        Args:
+            lines (List[str]): batch of preprocessed sentences (with language tags).
+
+        Returns:
+            List[str]: raw model outputs in the same order as the input lines.
+        """
+        unique_lines = list(dict.fromkeys(lines))
+
+        translations_by_line = {}
+        misses = []
+        with self.sentence_cache_lock:
+            for line in unique_lines:
+                cached = self.sentence_cache.get(line)
+                if cached is not None:
+                    self.sentence_cache.move_to_end(line)
+                    translations_by_line[line] = cached
+                else:
+                    misses.append(line)
+
+        if misses:
+            translations = self.translate_lines(misses)
+            with self.sentence_cache_lock:
+                for line, translation in zip(misses, translations):
+                    translations_by_line[line] = translation
+                    self._cache_sentence(line, translation)
+
+        with self.sentence_cache_lock:
+            self.last_batch_stats = {
+                "sentences": len(lines),
+                "unique_sentences": len(unique_lines),
+                "cache_hits": len(unique_lines) - len(misses),
+                "translated_sentences": len(misses),
+                "dedupe_ratio": (1 - len(unique_lines) / len(lines)) if lines else 0.0,
+            }
+            self.sentence_cache_stats["sentences"] += len(lines)
+            self.sentence_cache_stats["unique_sentences"] += len(unique_lines)
+            self.sentence_cache_stats["cache_hits"] += len(unique_lines) - len(misses)
+
+        return [translations_by_line[line] for line in lines]
+
+    def _cache_sentence(self, line: str, translation: str):
+        # caller holds sentence_cache_lock
+        if self.sentence_cache_size <= 0:
+            return
+        self.sentence_cache[line] = translation
+        self.sentence_cache.move_to_end(line)
+        while len(self.sentence_cache) > self.sentence_cache_size:
+            self.sentence_cache.popitem(last=False)
+
+    def get_sentence_cache_stats(self) -> Dict[str, Any]:
+        """
+        Returns cumulative sentence dedupe/cache counters and the stats of the last batch.
+        """
+        with self.sentence_cache_lock:
+            stats = dict(self.sentence_cache_stats)
+            cached_entries = len(self.sentence_cache)
+            last_batch = dict(self.last_batch_stats)
+        return {
+            **stats,
+            "cached_entries": cached_entries,
+            "max_entries": self.sentence_cache_size,
+            "dedupe_ratio": (1 - stats["unique_sentences"] / stats["sentences"])
+            if stats["sentences"]
+            else 0.0,
+            "last_batch": last_batch,
+        }
+
     def paragraphs_batch_translate__multilingual(self, batch_payloads: List[tuple]) -> List[str]:
         """
         Translates a batch of input paragraphs (including pre/post processing)
@@ -198,50 +812,203 @@ class Model:
         Returns:
             List[str]: batch of paragraph-translations in the respective languages.
         """
-        paragraph_id_to_sentence_range = []
-        global__sents = []
-        global__preprocessed_sents = []
-        global__preprocessed_sents_placeholder_entity_map = []
+        prepared = self._prepare_paragraphs(batch_payloads)
+        translations = self.translate_lines_cached(prepared[0])
+        return self._finish_paragraphs(translations, *prepared[1:])
+
+    def paragraphs_translate_stream(
+        self,
+        batch_payloads: List[tuple],
+        chunk_size: int = 32,
+        max_pending_chunks: int = 2,
+    ) -> Iterator[str]:
+        """
+        Translates a batch of input paragraphs as a pipeline and yields each translation as soon
+        as its chunk is done, in input order.
+
+        Paragraphs are processed in chunks of `chunk_size`. A preprocessing thread prepares the
+        next chunks while the translator decodes the current one, and the caller's thread
+        postprocesses finished chunks meanwhile. Bounded queues of `max_pending_chunks` between
+        the stages keep memory flat for arbitrarily large payloads.
+
+        Args:
+            batch_payloads (List[tuple]): input-texts to be translated, each in format: (paragraph, src_lang, tgt_lang)
+            chunk_size (int, optional): paragraphs per pipeline chunk (defaults: 32).
+            max_pending_chunks (int, optional): chunks buffered between two stages (defaults: 2).
+
+        Returns:
+            Iterator[str]: paragraph-translations in the order of the payloads.
+        """
+        chunk_size = max(1, chunk_size)
+        prepared_queue = queue.Queue(maxsize=max(1, max_pending_chunks))
+        translated_queue = queue.Queue(maxsize=max(1, max_pending_chunks))
+        stop = threading.Event()
+
+        def put(target: queue.Queue, item) -> bool:
+            # blocks while the next stage is busy, but gives up once the consumer went away
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def get(source: queue.Queue):
+            while not stop.is_set():
+                try:
+                    return source.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+            return None
+
+        def preprocess_stage():
+            try:
+                for start in range(0, len(batch_payloads), chunk_size):
+                    prepared = self._prepare_paragraphs(batch_payloads[start : start + chunk_size])
+                    if not put(prepared_queue, prepared):
+                        return
+                put(prepared_queue, _PIPELINE_DONE)
+            except Exception as e:
+                put(prepared_queue, e)
+
+        def inference_stage():
+            try:
+                while True:
+                    item = get(prepared_queue)
+                    if item is None:
+                        return
+                    if item is _PIPELINE_DONE or isinstance(item, Exception):
+                        put(translated_queue, item)
+                        return
+                    translations = self.translate_lines_cached(item[0])
+                    if not put(translated_queue, (translations, item[1:])):
+                        return
+            except Exception as e:
+                put(translated_queue, e)
+
+        stages = [
+            threading.Thread(target=preprocess_stage, name="engine-preprocess", daemon=True),
+            threading.Thread(target=inference_stage, name="engine-inference", daemon=True),
+        ]
+        for stage in stages:
+            stage.start()
+
+        try:
+            while True:
+                item = translated_queue.get()
+                if item is _PIPELINE_DONE:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                translations, prepared = item
+                yield from self._finish_paragraphs(translations, *prepared)
+        finally:
+            # lets both stages exit if the caller stopped consuming early
+            stop.set()
+
+    def _prepare_paragraphs(
+        self, batch_payloads: List[tuple]
+    ) -> Tuple[List[str], List[Dict], List[Tuple[int, int]], List[str]]:
+        """
+        Splits and preprocesses paragraphs into tagged model inputs.
 
-        for i in range(len(batch_payloads)):
-            paragraph, src_lang, tgt_lang = batch_payloads[i]
+        Returns:
+            Tuple: tagged sentences, their placeholder maps, the sentence range of every
+                paragraph and the flores target language of every paragraph.
+        """
+        src_langs, tgt_langs, paragraph_sents = [], [], []
+        for paragraph, src_lang, tgt_lang in batch_payloads:
             if self.input_lang_code_format == "iso":
                 src_lang, tgt_lang = iso_to_flores[src_lang], iso_to_flores[tgt_lang]
+            src_langs.append(src_lang)
+            tgt_langs.append(tgt_lang)
+            paragraph_sents.append(self.split_sentences(paragraph, src_lang))
+
+        # preprocess all sentences of a source language in one call, so large payloads are
+        # chunked across the preprocessing pool instead of going paragraph by paragraph
+        preprocessed = [None] * len(batch_payloads)
+        for src_lang, paragraph_ids in self._group_by_language(src_langs).items():
+            processed_sents, placeholder_entity_map_sents = self.preprocess(
+                [sent for paragraph_id in paragraph_ids for sent in paragraph_sents[paragraph_id]],
+                src_lang,
+            )
+            offset = 0
+            for paragraph_id in paragraph_ids:
+                end = offset + len(paragraph_sents[paragraph_id])
+                preprocessed[paragraph_id] = (
+                    processed_sents[offset:end],
+                    placeholder_entity_map_sents[offset:end],
+                )
+                offset = end
 
-            batch = split_sentences(paragraph, src_lang)
-            global__sents.extend(batch)
+        paragraph_id_to_sentence_range = []
+        global__preprocessed_sents = []
+        global__preprocessed_sents_placeholder_entity_map = []
 
-            preprocessed_sents, placeholder_entity_map_sents = self.preprocess_batch(
-                batch, src_lang, tgt_lang
+        for paragraph_id, (processed_sents, placeholder_entity_map_sents) in enumerate(preprocessed):
+            tokenized_sents = self.apply_spm(processed_sents)
+            tokenized_sents, placeholder_entity_map_sents = truncate_long_sentences(
+                tokenized_sents, placeholder_entity_map_sents
+            )
+            tagged_sents = apply_lang_tags(
+                tokenized_sents, src_langs[paragraph_id], tgt_langs[paragraph_id]
             )
 
             global_sentence_start_index = len(global__preprocessed_sents)
-            global__preprocessed_sents.extend(preprocessed_sents)
+            global__preprocessed_sents.extend(tagged_sents)
             global__preprocessed_sents_placeholder_entity_map.extend(placeholder_entity_map_sents)
             paragraph_id_to_sentence_range.append(
                 (global_sentence_start_index, len(global__preprocessed_sents))
             )
 
-        translations = self.translate_lines(global__preprocessed_sents)
-
-        translated_paragraphs = []
-        for paragraph_id, sentence_range in enumerate(paragraph_id_to_sentence_range):
-            tgt_lang = batch_payloads[paragraph_id][2]
-            if self.input_lang_code_format == "iso":
-                tgt_lang = iso_to_flores[tgt_lang]
+        return (
+            global__preprocessed_sents,
+            global__preprocessed_sents_placeholder_entity_map,
+            paragraph_id_to_sentence_range,
+            tgt_langs,
+        )
 
+    def _finish_paragraphs(
+        self,
+        translations: List[str],
+        global__preprocessed_sents_placeholder_entity_map: List[Dict],
+        paragraph_id_to_sentence_range: List[Tuple[int, int]],
+        tgt_langs: List[str],
+    ) -> List[str]:
+        """
+        Postprocesses raw model outputs and joins them back into paragraphs.
+        """
+        # postprocess per target language, again as one (possibly parallel) call each
+        translated_paragraphs = [None] * len(tgt_langs)
+        for tgt_lang, paragraph_ids in self._group_by_language(tgt_langs).items():
+            ranges = [paragraph_id_to_sentence_range[paragraph_id] for paragraph_id in paragraph_ids]
             postprocessed_sents = self.postprocess(
-                translations[sentence_range[0] : sentence_range[1]],
-                global__preprocessed_sents_placeholder_entity_map[
-                    sentence_range[0] : sentence_range[1]
+                [sent for start, end in ranges for sent in translations[start:end]],
+                [
+                    entity_map
+                    for start, end in ranges
+                    for entity_map in global__preprocessed_sents_placeholder_entity_map[start:end]
                 ],
                 tgt_lang,
             )
-            translated_paragraph = " ".join(postprocessed_sents)
-            translated_paragraphs.append(translated_paragraph)
+            offset = 0
+            for paragraph_id, (start, end) in zip(paragraph_ids, ranges):
+                translated_paragraphs[paragraph_id] = " ".join(
+                    postprocessed_sents[offset : offset + end - start]
+                )
+                offset += end - start
 
         return translated_paragraphs
 
+    @staticmethod
+    def _group_by_language(langs: List[str]) -> Dict[str, List[int]]:
+        """Groups paragraph indices by language code, keeping their order."""
+        groups: Dict[str, List[int]] = {}
+        for paragraph_id, lang in enumerate(langs):
+            groups.setdefault(lang, []).append(paragraph_id)
+        return groups
+
     # translate a batch of sentences from src_lang to tgt_lang
     def batch_translate(self, batch: List[str], src_lang: str, tgt_lang: str) -> List[str]:
         """
@@ -265,7 +1032,7 @@ class Model:
         preprocessed_sents, placeholder_entity_map_sents = self.preprocess_batch(
             batch, src_lang, tgt_lang
         )
-        translations = self.translate_lines(preprocessed_sents)
+        translations = self.translate_lines_cached(preprocessed_sents)
         return self.postprocess(translations, placeholder_entity_map_sents, tgt_lang)
 
     # translate a paragraph from src_lang to tgt_lang
@@ -290,7 +1057,7 @@ class Model:
         else:
             flores_src_lang = src_lang
 
-        sents = split_sentences(paragraph, flores_src_lang)
+        sents = self.split_sentences(paragraph, flores_src_lang)
         postprocessed_sents = self.batch_translate(sents, src_lang, tgt_lang)
         translated_paragraph = " ".join(postprocessed_sents)
 
@@ -338,49 +1105,41 @@ class Model:
     ) -> Tuple[str, Dict]:
         """
         Preprocess an input text sentence by normalizing, tokenization, and possibly transliterating it.
-
-        Args:
-            sent (str): input text sentence to preprocess.
-            normalizer (Union[MosesPunctNormalizer, indic_normalize.IndicNormalizerFactory]): an object that performs normalization on the text.
-            lang (str): flores language code of the input text sentence.
-
-        Returns:
-            Tuple[str, Dict]: A tuple containing the preprocessed input text sentence and a corresponding dictionary
-            mapping placeholders to their original values.
+        See `TextProcessor.preprocess_sent`.
         """
-        iso_lang = flores_codes[lang]
-        sent = punc_norm(sent, iso_lang)
-        sent, placeholder_entity_map = normalize(sent)
+        return self.processor.preprocess_sent(sent, normalizer, lang)
 
-        transliterate = True
-        if lang.split("_")[1] in ["Arab", "Aran", "Olck", "Mtei", "Latn"]:
-            transliterate = False
+    def _use_text_pool(self, num_sents: int) -> bool:
+        return self.text_pool is not None and num_sents >= self.text_pool_min_batch
 
-        if iso_lang == "en":
-            processed_sent = " ".join(
-                self.en_tok.tokenize(self.en_normalizer.normalize(sent.strip()), escape=False)
-            )
-        elif transliterate:
-            # transliterates from the any specific language to devanagari
-            # which is why we specify lang2_code as "hi".
-            processed_sent = self.xliterator.transliterate(
-                " ".join(
-                    indic_tokenize.trivial_tokenize(normalizer.normalize(sent.strip()), iso_lang)
-                ),
-                iso_lang,
-                "hi",
-            ).replace(" ् ", "्")
-        else:
-            # we only need to transliterate for joint training
-            processed_sent = " ".join(
-                indic_tokenize.trivial_tokenize(normalizer.normalize(sent.strip()), iso_lang)
-            )
+    def _chunk_bounds(self, num_sents: int) -> List[Tuple[int, int]]:
+        """Splits a batch into one contiguous chunk per worker (at least `text_pool_min_chunk` sentences each)."""
+        chunk_size = max(self.text_pool_min_chunk, -(-num_sents // self.text_pool_workers))
+        return [(i, min(i + chunk_size, num_sents)) for i in range(0, num_sents, chunk_size)]
 
-        return processed_sent, placeholder_entity_map
+    def _run_text_pool(self, fn, chunks: List[tuple]) -> Union[List[Any], None]:
+        """
+        Runs chunks on the preprocessing pool; returns None (serial fallback) if the pool broke.
+        """
+        futures = [self.text_pool.submit(fn, chunk) for chunk in chunks]
+        with self._text_pool_futures_lock:
+            self._text_pool_futures.update(futures)
+        try:
+            return [future.result() for future in futures]
+        except BrokenProcessPool:
+            print("Preprocessing pool broke, restarting it and processing this batch serially")
+            self.text_pool.shutdown(wait=False)
+            self.text_pool = self._start_text_pool()
+            return None
+        finally:
+            with self._text_pool_futures_lock:
+                self._text_pool_futures.difference_update(futures)
 
     def preprocess(self, sents: List[str], lang: str):
         """
         Preprocess an array of sentences by normalizing, tokenization, and possibly transliterating it.
+        Batches of at least `text_pool_min_batch` sentences are split into chunks and processed on
+        the worker pool; smaller batches run serially in this process.
 
         Args:
             batch (List[str]): input list of sentences to preprocess.
@@ -390,20 +1149,18 @@ class Model:
             Tuple[List[str], List[Dict]]: a tuple of list of preprocessed input text sentences and also a corresponding list of dictionary
                 mapping placeholders to their original values.
         """
-        processed_sents, placeholder_entity_map_sents = [], []
-
-        if lang == "eng_Latn":
-            normalizer = None
-        else:
-            normfactory = indic_normalize.IndicNormalizerFactory()
-            normalizer = normfactory.get_normalizer(flores_codes[lang])
-
-        for sent in sents:
-            sent, placeholder_entity_map = self.preprocess_sent(sent, normalizer, lang)
-            processed_sents.append(sent)
-            placeholder_entity_map_sents.append(placeholder_entity_map)
-
-        return processed_sents, placeholder_entity_map_sents
+        if self._use_text_pool(len(sents)):
+            results = self._run_text_pool(
+                _preprocess_chunk,
+                [(sents[start:end], lang) for start, end in self._chunk_bounds(len(sents))],
+            )
+            if results is not None:
+                processed_sents, placeholder_entity_map_sents = [], []
+                for chunk_sents, chunk_maps in results:
+                    processed_sents.extend(chunk_sents)
+                    placeholder_entity_map_sents.extend(chunk_maps)
+                return processed_sents, placeholder_entity_map_sents
+        return self.processor.preprocess(sents, lang)
 
     def postprocess(
         self,
@@ -413,7 +1170,8 @@ class Model:
         common_lang: str = "hin_Deva",
     ) -> List[str]:
         """
-        Postprocesses a batch of input sentences after the translation generations.
+        Postprocesses a batch of input sentences after the translation generations,
+        on the worker pool for large batches. See `TextProcessor.postprocess`.
 
         Args:
             sents (List[str]): batch of translated sentences to postprocess.
@@ -424,49 +1182,14 @@ class Model:
         Returns:
             List[str]: postprocessed batch of input sentences.
         """
-
-        lang_code, script_code = lang.split("_")
-        # SPM decode
-        for i in range(len(sents)):
-            # sent_tokens = sents[i].split(" ")
-            # sents[i] = self.sp_tgt.decode(sent_tokens)
-
-            sents[i] = sents[i].replace(" ", "").replace("▁", " ").strip()
-
-            # Fixes for Perso-Arabic scripts
-            # TODO: Move these normalizations inside indic-nlp-library
-            if script_code in {"Arab", "Aran"}:
-                # UrduHack adds space before punctuations. Since the model was trained without fixing this issue, let's fix it now
-                sents[i] = sents[i].replace(" ؟", "؟").replace(" ۔", "۔").replace(" ،", "،")
-                # Kashmiri bugfix for palatalization: https://github.com/AI4Bharat/IndicTrans2/issues/11
-                sents[i] = sents[i].replace("ٮ۪", "ؠ")
-
-        assert len(sents) == len(placeholder_entity_map)
-
-        for i in range(0, len(sents)):
-            for key in placeholder_entity_map[i].keys():
-                sents[i] = sents[i].replace(key, placeholder_entity_map[i][key])
-
-        # Detokenize and transliterate to native scripts if applicable
-        postprocessed_sents = []
-
-        if lang == "eng_Latn":
-            for sent in sents:
-                postprocessed_sents.append(self.en_detok.detokenize(sent.split(" ")))
-        else:
-            for sent in sents:
-                outstr = indic_detokenize.trivial_detokenize(
-                    self.xliterator.transliterate(
-                        sent, flores_codes[common_lang], flores_codes[lang]
-                    ),
-                    flores_codes[lang],
-                )
-                
-                # Oriya bug: indic-nlp-library produces ଯ଼ instead of ୟ when converting from Devanagari to Odia
-                # TODO: Find out what's the issue with unicode transliterator for Oriya and fix it
-                if lang_code == "ory":
-                    outstr = outstr.replace("ଯ଼", 'ୟ')
-
-                postprocessed_sents.append(outstr)
-
-        return postprocessed_sents
+        if common_lang == "hin_Deva" and self._use_text_pool(len(sents)):
+            results = self._run_text_pool(
+                _postprocess_chunk,
+                [
+                    (sents[start:end], placeholder_entity_map[start:end], lang)
+                    for start, end in self._chunk_bounds(len(sents))
+                ],
+            )
+            if results is not None:
+                return [sent for chunk in results for sent in chunk]
+        return self.processor.postprocess(sents, placeholder_entity_map, lang, common_lang)
@@ -1,4 +1,5 @@
-from typing import Tuple
+from functools import lru_cache
+from typing import List, Tuple
 import regex as re
 import sys
 from tqdm import tqdm
@@ -26,10 +27,66 @@ def normalize_indic_numerals(line: str):
     return "".join([INDIC_NUM_MAP.get(c, c) for c in line])
 
 
+# Set of Translations of "ID" in all the suppported languages have been collated.
+# This has been added to deal with edge cases where placeholders might get translated.
+INDIC_FAILURE_CASES = ['آی ڈی ', 'ꯑꯥꯏꯗꯤ', 'आईडी', 'आई . डी . ', 'ऐटि', 'آئی ڈی ', 'ᱟᱭᱰᱤ ᱾', 'आयडी', 'ऐडि', 'आइडि']
+
+# Matches "<ID1>" as well as the spaced and translated variants the model produces
+# ("< ID1 >", "<आईडी1>", "< आईडी 1 >", ...) and captures the placeholder number
+PLACEHOLDER_PATTERN = re.compile(
+    r"<\s*(?:ID|{})\s*(\d+)\s*>".format(
+        "|".join(
+            r"\s*".join(re.escape(part) for part in case.split())
+            for case in sorted(INDIC_FAILURE_CASES, key=len, reverse=True)
+        )
+    )
+)
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Entities shorter than this (after dropping the listed characters) are left in the text
+MIN_ENTITY_CHARS = 4
+SHORT_ENTITY_STRIP_CHARS = {
+    # Avoids false positive URL matches for names with initials.
+    URL_PATTERN: ".",
+    # Short numeral patterns do not need placeholder based handling.
+    NUMERAL_PATTERN: " .:",
+}
+
+
+@lru_cache(maxsize=8)
+def compile_entity_patterns(patterns: Tuple[str, ...]) -> Tuple[re.Pattern, List[re.Pattern]]:
+    """
+    Compiles the entity patterns into a single alternation (earlier patterns take priority
+    at the same position) plus the individual patterns used when a match is rejected.
+
+    Args:
+        patterns (Tuple[str, ...]): entity patterns in priority order.
+
+    Returns:
+        Tuple[re.Pattern, List[re.Pattern]]: the combined pattern and the compiled patterns.
+    """
+    combined = re.compile(
+        "|".join("(?P<p{}>{})".format(i, pattern) for i, pattern in enumerate(patterns))
+    )
+    return combined, [re.compile(pattern) for pattern in patterns]
+
+
+def is_short_entity(match: str, pattern: str) -> bool:
+    strip_chars = SHORT_ENTITY_STRIP_CHARS.get(pattern)
+    if strip_chars is None:
+        return False
+    return len(match.translate({ord(c): None for c in strip_chars})) < MIN_ENTITY_CHARS
+
+
 def wrap_with_placeholders(text: str, patterns: list) -> Tuple[str, dict]:
     """
     Wraps substrings with matched patterns in the given text with placeholders and returns
     the modified text along with a mapping of the placeholders to their original value.
+
+    All patterns are matched in a single scan of the text. Repeated entities share one
+    placeholder, and the mapping only holds the canonical "<ID{n}>" keys; translated or
+    spaced variants of a placeholder are resolved by `restore_placeholders`.
     
     Args:
         text (str): an input string which needs to be wrapped with the placeholders.
@@ -39,46 +96,51 @@ def wrap_with_placeholders(text: str, patterns: list) -> Tuple[str, dict]:
         Tuple[str, dict]: a tuple containing the modified text and a dictionary mapping 
             placeholders to their original values.
     """
-    serial_no = 1
-    
+    patterns = tuple(patterns)
+    combined, compiled = compile_entity_patterns(patterns)
+
     placeholder_entity_map = dict()
-    
-    for pattern in patterns:
-        matches = set(re.findall(pattern, text))
-        
-        # wrap common match with placeholder tags
-        for match in matches:
-            if pattern==URL_PATTERN :
-                #Avoids false positive URL matches for names with initials.
-                temp = match.replace(".",'')
-                if len(temp)<4:
-                    continue
-            if pattern==NUMERAL_PATTERN :
-                #Short numeral patterns do not need placeholder based handling.
-                temp = match.replace(" ",'').replace(".",'').replace(":",'')
-                if len(temp)<4:
-                    continue
-            
-            #Set of Translations of "ID" in all the suppported languages have been collated.            
-            #This has been added to deal with edge cases where placeholders might get translated. 
-            indic_failure_cases = ['آی ڈی ', 'ꯑꯥꯏꯗꯤ', 'आईडी', 'आई . डी . ', 'ऐटि', 'آئی ڈی ', 'ᱟᱭᱰᱤ ᱾', 'आयडी', 'ऐडि', 'आइडि']         
-            placeholder = "<ID{}>".format(serial_no)
-            alternate_placeholder = "< ID{} >".format(serial_no)                    
-            placeholder_entity_map[placeholder] = match
-            placeholder_entity_map[alternate_placeholder] = match
-            
-            for i in indic_failure_cases:
-                placeholder_temp = "<{}{}>".format(i,serial_no)
-                placeholder_entity_map[placeholder_temp] = match
-                placeholder_temp = "< {}{} >".format(i, serial_no)
-                placeholder_entity_map[placeholder_temp] = match
-                placeholder_temp = "< {} {} >".format(i, serial_no)
-                placeholder_entity_map[placeholder_temp] = match
-            
-            text = text.replace(match, placeholder)
-            serial_no+=1
-    
-    text = re.sub("\s+", " ", text)
+    entity_placeholders = dict()
+    pieces = []
+    last = pos = 0
+
+    while True:
+        match = combined.search(text, pos)
+        if match is None:
+            break
+
+        start = match.start()
+        index = int(match.lastgroup[1:])
+        entity = match.group(match.lastgroup)
+        end = match.end()
+
+        if is_short_entity(entity, patterns[index]):
+            # fall back to the lower priority patterns at the same position
+            entity = None
+            for pattern, regex in zip(patterns[index + 1:], compiled[index + 1:]):
+                candidate = regex.match(text, start)
+                if candidate is not None and not is_short_entity(candidate.group(), pattern):
+                    entity, end = candidate.group(), candidate.end()
+                    break
+            if entity is None:
+                pos = start + 1
+                continue
+
+        placeholder = entity_placeholders.get(entity)
+        if placeholder is None:
+            placeholder = "<ID{}>".format(len(entity_placeholders) + 1)
+            entity_placeholders[entity] = placeholder
+            placeholder_entity_map[placeholder] = entity
+
+        pieces.append(text[last:start])
+        pieces.append(placeholder)
+        last = pos = end
+
+    if pieces:
+        pieces.append(text[last:])
+        text = "".join(pieces)
+
+    text = WHITESPACE_PATTERN.sub(" ", text)
     
     #Regex has failure cases in trailing "/" in URLs, so this is a workaround. 
     text = text.replace(">/",">")
@@ -86,6 +148,27 @@ def wrap_with_placeholders(text: str, patterns: list) -> Tuple[str, dict]:
     return text, placeholder_entity_map
 
 
+def restore_placeholders(text: str, placeholder_entity_map: dict) -> str:
+    """
+    Replaces the placeholders (including their translated or spaced variants) in a
+    translated string with the original entity values in a single pass.
+
+    Args:
+        text (str): translated string containing placeholders.
+        placeholder_entity_map (dict): mapping of "<ID{n}>" placeholders to their original values.
+
+    Returns:
+        str: the string with every known placeholder restored.
+    """
+    if not placeholder_entity_map:
+        return text
+
+    def replace(match):
+        return placeholder_entity_map.get("<ID{}>".format(match.group(1)), match.group(0))
+
+    return PLACEHOLDER_PATTERN.sub(replace, text)
+
+
 def normalize(text: str, patterns: list = [EMAIL_PATTERN, URL_PATTERN, NUMERAL_PATTERN, OTHER_PATTERN]) -> Tuple[str, dict]:
     """
     Normalizes and wraps the spans of input string with placeholder tags. It first normalizes
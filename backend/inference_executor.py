@@ -0,0 +1,90 @@
+"""
+Bounded worker executor for model inference
+Keeps tokenization and generation off the asyncio event loop and applies backpressure
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceOverloadedError(RuntimeError):
+    """Raised when the inference queue is full and new work is rejected"""
+
+
+class InferenceTimeoutError(TimeoutError):
+    """Raised when a request waited longer than the inference timeout"""
+
+
+class InferenceExecutor:
+    """Runs blocking inference calls on a fixed-size thread pool with a pending-work limit"""
+
+    def __init__(self, max_workers: int = 1, max_pending: int = 32):
+        """
+        Args:
+            max_workers: Number of inference threads (concurrent generate calls)
+            max_pending: Maximum number of queued plus running jobs before new work is rejected
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="inference")
+        self._lock = threading.Lock()
+
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def is_saturated(self) -> bool:
+        """Whether new work would be rejected"""
+        return self.pending >= self.max_pending
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking function on the inference pool
+
+        Args:
+            fn: Blocking callable (e.g. tokenization + model.generate)
+
+        Returns:
+            The callable's result
+
+        Raises:
+            InferenceOverloadedError: If max_pending jobs are already queued or running
+        """
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise InferenceOverloadedError(
+                    f"Inference queue is full ({self.pending}/{self.max_pending} jobs pending)"
+                )
+            self.pending += 1
+
+        loop = asyncio.get_running_loop()
+        future = self._executor.submit(functools.partial(fn, *args, **kwargs))
+        # Release the slot when the job really finishes, even if the caller stopped waiting
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def _release(self, _future):
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return pool size, pending work and rejection counters"""
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self):
+        """Stop accepting work and let running jobs finish in the background"""
+        self._executor.shutdown(wait=False)
@@ -3,16 +3,24 @@ FastAPI backend for Multi-Lingual Product Catalog Translator
 Uses IndicTrans2 by AI4Bharat for translation between Indian languages
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional, List, Dict
+import asyncio
+import functools
 import uvicorn
 import logging
+import os
 from datetime import datetime
 
 from translation_service import TranslationService
+from inference_executor import InferenceOverloadedError, InferenceTimeoutError
 from database import DatabaseManager
+from write_behind import TranslationWriteBehind
+from retention import RetentionJob
+from export import EXPORT_FORMATS, PYARROW_AVAILABLE, stream_export
 from models import (
     LanguageDetectionRequest,
     LanguageDetectionResponse,
@@ -20,7 +28,11 @@ from models import (
     TranslationResponse,
     CorrectionRequest,
     CorrectionResponse,
-    TranslationHistory
+    TranslationHistory,
+    TranslationSearchResult,
+    ProductTranslationRequest,
+    ProductTranslationResponse,
+    TranslatedProductCatalogItem
 )
 
 # Configure logging
@@ -41,20 +53,61 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Content-Disposition"],
 )
 
 # Initialize services
-translation_service = TranslationService()
 db_manager = DatabaseManager()
+translation_service = TranslationService(db_manager=db_manager)
+write_behind = TranslationWriteBehind(
+    db_manager,
+    enabled=os.getenv("WRITE_BEHIND_ENABLED", "true").lower() == "true",
+    max_batch_size=int(os.getenv("WRITE_BEHIND_BATCH_SIZE", "256")),
+    flush_interval_ms=float(os.getenv("WRITE_BEHIND_FLUSH_MS", "50")),
+    id_block_size=int(os.getenv("WRITE_BEHIND_ID_BLOCK", "1000")),
+    spill_path=os.getenv("WRITE_BEHIND_SPILL_PATH") or os.path.join(
+        os.path.dirname(os.path.abspath(db_manager.db_path)), "write_behind_spill.jsonl"
+    )
+)
+retention_enabled = os.getenv("RETENTION_ENABLED", "false").lower() == "true"
+partition_rollover_enabled = os.getenv("PARTITION_ROLLOVER_ENABLED", "false").lower() == "true"
+retention_job = RetentionJob(
+    db_manager,
+    retention_days=int(os.getenv("RETENTION_DAYS", "90")),
+    interval_seconds=float(os.getenv("RETENTION_INTERVAL_HOURS", "24")) * 3600,
+    chunk_size=int(os.getenv("RETENTION_CHUNK_SIZE", "1000")),
+    pause_ms=float(os.getenv("RETENTION_PAUSE_MS", "50")),
+    archive_dir=os.getenv("RETENTION_ARCHIVE_DIR") or None,
+    delete_expired=retention_enabled,
+    rollover=partition_rollover_enabled
+)
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup"""
     logger.info("Starting Multi-Lingual Catalog Translator API...")
     db_manager.initialize_database()
+    write_behind.start()
     await translation_service.load_models()
+    translation_service.warm_up_cache(limit=int(os.getenv("CACHE_WARMUP_ROWS", "1000")))
+    # Index history in the background; lookups serve whatever is loaded so far
+    tm_max_entries = int(os.getenv("TM_MAX_ENTRIES", "200000"))
+    asyncio.get_running_loop().run_in_executor(
+        None, translation_service.load_translation_memory, tm_max_entries or None
+    )
+    if retention_enabled or partition_rollover_enabled:
+        retention_job.start()
     logger.info("API startup complete!")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release background resources on shutdown"""
+    logger.info("Shutting down Multi-Lingual Catalog Translator API...")
+    await translation_service.close()
+    await retention_job.close()
+    write_behind.close()
+    db_manager.close()
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -62,7 +115,34 @@ async def root():
         "message": "Multi-Lingual Product Catalog Translator API",
         "status": "healthy",
         "version": "1.0.0",
-        "supported_languages": translation_service.get_supported_languages()
+        "supported_languages": translation_service.get_supported_languages(),
+        "models": translation_service.get_readiness()
+    }
+
+@app.get("/ready")
+async def readiness(direction: Optional[str] = None):
+    """
+    Readiness check with per-direction model state
+    
+    Args:
+        direction: Optional direction ("en-indic" or "indic-en") that must be loaded
+        
+    Returns:
+        Readiness of the service and each direction; 503 if the requested direction is not loaded
+    """
+    directions = translation_service.get_readiness()
+    storage = write_behind.get_health()
+    
+    if direction is not None:
+        if direction not in directions:
+            raise HTTPException(status_code=404, detail=f"Unknown direction: {direction}")
+        if not directions[direction]["ready"]:
+            raise HTTPException(status_code=503, detail=f"{direction} model is {directions[direction]['state']}")
+    
+    return {
+        "ready": translation_service.model_loaded and storage["healthy"],
+        "directions": directions,
+        "storage": storage
     }
 
 @app.post("/detect-language", response_model=LanguageDetectionResponse)
@@ -120,14 +200,14 @@ async def translate_text(request: TranslationRequest):
             target_lang=request.target_language
         )
         
-        # Store translation in database
-        translation_id = db_manager.store_translation(
-            original_text=request.text,
-            translated_text=translation_result['translated_text'],
-            source_language=request.source_language,
-            target_language=request.target_language,
-            model_confidence=translation_result.get('confidence', 0.0)
-        )
+        # Queue translation for storage; the ID is assigned without waiting for the commit
+        translation_id = (await asyncio.get_running_loop().run_in_executor(None, write_behind.submit, [{
+            "original_text": request.text,
+            "translated_text": translation_result['translated_text'],
+            "source_language": request.source_language,
+            "target_language": request.target_language,
+            "model_confidence": translation_result.get('confidence', 0.0)
+        }]))[0]
         
         logger.info(f"Translation completed. ID: {translation_id}")
         
@@ -139,10 +219,101 @@ async def translate_text(request: TranslationRequest):
             translation_id=translation_id
         )
         
+    except InferenceOverloadedError as e:
+        logger.warning(f"Translation rejected: {str(e)}")
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
+    except InferenceTimeoutError as e:
+        logger.error(f"Translation timed out: {str(e)}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"Translation error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
 
+@app.post("/translate-product", response_model=ProductTranslationResponse)
+async def translate_product(request: ProductTranslationRequest):
+    """
+    Translate all fields of a product into several languages at once
+    
+    Args:
+        request: Product catalog item, target languages and optional source language
+        
+    Returns:
+        One translated product item per target language
+    """
+    try:
+        item = request.item
+        
+        # Auto-detect source language if not provided
+        source_language = request.source_language
+        if not source_language:
+            detection_result = await translation_service.detect_language(f"{item.title}\n{item.description}")
+            source_language = detection_result['language']
+            logger.info(f"Auto-detected source language: {source_language}")
+        
+        fields = [("title", item.title), ("description", item.description)]
+        if item.category:
+            fields.append(("category", item.category))
+        
+        target_languages = [
+            target for target in dict.fromkeys(request.target_languages) if target != source_language
+        ]
+        logger.info(f"Product translation request: {source_language} -> {target_languages} ({len(fields)} fields)")
+        
+        # All fields and languages share the same model batches
+        results = await translation_service.translate_multi(
+            [text for _, text in fields],
+            source_lang=source_language,
+            target_langs=target_languages
+        )
+        
+        # Queue every row; they are committed together by the write-behind buffer
+        records = [
+            {
+                "original_text": text,
+                "translated_text": result['translated_text'],
+                "source_language": source_language,
+                "target_language": target_language,
+                "model_confidence": result.get('confidence', 0.0)
+            }
+            for target_language in target_languages
+            for (_, text), result in zip(fields, results[target_language])
+        ]
+        translation_ids = iter(await asyncio.get_running_loop().run_in_executor(None, write_behind.submit, records))
+        
+        translations = []
+        for target_language in target_languages:
+            translated = {}
+            ids = {}
+            confidences = {}
+            for (field, _), result in zip(fields, results[target_language]):
+                translated[field] = result['translated_text']
+                ids[field] = next(translation_ids)
+                confidences[field] = result.get('confidence', 0.0)
+            
+            translations.append(TranslatedProductCatalogItem(
+                original_item=item,
+                translated_title=translated["title"],
+                translated_description=translated["description"],
+                translated_category=translated.get("category"),
+                source_language=source_language,
+                target_language=target_language,
+                translation_ids=ids,
+                confidence_scores=confidences
+            ))
+        
+        logger.info(f"Product translation completed for {len(translations)} languages")
+        return ProductTranslationResponse(translations=translations)
+        
+    except InferenceOverloadedError as e:
+        logger.warning(f"Product translation rejected: {str(e)}")
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
+    except InferenceTimeoutError as e:
+        logger.error(f"Product translation timed out: {str(e)}")
+        raise HTTPException(status_code=504, detail=str(e))
+    except Exception as e:
+        logger.error(f"Product translation error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Product translation failed: {str(e)}")
+
 @app.post("/submit-correction", response_model=CorrectionResponse)
 async def submit_correction(request: CorrectionRequest):
     """
@@ -157,15 +328,36 @@ async def submit_correction(request: CorrectionRequest):
     try:
         logger.info(f"Correction submission for translation ID: {request.translation_id}")
         
+        # The translation may still be waiting in the write-behind buffer
+        await asyncio.get_running_loop().run_in_executor(None, write_behind.flush)
+        
         # Store correction in database
-        correction_id = db_manager.store_correction(
-            translation_id=request.translation_id,
-            corrected_text=request.corrected_text,
-            feedback=request.feedback
+        correction_id = await asyncio.get_running_loop().run_in_executor(
+            None, db_manager.store_correction, request.translation_id, request.corrected_text, request.feedback
         )
         
         logger.info(f"Correction stored with ID: {correction_id}")
         
+        # The cached machine translation is superseded by the correction
+        translation = await asyncio.get_running_loop().run_in_executor(
+            None, db_manager.get_translation_by_id, request.translation_id
+        )
+        if translation:
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                translation_service.invalidate_cached_translation,
+                translation["original_text"],
+                translation["source_language"],
+                translation["target_language"]
+            )
+            translation_service.remember_correction(
+                translation["original_text"],
+                request.corrected_text,
+                translation["source_language"],
+                translation["target_language"],
+                translation_id=request.translation_id
+            )
+        
         return CorrectionResponse(
             correction_id=correction_id,
             message="Correction submitted successfully",
@@ -177,25 +369,225 @@ async def submit_correction(request: CorrectionRequest):
         raise HTTPException(status_code=500, detail=f"Failed to submit correction: {str(e)}")
 
 @app.get("/history", response_model=List[TranslationHistory])
-async def get_translation_history(limit: int = 50, offset: int = 0):
+async def get_translation_history(
+    response: Response,
+    limit: int = 50,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    source_language: Optional[str] = None,
+    target_language: Optional[str] = None
+):
     """
     Get translation history
     
     Args:
         limit: Maximum number of records to return
-        offset: Number of records to skip
+        offset: Number of records to skip (prefer cursor for deep pages)
+        cursor: Value of the previous page's X-Next-Cursor header
+        source_language: Filter by source language
+        target_language: Filter by target language
         
     Returns:
-        List of translation history records
+        List of translation history records; X-Next-Cursor is set when more pages may follow
     """
     try:
-        history = db_manager.get_translation_history(limit=limit, offset=offset)
+        await asyncio.get_running_loop().run_in_executor(None, write_behind.flush)
+        history = await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+            db_manager.get_translation_history,
+            limit=limit,
+            offset=offset,
+            source_language=source_language,
+            target_language=target_language,
+            cursor=cursor
+        ))
+        
+        if len(history) == limit and history:
+            response.headers["X-Next-Cursor"] = db_manager.encode_history_cursor(history[-1])
+        
         return [TranslationHistory(**record) for record in history]
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"History retrieval error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Failed to retrieve history: {str(e)}")
 
+@app.get("/history/search", response_model=List[TranslationSearchResult])
+async def search_translation_history(
+    q: str,
+    source_language: Optional[str] = None,
+    target_language: Optional[str] = None,
+    field: str = "both",
+    prefix: bool = False,
+    limit: int = 50
+):
+    """
+    Full-text search over translation history
+    
+    Args:
+        q: Words to look for; all of them must match
+        source_language: Filter by source language
+        target_language: Filter by target language
+        field: Columns to search: original, translated or both
+        prefix: Treat the last word as a prefix
+        limit: Maximum number of results
+        
+    Returns:
+        Matching translation records, best matches first
+    """
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, write_behind.flush)
+        results = await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+            db_manager.search_translations,
+            q,
+            source_language=source_language,
+            target_language=target_language,
+            field=field,
+            prefix=prefix,
+            limit=limit
+        ))
+        return [TranslationSearchResult(**record) for record in results]
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"History search error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to search history: {str(e)}")
+
+@app.get("/export")
+async def export_translations(
+    format: str = "jsonl",
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    source_language: Optional[str] = None,
+    target_language: Optional[str] = None,
+    corrected_only: bool = False
+):
+    """
+    Stream translation + correction pairs for fine-tuning
+    
+    Rows are read in keyset batches and written out as they arrive, so the
+    export runs in constant memory whatever the date range.
+    
+    Args:
+        format: jsonl, csv or parquet
+        start_date: First day to include (YYYY-MM-DD)
+        end_date: Last day to include (YYYY-MM-DD)
+        source_language: Filter by source language
+        target_language: Filter by target language
+        corrected_only: Only export translations that have a correction
+        
+    Returns:
+        Chunked file download, oldest translations first
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported export format: {format}")
+    if format == "parquet" and not PYARROW_AVAILABLE:
+        raise HTTPException(status_code=501, detail="Parquet export requires pyarrow")
+    try:
+        for value in (start_date, end_date):
+            if value:
+                datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Dates must use the YYYY-MM-DD format")
+    
+    # Include translations still waiting in the write-behind buffer
+    await asyncio.get_running_loop().run_in_executor(None, write_behind.flush)
+    
+    records = db_manager.iter_export(
+        start_date=start_date,
+        end_date=end_date,
+        source_language=source_language,
+        target_language=target_language,
+        corrected_only=corrected_only
+    )
+    media_type, extension = EXPORT_FORMATS[format]
+    filename = f"translations-{start_date or 'all'}-{end_date or datetime.utcnow().strftime('%Y-%m-%d')}.{extension}"
+    return StreamingResponse(
+        stream_export(records, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@app.get("/statistics")
+async def get_statistics(days: int = 30):
+    """
+    Get translation statistics from the incrementally maintained counters
+    
+    Args:
+        days: Number of most recent days in the daily series
+        
+    Returns:
+        Totals, per-language-pair counts and daily activity
+    """
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(db_manager.get_statistics, days=days)
+        )
+        
+    except Exception as e:
+        logger.error(f"Statistics retrieval error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve statistics: {str(e)}")
+
+@app.get("/partitions")
+async def list_partitions():
+    """List monthly history partitions with their row counts and state"""
+    try:
+        return {"partitions": await asyncio.get_running_loop().run_in_executor(None, db_manager.list_partitions)}
+        
+    except Exception as e:
+        logger.error(f"Partition listing error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to list partitions: {str(e)}")
+
+@app.post("/partitions/rollover")
+async def roll_over_partitions():
+    """Move months older than the hot window into monthly partition files"""
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, write_behind.flush)
+        partitions = await asyncio.get_running_loop().run_in_executor(None, db_manager.roll_over_partitions)
+        return {"partitions": partitions}
+        
+    except Exception as e:
+        logger.error(f"Partition rollover error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Partition rollover failed: {str(e)}")
+
+@app.post("/partitions/{month}/detach")
+async def detach_partition(month: str, compress: bool = True):
+    """
+    Remove a monthly partition from history and statistics queries
+    
+    Args:
+        month: Partition month (YYYY-MM)
+        compress: Gzip the partition file
+    """
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, db_manager.detach_partition, month, compress
+        )
+        
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Partition detach error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to detach partition: {str(e)}")
+
+@app.post("/partitions/{month}/attach")
+async def attach_partition(month: str):
+    """
+    Bring a detached monthly partition back into queries
+    
+    Args:
+        month: Partition month (YYYY-MM)
+    """
+    try:
+        return await asyncio.get_running_loop().run_in_executor(None, db_manager.attach_partition, month)
+        
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Partition attach error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to attach partition: {str(e)}")
+
 @app.get("/supported-languages")
 async def get_supported_languages():
     """Get list of supported languages"""
@@ -204,6 +596,21 @@ async def get_supported_languages():
         "total_count": len(translation_service.get_supported_languages())
     }
 
+@app.get("/metrics")
+async def get_metrics():
+    """Get runtime metrics for tuning throughput and latency"""
+    return {
+        "batching": translation_service.get_batching_stats(),
+        "inference": translation_service.get_inference_stats(),
+        "cache": translation_service.get_cache_stats(),
+        "translation_memory": translation_service.get_translation_memory_stats(),
+        "engine": translation_service.get_engine_stats(),
+        "models": translation_service.get_model_load_stats(),
+        "database": db_manager.get_connection_stats(),
+        "write_behind": write_behind.get_stats(),
+        "retention": {"enabled": retention_enabled or partition_rollover_enabled, **retention_job.get_stats()}
+    }
+
 @app.post("/batch-translate")
 async def batch_translate(texts: List[str], target_language: str, source_language: Optional[str] = None):
     """
@@ -220,31 +627,45 @@ async def batch_translate(texts: List[str], target_language: str, source_languag
     try:
         logger.info(f"Batch translation request for {len(texts)} texts")
         
-        results = []
-        for text in texts:
-            # Auto-detect source language if not provided
-            if not source_language:
+        # Resolve the source language of every text, then group texts that share one
+        if source_language:
+            source_languages = [source_language] * len(texts)
+        else:
+            source_languages = []
+            for text in texts:
                 detection_result = await translation_service.detect_language(text)
-                detected_source = detection_result['language']
-            else:
-                detected_source = source_language
-            
-            # Perform translation
-            translation_result = await translation_service.translate(
-                text=text,
+                source_languages.append(detection_result['language'])
+        
+        groups: Dict[str, List[int]] = {}
+        for index, detected_source in enumerate(source_languages):
+            groups.setdefault(detected_source, []).append(index)
+        
+        # Translate each source-language group as one tensor-batched call
+        translation_results = [None] * len(texts)
+        for detected_source, indices in groups.items():
+            group_results = await translation_service.batch_translate(
+                [texts[i] for i in indices],
                 source_lang=detected_source,
                 target_lang=target_language
             )
-            
-            # Store translation in database
-            translation_id = db_manager.store_translation(
-                original_text=text,
-                translated_text=translation_result['translated_text'],
-                source_language=detected_source,
-                target_language=target_language,
-                model_confidence=translation_result.get('confidence', 0.0)
-            )
-            
+            for index, translation_result in zip(indices, group_results):
+                translation_results[index] = translation_result
+        
+        translation_ids = await asyncio.get_running_loop().run_in_executor(None, write_behind.submit, [
+            {
+                "original_text": text,
+                "translated_text": translation_result['translated_text'],
+                "source_language": detected_source,
+                "target_language": target_language,
+                "model_confidence": translation_result.get('confidence', 0.0)
+            }
+            for text, detected_source, translation_result in zip(texts, source_languages, translation_results)
+        ])
+        
+        results = []
+        for text, detected_source, translation_result, translation_id in zip(
+            texts, source_languages, translation_results, translation_ids
+        ):
             results.append({
                 "original_text": text,
                 "translated_text": translation_result['translated_text'],
@@ -257,6 +678,12 @@ async def batch_translate(texts: List[str], target_language: str, source_languag
         logger.info(f"Batch translation completed for {len(results)} texts")
         return {"translations": results}
         
+    except InferenceOverloadedError as e:
+        logger.warning(f"Batch translation rejected: {str(e)}")
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
+    except InferenceTimeoutError as e:
+        logger.error(f"Batch translation timed out: {str(e)}")
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"Batch translation error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Batch translation failed: {str(e)}")
@@ -0,0 +1,162 @@
+"""
+Dynamic micro-batching for translation requests
+Coalesces concurrent translate calls into shared model batches
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+BatchHandler = Callable[[str, List[Any]], Union[List[Any], Awaitable[List[Any]]]]
+
+
+class MicroBatcher:
+    """
+    Collects concurrent requests for a few milliseconds, groups them by key
+    (e.g. translation direction) and hands each group to a batch handler.
+    """
+
+    def __init__(self, handler: BatchHandler, max_batch_size: int = 8, max_wait_ms: float = 5.0):
+        """
+        Args:
+            handler: Callable receiving (key, items) and returning one result per item,
+                in the same order. May be a plain function or a coroutine function.
+            max_batch_size: Maximum number of items handed to the handler at once
+            max_wait_ms: Maximum time to wait for more items after the first one arrives
+        """
+        self.handler = handler
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+
+        # Tuning statistics
+        self._batches = 0
+        self._items = 0
+        self._recent_batch_sizes: Deque[int] = deque(maxlen=100)
+        self._per_key_batches: Dict[str, int] = {}
+
+    async def submit(self, key: str, item: Any) -> Any:
+        """
+        Queue an item for batched processing and wait for its result
+
+        Args:
+            key: Grouping key; only items with the same key share a batch
+            item: Payload passed to the handler
+
+        Returns:
+            The handler's result for this item
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = asyncio.Queue()
+
+        worker = self._workers.get(key)
+        if worker is None or worker.done():
+            self._workers[key] = loop.create_task(self._worker(key, queue))
+
+        future = loop.create_future()
+        await queue.put((item, future))
+        return await future
+
+    async def _collect(self, queue: asyncio.Queue) -> List[Tuple[Any, asyncio.Future]]:
+        """Wait for the first item, then gather more until the batch is full or the wait expires"""
+        loop = asyncio.get_running_loop()
+        batch = [await queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            # Take whatever is already queued without yielding to the loop
+            try:
+                batch.append(queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _worker(self, key: str, queue: asyncio.Queue):
+        """Process batches for a single key until cancelled"""
+        while True:
+            batch = await self._collect(queue)
+            # Callers that timed out or disconnected while queued no longer need a result
+            batch = [(item, future) for item, future in batch if not future.cancelled()]
+            if not batch:
+                continue
+            items = [item for item, _ in batch]
+            self._record_batch(key, len(batch))
+
+            try:
+                results = self.handler(key, items)
+                if asyncio.iscoroutine(results):
+                    results = await results
+                if len(results) != len(items):
+                    raise RuntimeError(
+                        f"Batch handler returned {len(results)} results for {len(items)} items"
+                    )
+            except Exception as e:
+                logger.error(f"Micro-batch for '{key}' failed: {str(e)}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def _record_batch(self, key: str, size: int):
+        """Update batch size statistics"""
+        self._batches += 1
+        self._items += size
+        self._recent_batch_sizes.append(size)
+        self._per_key_batches[key] = self._per_key_batches.get(key, 0) + 1
+
+    def queue_depth(self) -> int:
+        """Number of items waiting to be batched across all keys"""
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get batching statistics for throughput/latency tuning
+
+        Returns:
+            Dictionary with queue depth and achieved batch sizes
+        """
+        recent = list(self._recent_batch_sizes)
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000.0,
+            "queue_depth": self.queue_depth(),
+            "queue_depth_by_key": {key: queue.qsize() for key, queue in self._queues.items()},
+            "batches_processed": self._batches,
+            "items_processed": self._items,
+            "avg_batch_size": (self._items / self._batches) if self._batches else 0.0,
+            "recent_avg_batch_size": (sum(recent) / len(recent)) if recent else 0.0,
+            "last_batch_size": recent[-1] if recent else 0,
+            "batches_by_key": dict(self._per_key_batches),
+        }
+
+    async def close(self):
+        """Cancel worker tasks"""
+        for worker in self._workers.values():
+            worker.cancel()
+        for worker in self._workers.values():
+            try:
+                await worker
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._workers.clear()
@@ -0,0 +1,128 @@
+"""
+Precision conversion for Hugging Face IndicTrans2 models
+Applies fp32 / bf16 / dynamic-int8 at load time and measures resident memory
+"""
+
+import logging
+import os
+import sys
+import time
+from typing import Tuple
+
+import torch
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Supported values for MODEL_PRECISION
+MODEL_PRECISIONS = ("fp32", "bf16", "dynamic-int8")
+
+
+def resolve_precision(precision: str, device: str) -> str:
+    """
+    Validate a requested precision against the device it will run on
+
+    Args:
+        precision: Requested precision (fp32, bf16 or dynamic-int8)
+        device: "cpu" or "cuda"
+
+    Returns:
+        The precision that will actually be applied
+    """
+    if precision not in MODEL_PRECISIONS:
+        logger.warning(f"Unknown MODEL_PRECISION '{precision}', using fp32")
+        return "fp32"
+    if precision == "dynamic-int8" and device != "cpu":
+        # PyTorch dynamic quantization only has CPU kernels
+        logger.warning("dynamic-int8 is only supported on CPU, using fp32")
+        return "fp32"
+    return precision
+
+
+def apply_precision(model: torch.nn.Module, precision: str) -> torch.nn.Module:
+    """
+    Convert a loaded model to the requested precision
+
+    Args:
+        model: Model already moved to its device and set to eval mode
+        precision: fp32, bf16 or dynamic-int8
+
+    Returns:
+        The converted model (dynamic-int8 returns a new module)
+    """
+    if precision == "bf16":
+        return model.to(dtype=torch.bfloat16)
+    if precision == "dynamic-int8":
+        # Quantize Linear weights to int8; activations are quantized on the fly
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return model
+
+
+def resident_memory_mb() -> float:
+    """
+    Current resident set size of this process in MB
+
+    Reads /proc on Linux; elsewhere falls back to the peak RSS reported by getrusage.
+    """
+    try:
+        with open(f"/proc/{os.getpid()}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+
+
+def model_size_mb(model: torch.nn.Module) -> float:
+    """Size of the model's tensors (parameters, buffers and packed int8 weights) in MB"""
+    total = 0
+    for value in model.state_dict().values():
+        if isinstance(value, torch.Tensor):
+            total += value.numel() * value.element_size()
+        elif isinstance(value, tuple):
+            # Dynamic-quantized Linear layers store (packed weight, bias) tuples
+            total += sum(t.numel() * t.element_size() for t in value if isinstance(t, torch.Tensor))
+    return total / (1024.0 * 1024.0)
+
+
+def load_seq2seq_model(path: str, device: str, precision: str) -> Tuple[object, torch.nn.Module, dict]:
+    """
+    Load an IndicTrans2 tokenizer/model pair and convert it to the requested precision
+
+    Args:
+        path: Hugging Face checkpoint directory
+        device: "cpu" or "cuda"
+        precision: fp32, bf16 or dynamic-int8 (see resolve_precision)
+
+    Returns:
+        Tuple of (tokenizer, model, load statistics)
+    """
+    from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+
+    rss_before = resident_memory_mb()
+    start = time.perf_counter()
+
+    tokenizer = AutoTokenizer.from_pretrained(path, trust_remote_code=True)
+    model = AutoModelForSeq2SeqLM.from_pretrained(path, trust_remote_code=True)
+    model.to(device)
+    model.eval()
+    model = apply_precision(model, precision)
+
+    stats = {
+        "precision": precision,
+        "load_seconds": round(time.perf_counter() - start, 2),
+        "model_size_mb": round(model_size_mb(model), 1),
+        "rss_mb": round(resident_memory_mb(), 1),
+    }
+    stats["rss_delta_mb"] = round(stats["rss_mb"] - rss_before, 1)
+    return tokenizer, model, stats
@@ -123,6 +123,11 @@ class TranslationHistory(BaseModel):
             }
         }
 
+class TranslationSearchResult(TranslationHistory):
+    """Model for a full-text search hit in translation history"""
+    score: float = Field(..., description="Relevance score (higher is better)")
+    snippet: Optional[str] = Field(None, description="Matching text with hits in [brackets]")
+
 class BatchTranslationRequest(BaseModel):
     """Request model for batch translation"""
     texts: List[str] = Field(..., description="List of texts to translate", min_items=1)
@@ -170,6 +175,7 @@ class TranslatedProductCatalogItem(BaseModel):
     source_language: str
     target_language: str
     translation_ids: dict = Field(..., description="Map of field names to translation IDs")
+    confidence_scores: dict = Field(default_factory=dict, description="Map of field names to confidence scores")
     
     class Config:
         schema_extra = {
@@ -188,10 +194,38 @@ class TranslatedProductCatalogItem(BaseModel):
                     "title": 12345,
                     "description": 12346,
                     "category": 12347
+                },
+                "confidence_scores": {
+                    "title": 0.92,
+                    "description": 0.92,
+                    "category": 0.92
                 }
             }
         }
 
+class ProductTranslationRequest(BaseModel):
+    """Request model for translating one product into several languages"""
+    item: ProductCatalogItem
+    target_languages: List[str] = Field(..., description="Target language codes", min_items=1)
+    source_language: Optional[str] = Field(None, description="Source language code (auto-detect if not provided)")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "item": {
+                    "title": "शुद्ध कपास की साड़ी",
+                    "description": "यह एक सुंदर पारंपरिक साड़ी है।",
+                    "category": "वस्त्र"
+                },
+                "target_languages": ["en", "ta", "bn"],
+                "source_language": "hi"
+            }
+        }
+
+class ProductTranslationResponse(BaseModel):
+    """Response model for product translation into several languages"""
+    translations: List[TranslatedProductCatalogItem] = Field(..., description="One translated item per target language")
+
 # Language mapping for Indian languages supported by IndicTrans2
 SUPPORTED_LANGUAGES = {
     "as": "Assamese",
@@ -0,0 +1,418 @@
+"""
+Monthly partitions for translation history
+Moves months older than the hot window into their own SQLite files, tracked in a catalog table
+"""
+
+import gzip
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Same columns as the main tables, so rows can be copied with SELECT *
+PARTITION_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS {alias}.translations (
+        id INTEGER PRIMARY KEY,
+        original_text TEXT NOT NULL,
+        translated_text TEXT NOT NULL,
+        source_language TEXT NOT NULL,
+        target_language TEXT NOT NULL,
+        model_confidence REAL DEFAULT 0.0,
+        created_at TIMESTAMP,
+        updated_at TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS {alias}.corrections (
+        id INTEGER PRIMARY KEY,
+        translation_id INTEGER NOT NULL,
+        corrected_text TEXT NOT NULL,
+        feedback TEXT,
+        created_at TIMESTAMP
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS {alias}.idx_translations_created ON translations (created_at)",
+    """
+    CREATE INDEX IF NOT EXISTS {alias}.idx_translations_pair_created
+    ON translations (source_language, target_language, created_at)
+    """,
+    "CREATE INDEX IF NOT EXISTS {alias}.idx_corrections_translation ON corrections (translation_id)",
+]
+
+
+def month_start(month: str) -> str:
+    """'YYYY-MM' -> 'YYYY-MM-01 00:00:00'"""
+    return f"{month}-01 00:00:00"
+
+
+def next_month(month: str) -> str:
+    """'YYYY-MM' -> the following 'YYYY-MM'"""
+    year, mon = int(month[:4]), int(month[5:7])
+    return f"{year + mon // 12:04d}-{mon % 12 + 1:02d}"
+
+
+class HistoryPartitions:
+    """Catalog and file management for monthly history partitions"""
+
+    def __init__(self, partition_dir: str, hot_months: int = 2, chunk_size: int = 5000,
+                 search_index_sql: Optional[str] = None):
+        """
+        Args:
+            partition_dir: Directory holding one SQLite file per archived month
+            hot_months: Number of most recent calendar months kept in the main database
+            chunk_size: Rows moved per transaction during rollover
+            search_index_sql: CREATE statement (with an {alias} placeholder) for the
+                full-text index built into each partition file
+        """
+        self.partition_dir = partition_dir
+        self.hot_months = max(1, hot_months)
+        self.chunk_size = max(1, chunk_size)
+        self.search_index_sql = search_index_sql
+
+    def create_catalog(self, conn: sqlite3.Connection):
+        """Create the partition catalog in the main database"""
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS history_partitions (
+                month TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                state TEXT NOT NULL DEFAULT 'attached',
+                compressed INTEGER NOT NULL DEFAULT 0,
+                row_count INTEGER NOT NULL DEFAULT 0,
+                min_id INTEGER,
+                max_id INTEGER,
+                first_created_at TEXT,
+                last_created_at TEXT,
+                stats TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+    def hot_boundary(self, now: Optional[datetime] = None) -> str:
+        """Timestamp before which rows belong in a partition"""
+        now = now or datetime.utcnow()
+        index = now.year * 12 + now.month - 1 - (self.hot_months - 1)
+        return month_start(f"{index // 12:04d}-{index % 12 + 1:02d}")
+
+    def list(self, conn: sqlite3.Connection, state: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Catalog entries, newest month first"""
+        query = "SELECT * FROM history_partitions"
+        params = []
+        if state:
+            query += " WHERE state = ?"
+            params.append(state)
+        rows = conn.execute(query + " ORDER BY month DESC", params).fetchall()
+        return [
+            {**dict(row), "stats": json.loads(row["stats"]) if row["stats"] else {}}
+            for row in rows
+        ]
+
+    def has_attached(self, conn: sqlite3.Connection) -> bool:
+        return conn.execute(
+            "SELECT 1 FROM history_partitions WHERE state = 'attached' LIMIT 1"
+        ).fetchone() is not None
+
+    @staticmethod
+    def has_search_index(conn: sqlite3.Connection) -> bool:
+        """Whether a partition file carries the full-text index"""
+        return conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'translations_fts'"
+        ).fetchone() is not None
+
+    @contextmanager
+    def open(self, partition: Dict[str, Any]) -> Iterator[sqlite3.Connection]:
+        """Read-only connection to an attached partition file"""
+        conn = sqlite3.connect(Path(partition["path"]).absolute().as_uri() + "?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def roll_over(self, conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+        """
+        Move every month older than the hot window out of the main database
+
+        Args:
+            conn: Connection to the main database (not inside a transaction)
+
+        Returns:
+            Catalog entries of the partitions that received rows
+        """
+        boundary = self.hot_boundary()
+        months = [
+            row[0] for row in conn.execute(
+                "SELECT DISTINCT substr(created_at, 1, 7) FROM translations WHERE created_at < ?",
+                (boundary,)
+            )
+        ]
+
+        updated = []
+        for month in sorted(months):
+            entry = self._move_month(conn, month)
+            if entry is not None:
+                updated.append(entry)
+        return updated
+
+    def _move_month(self, conn: sqlite3.Connection, month: str) -> Optional[Dict[str, Any]]:
+        """Copy one month into its partition file in chunks, deleting it from the main tables"""
+        existing = conn.execute("SELECT * FROM history_partitions WHERE month = ?", (month,)).fetchone()
+        if existing is not None and existing["state"] != "attached":
+            logger.warning(f"Partition {month} is detached; leaving its late rows in the hot table")
+            return None
+
+        os.makedirs(self.partition_dir, exist_ok=True)
+        path = existing["path"] if existing else os.path.join(
+            self.partition_dir, f"translations_{month.replace('-', '_')}.db"
+        )
+        start, end = month_start(month), month_start(next_month(month))
+        # Exact IDs of the oldest chunk_size rows of the month. Write-behind reserves IDs in
+        # blocks, so IDs do not follow created_at and an ID range could span any number of rows.
+        # Re-evaluated by every statement; stable because BEGIN IMMEDIATE blocks other writers.
+        chunk_ids = """
+            SELECT id FROM main.translations
+            WHERE created_at >= ? AND created_at < ?
+            ORDER BY created_at, id
+            LIMIT ?
+        """
+        params = (start, end, self.chunk_size)
+
+        conn.execute("ATTACH DATABASE ? AS part", (path,))
+        try:
+            # Partition files are written once, so a rollback journal keeps them single-file
+            conn.execute("PRAGMA part.journal_mode=DELETE")
+            for statement in PARTITION_SCHEMA:
+                conn.execute(statement.format(alias="part"))
+            if self.search_index_sql:
+                conn.execute(self.search_index_sql.format(alias="part"))
+            conn.commit()
+
+            moved = 0
+            while True:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    if conn.execute(chunk_ids, (start, end, 1)).fetchone() is None:
+                        conn.rollback()
+                        break
+
+                    # OR REPLACE keeps a retried chunk idempotent if a previous attempt
+                    # committed the partition file but not the main database
+                    conn.execute(
+                        f"INSERT OR REPLACE INTO part.translations SELECT * FROM main.translations WHERE id IN ({chunk_ids})",
+                        params
+                    )
+                    conn.execute(f"""
+                        INSERT OR REPLACE INTO part.corrections
+                        SELECT id, translation_id, corrected_text, feedback, created_at FROM main.corrections
+                        WHERE translation_id IN ({chunk_ids})
+                    """, params)
+                    conn.execute(f"DELETE FROM main.corrections WHERE translation_id IN ({chunk_ids})", params)
+                    moved += conn.execute(f"DELETE FROM main.translations WHERE id IN ({chunk_ids})", params).rowcount
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+
+            if self.search_index_sql:
+                # Partition files are append-only, so one rebuild after the move is enough
+                conn.execute("INSERT INTO part.translations_fts (translations_fts) VALUES ('rebuild')")
+                conn.commit()
+
+            entry = self._describe(conn, "part")
+            conn.execute("""
+                INSERT INTO history_partitions
+                (month, path, state, compressed, row_count, min_id, max_id,
+                 first_created_at, last_created_at, stats, updated_at)
+                VALUES (?, ?, 'attached', 0, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT (month) DO UPDATE SET
+                    row_count = excluded.row_count,
+                    min_id = excluded.min_id,
+                    max_id = excluded.max_id,
+                    first_created_at = excluded.first_created_at,
+                    last_created_at = excluded.last_created_at,
+                    stats = excluded.stats,
+                    updated_at = CURRENT_TIMESTAMP
+            """, (
+                month, path, entry["row_count"], entry["min_id"], entry["max_id"],
+                entry["first_created_at"], entry["last_created_at"], json.dumps(entry["stats"])
+            ))
+            conn.commit()
+        finally:
+            conn.execute("DETACH DATABASE part")
+
+        logger.info(f"Rolled {moved} translations into partition {month}")
+        return {"month": month, "path": path, "moved": moved, **entry}
+
+    def _describe(self, conn: sqlite3.Connection, alias: str) -> Dict[str, Any]:
+        """Bounds and statistics of a partition, stored in the catalog so reads never open the file"""
+        bounds = conn.execute(f"""
+            SELECT COUNT(*), MIN(id), MAX(id), MIN(created_at), MAX(created_at),
+                   COALESCE(SUM(model_confidence), 0.0)
+            FROM {alias}.translations
+        """).fetchone()
+        corrections = conn.execute(f"SELECT COUNT(*) FROM {alias}.corrections").fetchone()[0]
+        pairs = conn.execute(f"""
+            SELECT source_language, target_language, COUNT(*)
+            FROM {alias}.translations
+            GROUP BY source_language, target_language
+        """).fetchall()
+        daily = conn.execute(f"""
+            SELECT day, SUM(translations), SUM(corrections) FROM (
+                SELECT date(created_at) AS day, COUNT(*) AS translations, 0 AS corrections
+                FROM {alias}.translations GROUP BY day
+                UNION ALL
+                SELECT date(created_at) AS day, 0, COUNT(*)
+                FROM {alias}.corrections GROUP BY day
+            )
+            GROUP BY day
+        """).fetchall()
+
+        return {
+            "row_count": bounds[0],
+            "min_id": bounds[1],
+            "max_id": bounds[2],
+            "first_created_at": bounds[3],
+            "last_created_at": bounds[4],
+            "stats": {
+                "translation_count": bounds[0],
+                "correction_count": corrections,
+                "confidence_sum": bounds[5],
+                "language_pairs": [[row[0], row[1], row[2]] for row in pairs],
+                "daily": [[row[0], row[1], row[2]] for row in daily],
+            },
+        }
+
+    def merge_statistics(self, conn: sqlite3.Connection, totals: Dict[str, float],
+                         pairs: Dict[tuple, int], daily: Dict[str, List[int]]):
+        """Add the catalog statistics of attached partitions to the hot counters (in place)"""
+        for partition in self.list(conn, state="attached"):
+            stats = partition["stats"]
+            totals["translation_count"] += stats.get("translation_count", 0)
+            totals["correction_count"] += stats.get("correction_count", 0)
+            totals["confidence_sum"] += stats.get("confidence_sum", 0.0)
+            for source, target, count in stats.get("language_pairs", []):
+                pairs[(source, target)] = pairs.get((source, target), 0) + count
+            for day, translations, corrections in stats.get("daily", []):
+                counts = daily.setdefault(day, [0, 0])
+                counts[0] += translations
+                counts[1] += corrections
+
+    def detach(self, conn: sqlite3.Connection, month: str, compress: bool = True) -> Dict[str, Any]:
+        """
+        Take a partition out of history and statistics queries
+
+        Args:
+            conn: Connection to the main database
+            month: Partition month ("YYYY-MM")
+            compress: Gzip the partition file after detaching it
+        """
+        partition = self._get(conn, month)
+        path = partition["path"]
+        if compress and not partition["compressed"]:
+            with open(path, "rb") as source, gzip.open(path + ".gz", "wb") as target:
+                shutil.copyfileobj(source, target)
+            os.remove(path)
+
+        with conn:
+            conn.execute("""
+                UPDATE history_partitions
+                SET state = 'detached', compressed = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE month = ?
+            """, (1 if compress or partition["compressed"] else 0, month))
+        logger.info(f"Detached partition {month}{' (compressed)' if compress else ''}")
+        return self._get(conn, month)
+
+    def attach(self, conn: sqlite3.Connection, month: str) -> Dict[str, Any]:
+        """Bring a detached partition back into queries, decompressing it if needed"""
+        partition = self._get(conn, month)
+        path = partition["path"]
+        if partition["compressed"]:
+            with gzip.open(path + ".gz", "rb") as source, open(path, "wb") as target:
+                shutil.copyfileobj(source, target)
+            os.remove(path + ".gz")
+
+        with conn:
+            conn.execute("""
+                UPDATE history_partitions
+                SET state = 'attached', compressed = 0, updated_at = CURRENT_TIMESTAMP
+                WHERE month = ?
+            """, (month,))
+        logger.info(f"Attached partition {month}")
+        return self._get(conn, month)
+
+    def drop_expired(self, conn: sqlite3.Connection, cutoff: str, archive_dir: Optional[str] = None) -> List[str]:
+        """
+        Remove partitions whose newest row is older than the cutoff
+
+        Args:
+            conn: Connection to the main database
+            cutoff: Retention cutoff timestamp
+            archive_dir: Move the (compressed) partition file here instead of deleting it
+
+        Returns:
+            Months that were dropped
+        """
+        dropped = []
+        for partition in self.list(conn):
+            if partition["last_created_at"] is None or partition["last_created_at"] >= cutoff:
+                continue
+            path = partition["path"] + (".gz" if partition["compressed"] else "")
+            if os.path.exists(path):
+                self._delete_late_corrections(conn, partition)
+                if archive_dir:
+                    os.makedirs(archive_dir, exist_ok=True)
+                    shutil.move(path, os.path.join(archive_dir, os.path.basename(path)))
+                else:
+                    os.remove(path)
+            else:
+                logger.warning(
+                    f"Partition file of {partition['month']} is missing; its late corrections stay in the main table"
+                )
+
+            with conn:
+                conn.execute("DELETE FROM history_partitions WHERE month = ?", (partition["month"],))
+            dropped.append(partition["month"])
+            logger.info(f"Dropped expired partition {partition['month']}")
+        return dropped
+
+    @contextmanager
+    def _readable_path(self, partition: Dict[str, Any]) -> Iterator[str]:
+        """Path of an uncompressed copy of the partition file (a temporary one if it is gzipped)"""
+        if not partition["compressed"]:
+            yield partition["path"]
+            return
+        handle, temp_path = tempfile.mkstemp(suffix=".db", dir=self.partition_dir)
+        try:
+            with gzip.open(partition["path"] + ".gz", "rb") as source, os.fdopen(handle, "wb") as target:
+                shutil.copyfileobj(source, target)
+            yield temp_path
+        finally:
+            os.remove(temp_path)
+
+    def _delete_late_corrections(self, conn: sqlite3.Connection, partition: Dict[str, Any]):
+        """
+        Delete corrections submitted after rollover (they stay in the main table) for the
+        translations of a partition, matched by the exact IDs stored in its file; ID
+        bounds of different months can overlap.
+        """
+        with self._readable_path(partition) as path:
+            conn.execute("ATTACH DATABASE ? AS part", (path,))
+            try:
+                with conn:
+                    conn.execute("DELETE FROM main.corrections WHERE translation_id IN (SELECT id FROM part.translations)")
+            finally:
+                conn.execute("DETACH DATABASE part")
+
+    def _get(self, conn: sqlite3.Connection, month: str) -> Dict[str, Any]:
+        row = conn.execute("SELECT * FROM history_partitions WHERE month = ?", (month,)).fetchone()
+        if row is None:
+            raise KeyError(f"Unknown partition: {month}")
+        return {**dict(row), "stats": json.loads(row["stats"]) if row["stats"] else {}}
@@ -0,0 +1,206 @@
+"""
+Scheduled retention for translation history
+Rolls old months into partitions and deletes expired rows in short chunked transactions,
+optionally archiving them first
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RetentionJob:
+    """Periodically removes translations older than the retention window"""
+
+    def __init__(
+        self,
+        db_manager,
+        retention_days: int = 90,
+        interval_seconds: float = 24 * 3600,
+        chunk_size: int = 1000,
+        pause_ms: float = 50.0,
+        archive_dir: Optional[str] = None,
+        delete_expired: bool = True,
+        rollover: bool = False
+    ):
+        """
+        Args:
+            db_manager: DatabaseManager that owns the translations table
+            retention_days: Translations older than this many days expire
+            interval_seconds: Time between scheduled runs
+            chunk_size: Translations deleted per transaction
+            pause_ms: Pause between chunks so other writers can take the lock
+            archive_dir: Directory for gzip JSONL archives of expired rows (None disables archiving)
+            delete_expired: Delete rows and partitions older than retention_days
+            rollover: Move months older than the hot window into monthly partitions first
+        """
+        self.db_manager = db_manager
+        self.retention_days = retention_days
+        self.interval_seconds = interval_seconds
+        self.chunk_size = max(1, chunk_size)
+        self.pause = max(0.0, pause_ms) / 1000.0
+        self.archive_dir = archive_dir
+        self.delete_expired = delete_expired
+        self.rollover = rollover
+
+        self._task: Optional[asyncio.Task] = None
+        self._stop = threading.Event()
+        self._run_lock = threading.Lock()
+
+        self.runs = 0
+        self.running = False
+        self.total_deleted_translations = 0
+        self.total_deleted_corrections = 0
+        self.last_run: Dict[str, Any] = {}
+        self.current_run: Dict[str, Any] = {}
+        self.last_error: Optional[str] = None
+
+    def start(self):
+        """Schedule periodic runs on the running event loop"""
+        if self._task is None or self._task.done():
+            self._stop.clear()
+            self._task = asyncio.get_running_loop().create_task(self._schedule())
+            logger.info(
+                f"Retention job scheduled every {self.interval_seconds:.0f}s "
+                f"(keep {self.retention_days} days, chunk {self.chunk_size})"
+            )
+
+    async def _schedule(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                await loop.run_in_executor(None, self.run_once)
+            except Exception as e:
+                logger.error(f"Retention run failed: {str(e)}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def run_once(self) -> Dict[str, Any]:
+        """
+        Roll old months into partitions (if enabled), then delete every expired
+        translation one chunk per transaction and drop expired partitions
+
+        Returns:
+            Summary of the run (deleted counts, chunks, duration, archive file)
+        """
+        if not self._run_lock.acquire(blocking=False):
+            logger.info("Retention run already in progress, skipping")
+            return self.current_run
+
+        cutoff = (datetime.utcnow() - timedelta(days=self.retention_days)).strftime("%Y-%m-%d %H:%M:%S")
+        archive_file = None
+        archive_path = None
+        if self.archive_dir:
+            os.makedirs(self.archive_dir, exist_ok=True)
+            archive_path = os.path.join(
+                self.archive_dir, f"translations-{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}.jsonl.gz"
+            )
+
+        def write_archive(rows: List[Dict[str, Any]]):
+            nonlocal archive_file
+            if archive_file is None:
+                archive_file = gzip.open(archive_path, "at", encoding="utf-8")
+            for row in rows:
+                archive_file.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+            # The chunk is only deleted once its archive lines reached the file
+            archive_file.flush()
+
+        start = time.perf_counter()
+        self.running = True
+        self.current_run = {
+            "cutoff": cutoff,
+            "started_at": datetime.utcnow().isoformat(),
+            "chunks": 0,
+            "deleted_translations": 0,
+            "deleted_corrections": 0,
+            "archive_file": None,
+            "partitions_rolled": [],
+            "partitions_dropped": [],
+        }
+        try:
+            if self.rollover:
+                self.current_run["partitions_rolled"] = [
+                    partition["month"] for partition in self.db_manager.roll_over_partitions()
+                ]
+
+            while self.delete_expired and not self._stop.is_set():
+                translations, corrections = self.db_manager.delete_expired_chunk(
+                    cutoff,
+                    self.chunk_size,
+                    archive=write_archive if archive_path else None
+                )
+                if translations == 0:
+                    break
+
+                self.current_run["chunks"] += 1
+                self.current_run["deleted_translations"] += translations
+                self.current_run["deleted_corrections"] += corrections
+                self.total_deleted_translations += translations
+                self.total_deleted_corrections += corrections
+
+                # Yield the write lock to request-path writers between chunks
+                self._stop.wait(self.pause)
+
+            if self.delete_expired and not self._stop.is_set():
+                self.current_run["partitions_dropped"] = self.db_manager.drop_expired_partitions(
+                    cutoff, self.archive_dir
+                )
+
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            logger.error(f"Retention run stopped: {str(e)}")
+            raise
+        finally:
+            if archive_file is not None:
+                archive_file.close()
+                self.current_run["archive_file"] = archive_path
+            self.current_run["duration_seconds"] = round(time.perf_counter() - start, 2)
+            self.last_run = self.current_run
+            self.current_run = {}
+            self.running = False
+            self.runs += 1
+            self._run_lock.release()
+
+        logger.info(
+            f"Retention removed {self.last_run['deleted_translations']} translations and "
+            f"{self.last_run['deleted_corrections']} corrections older than {cutoff} "
+            f"in {self.last_run['chunks']} chunks"
+        )
+        return self.last_run
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return progress of the current run and totals of finished runs"""
+        return {
+            "retention_days": self.retention_days,
+            "interval_seconds": self.interval_seconds,
+            "chunk_size": self.chunk_size,
+            "archive_dir": self.archive_dir,
+            "delete_expired": self.delete_expired,
+            "rollover": self.rollover,
+            "running": self.running,
+            "runs": self.runs,
+            "current_run": dict(self.current_run),
+            "last_run": dict(self.last_run),
+            "total_deleted_translations": self.total_deleted_translations,
+            "total_deleted_corrections": self.total_deleted_corrections,
+            "last_error": self.last_error,
+        }
+
+    async def close(self):
+        """Stop the schedule and interrupt a running cleanup between chunks"""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
@@ -0,0 +1,35 @@
+"""
+Shared fixtures for the backend tests
+Storage tests run against a temporary SQLite database with its own partition directory
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import DatabaseManager
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "translations.db"))
+    manager.partitions.partition_dir = str(tmp_path / "partitions")
+    manager.initialize_database()
+    yield manager
+    manager.close()
+
+
+def insert_translation(db_manager, translation_id, created_at, text=None):
+    """Insert one translation with an explicit ID, as write-behind does"""
+    db_manager.insert_translations_with_ids([{
+        "id": translation_id,
+        "original_text": text or f"text {translation_id}",
+        "translated_text": f"translated {translation_id}",
+        "source_language": "en",
+        "target_language": "hi",
+        "model_confidence": 0.9,
+        "created_at": created_at,
+    }])
@@ -0,0 +1,54 @@
+"""
+Keyset pagination of translation history across the hot table and monthly partitions
+"""
+
+from datetime import datetime
+
+from conftest import insert_translation
+
+
+def page_through(db_manager, limit, **filters):
+    pages, cursor = [], None
+    while True:
+        page = db_manager.get_translation_history(limit=limit, cursor=cursor, **filters)
+        if not page:
+            return pages
+        pages.append([record["id"] for record in page])
+        cursor = db_manager.encode_history_cursor(page[-1])
+
+
+def test_cursor_pages_cross_the_partition_boundary(db_manager):
+    now = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    # Write-behind IDs: the partitioned months interleave and share timestamps
+    for translation_id in (3, 7, 11):
+        insert_translation(db_manager, translation_id, "2025-01-31 23:59:59")
+    for translation_id in (1, 5, 9):
+        insert_translation(db_manager, translation_id, "2025-02-01 00:00:00")
+    db_manager.roll_over_partitions()
+    assert db_manager.list_partitions()
+
+    # A recent row, and a late row for January that stays in the hot table
+    insert_translation(db_manager, 20, now)
+    insert_translation(db_manager, 8, "2025-01-31 23:59:59")
+    db_manager.store_correction(5, "fixed after rollover")
+
+    expected = [20, 9, 5, 1, 11, 8, 7, 3]
+    for limit in (1, 2, 3, 5):
+        pages = page_through(db_manager, limit)
+        assert [translation_id for page in pages for translation_id in page] == expected
+        assert all(len(page) <= limit for page in pages)
+
+    records = {record["id"]: record for record in db_manager.get_translation_history(limit=10)}
+    assert records[5]["corrected_text"] == "fixed after rollover"
+
+
+def test_cursor_ignores_offset(db_manager):
+    for translation_id in range(1, 6):
+        insert_translation(db_manager, translation_id, f"2025-01-0{translation_id} 10:00:00")
+    db_manager.roll_over_partitions()
+
+    first = db_manager.get_translation_history(limit=2)
+    cursor = db_manager.encode_history_cursor(first[-1])
+    second = db_manager.get_translation_history(limit=2, offset=3, cursor=cursor)
+
+    assert [record["id"] for record in second] == [3, 2]
@@ -0,0 +1,61 @@
+"""
+Rollover and drop of monthly history partitions when write-behind ID blocks make
+the ID ranges of different months overlap
+"""
+
+from conftest import insert_translation
+
+
+def count(db_manager, table):
+    return db_manager.get_connection().execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_rollover_chunks_follow_created_at_not_id_ranges(db_manager):
+    db_manager.partitions.chunk_size = 3
+    # January rows hold IDs 1-10 and 101-110, February rows 11-100: overlapping bounds
+    for translation_id in list(range(1, 11)) + list(range(101, 111)):
+        insert_translation(db_manager, translation_id, "2025-01-15 10:00:00")
+    for translation_id in range(11, 101):
+        insert_translation(db_manager, translation_id, "2025-02-15 10:00:00")
+    db_manager.store_correction(105, "corrected January")
+
+    entries = {entry["month"]: entry for entry in db_manager.roll_over_partitions()}
+
+    assert entries["2025-01"]["moved"] == 20
+    assert entries["2025-02"]["moved"] == 90
+    assert count(db_manager, "translations") == 0
+    assert count(db_manager, "corrections") == 0
+    assert db_manager.get_translation_by_id(105)["corrected_text"] == "corrected January"
+    # ID 50 lies inside January's bounds too, but only February holds it
+    assert db_manager.get_translation_by_id(50)["created_at"].startswith("2025-02")
+
+
+def test_drop_keeps_late_corrections_of_other_partitions(db_manager):
+    insert_translation(db_manager, 1, "2025-01-10 10:00:00")
+    insert_translation(db_manager, 2, "2025-02-10 10:00:00")
+    insert_translation(db_manager, 3, "2025-01-20 10:00:00")
+    db_manager.roll_over_partitions()
+
+    # Corrections submitted after rollover stay in the main table
+    db_manager.store_correction(2, "February fix")
+    db_manager.store_correction(3, "January fix")
+
+    dropped = db_manager.drop_expired_partitions("2025-02-01 00:00:00")
+
+    assert dropped == ["2025-01"]
+    remaining = db_manager.get_connection().execute("SELECT translation_id FROM corrections").fetchall()
+    assert [row[0] for row in remaining] == [2]
+    assert db_manager.get_translation_by_id(2)["corrected_text"] == "February fix"
+
+
+def test_drop_reads_ids_from_compressed_partitions(db_manager):
+    insert_translation(db_manager, 1, "2025-01-10 10:00:00")
+    insert_translation(db_manager, 2, "2025-02-10 10:00:00")
+    db_manager.roll_over_partitions()
+    db_manager.store_correction(1, "January fix")
+    db_manager.store_correction(2, "February fix")
+    db_manager.detach_partition("2025-01", compress=True)
+
+    assert db_manager.drop_expired_partitions("2025-02-01 00:00:00") == ["2025-01"]
+    remaining = db_manager.get_connection().execute("SELECT translation_id FROM corrections").fetchall()
+    assert [row[0] for row in remaining] == [2]
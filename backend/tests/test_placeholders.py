@@ -0,0 +1,68 @@
+"""
+Placeholder extraction and restoration round-trip, including placeholders the model
+returns spaced out or translated
+"""
+
+import random
+
+import pytest
+
+from benchmarks.placeholder_extraction import (
+    MANGLED_FORMATS,
+    TEMPLATES,
+    legacy_normalize,
+    legacy_restore,
+    mangle,
+)
+from indictrans2.normalize_regex_inference import normalize, restore_placeholders
+
+
+@pytest.mark.parametrize("text", TEMPLATES)
+def test_round_trip_restores_the_original_text(text):
+    wrapped, entity_map = normalize(text)
+
+    assert all(entity not in wrapped for entity in entity_map.values())
+    assert restore_placeholders(wrapped, entity_map) == text
+
+
+@pytest.mark.parametrize("placeholder_format", MANGLED_FORMATS)
+def test_mangled_placeholders_are_restored(placeholder_format):
+    text = "Mail support@example-store.in or call 1800-123-4567"
+    wrapped, entity_map = normalize(text)
+    assert wrapped == "Mail <ID1> or call <ID2>"
+
+    translated = wrapped.replace("<ID2>", placeholder_format.format(2))
+
+    assert restore_placeholders(translated, entity_map) == text
+
+
+@pytest.mark.parametrize("text", TEMPLATES)
+def test_matches_the_previous_implementation(text):
+    wrapped, entity_map = normalize(text)
+    legacy_wrapped, legacy_map = legacy_normalize(text)
+
+    restored = restore_placeholders(mangle(wrapped, random.Random(3)), entity_map)
+    legacy_restored = legacy_restore(mangle(legacy_wrapped, random.Random(3)), legacy_map)
+    assert restored == legacy_restored
+
+
+def test_repeated_entities_share_a_placeholder():
+    wrapped, entity_map = normalize("Call 1800-123-4567 today, 1800-123-4567 is toll free")
+
+    assert wrapped == "Call <ID1> today, <ID1> is toll free"
+    assert entity_map == {"<ID1>": "1800-123-4567"}
+
+
+def test_short_entities_and_unknown_placeholders_are_left_alone():
+    wrapped, entity_map = normalize("Pack of 2.5 kg, J.K. Rowling edition")
+    assert entity_map == {}
+    assert wrapped == "Pack of 2.5 kg, J.K. Rowling edition"
+
+    assert restore_placeholders("keep <ID7> as is", {"<ID1>": "x"}) == "keep <ID7> as is"
+
+
+def test_indic_numerals_are_normalized_before_extraction():
+    wrapped, entity_map = normalize("कॉल करें १८००-१२३-४५६७")
+
+    assert wrapped == "कॉल करें <ID1>"
+    assert entity_map == {"<ID1>": "1800-123-4567"}
@@ -0,0 +1,60 @@
+"""
+Chunked retention deletes when write-behind IDs do not follow created_at
+"""
+
+import gzip
+import json
+from datetime import datetime
+
+from conftest import insert_translation
+from retention import RetentionJob
+
+
+def remaining_ids(db_manager):
+    rows = db_manager.get_connection().execute("SELECT id FROM translations ORDER BY id").fetchall()
+    return [row[0] for row in rows]
+
+
+def test_chunk_deletes_only_the_oldest_expired_rows(db_manager):
+    # The oldest rows hold the highest IDs; a recent row sits inside their ID range
+    insert_translation(db_manager, 1, "2025-03-01 10:00:00")
+    insert_translation(db_manager, 2, "2025-01-03 10:00:00")
+    insert_translation(db_manager, 5, "2025-06-01 10:00:00")
+    insert_translation(db_manager, 8, "2025-01-02 10:00:00")
+    insert_translation(db_manager, 9, "2025-01-01 10:00:00")
+    db_manager.store_correction(5, "recent fix")
+
+    assert db_manager.delete_expired_chunk("2025-04-01 00:00:00", chunk_size=2) == (2, 0)
+    assert remaining_ids(db_manager) == [1, 2, 5]
+
+    assert db_manager.delete_expired_chunk("2025-04-01 00:00:00", chunk_size=2) == (2, 0)
+    assert remaining_ids(db_manager) == [5]
+    assert db_manager.delete_expired_chunk("2025-04-01 00:00:00", chunk_size=2) == (0, 0)
+    assert db_manager.get_translation_by_id(5)["corrected_text"] == "recent fix"
+
+
+def test_run_archives_expired_rows_with_their_corrections(db_manager, tmp_path):
+    now = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    insert_translation(db_manager, 1, now)
+    for translation_id in range(2, 7):
+        insert_translation(db_manager, translation_id, f"2020-01-0{translation_id} 10:00:00")
+    db_manager.store_correction(4, "old fix")
+    db_manager.store_correction(1, "new fix")
+
+    job = RetentionJob(
+        db_manager, retention_days=30, chunk_size=2, pause_ms=0, archive_dir=str(tmp_path / "archive")
+    )
+    summary = job.run_once()
+
+    assert summary["chunks"] == 3
+    assert summary["deleted_translations"] == 5
+    assert summary["deleted_corrections"] == 1
+    assert remaining_ids(db_manager) == [1]
+    assert db_manager.get_translation_by_id(1)["corrected_text"] == "new fix"
+
+    with gzip.open(summary["archive_file"], "rt", encoding="utf-8") as archive:
+        archived = [json.loads(line) for line in archive]
+    assert sorted(row["id"] for row in archived) == [2, 3, 4, 5, 6]
+    corrections = {row["id"]: [c["corrected_text"] for c in row["corrections"]] for row in archived}
+    assert corrections[4] == ["old fix"]
+    assert corrections[2] == []
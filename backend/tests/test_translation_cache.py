@@ -0,0 +1,66 @@
+"""
+Translation cache: persistent writes racing invalidation, and pivot-leg invalidation
+"""
+
+import pytest
+
+from translation_cache import TranslationCache
+
+
+def entry(cache_key, text="translated"):
+    return (cache_key, text, "en", "hi")
+
+
+def test_persist_after_invalidate_does_not_restore_the_entry(db_manager):
+    cache = TranslationCache(db_manager)
+    rows = cache.put_many([entry("key")])
+
+    # A correction arrives before the fire-and-forget persist has run
+    cache.invalidate(["key"])
+    cache.persist(rows)
+
+    assert cache.get("key") is None
+    assert db_manager.get_cached_translations(["key"]) == {}
+
+
+def test_invalidate_after_persist_removes_the_entry(db_manager):
+    cache = TranslationCache(db_manager)
+    cache.persist(cache.put_many([entry("key")]))
+    assert "key" in db_manager.get_cached_translations(["key"])
+
+    cache.invalidate(["key"])
+
+    assert cache.get("key") is None
+    assert db_manager.get_cached_translations(["key"]) == {}
+
+
+def test_put_after_invalidate_is_persisted(db_manager):
+    cache = TranslationCache(db_manager)
+    stale = cache.put_many([entry("key", "old")])
+    cache.invalidate(["key"])
+    fresh = cache.put_many([entry("key", "new")])
+
+    cache.persist(stale)
+    cache.persist(fresh)
+
+    assert db_manager.get_cached_translations(["key"])["key"]["translated_text"] == "new"
+
+
+def test_correction_invalidates_both_pivot_legs(db_manager):
+    pytest.importorskip("torch")
+    from translation_service import TranslationService
+
+    service = TranslationService(db_manager)
+    hin, eng, tam = (service.lang_code_map[code] for code in ("hi", "en", "ta"))
+    first_leg = service._cache_key("नमस्ते दुनिया", hin, eng)
+    second_leg = service._cache_key("hello world", eng, tam)
+    service.cache.persist(service.cache.put_many([
+        (first_leg, "hello world", hin, eng),
+        (second_leg, "வணக்கம் உலகம்", eng, tam),
+    ]))
+
+    service.invalidate_cached_translation("नमस्ते दुनिया", "Hindi", "Tamil")
+
+    assert service.cache.get(first_leg) is None
+    assert service.cache.get(second_leg) is None
+    assert db_manager.get_cached_translations([first_leg, second_leg]) == {}
@@ -0,0 +1,131 @@
+"""
+Write-behind buffer: batched flushes, failure handling, spill and replay
+"""
+
+import json
+import sqlite3
+
+from write_behind import TranslationWriteBehind
+
+
+class FlakyDatabase:
+    """Delegates to a real DatabaseManager but fails the first few batch inserts"""
+
+    def __init__(self, db_manager, failures, error=sqlite3.OperationalError("database is locked")):
+        self.db_manager = db_manager
+        self.failures = failures
+        self.error = error
+
+    def reserve_translation_ids(self, count):
+        return self.db_manager.reserve_translation_ids(count)
+
+    def insert_translations_with_ids(self, records):
+        if self.failures > 0:
+            self.failures -= 1
+            raise self.error
+        self.db_manager.insert_translations_with_ids(records)
+
+
+def make_records(count, prefix="item"):
+    return [
+        {
+            "original_text": f"{prefix} {i}",
+            "translated_text": f"translated {prefix} {i}",
+            "source_language": "en",
+            "target_language": "hi",
+            "model_confidence": 0.9,
+        }
+        for i in range(count)
+    ]
+
+
+def stored_ids(db_manager):
+    rows = db_manager.get_connection().execute("SELECT id FROM translations ORDER BY id").fetchall()
+    return [row[0] for row in rows]
+
+
+def test_flush_writes_submitted_records(db_manager):
+    write_behind = TranslationWriteBehind(db_manager, max_batch_size=4, flush_interval_ms=5)
+    write_behind.start()
+    try:
+        ids = write_behind.submit(make_records(10))
+        assert write_behind.flush(timeout=5)
+    finally:
+        write_behind.close()
+
+    assert stored_ids(db_manager) == ids
+    assert write_behind.rows_written == 10
+
+
+def test_zero_flush_interval_is_clamped(db_manager):
+    write_behind = TranslationWriteBehind(db_manager, flush_interval_ms=0)
+    assert write_behind.flush_interval > 0
+
+
+def test_failed_batch_stays_queued_until_the_database_recovers(db_manager):
+    flaky = FlakyDatabase(db_manager, failures=2)
+    write_behind = TranslationWriteBehind(
+        flaky, max_batch_size=8, flush_interval_ms=5, max_retries=1, max_backoff_seconds=0.05
+    )
+    write_behind.start()
+    try:
+        ids = write_behind.submit(make_records(3))
+        assert write_behind.flush(timeout=5)
+    finally:
+        write_behind.close()
+
+    assert stored_ids(db_manager) == ids
+    assert write_behind.failed_flushes == 2
+    assert write_behind.get_health()["healthy"]
+
+
+def test_failures_are_reported_and_spilled_on_close(db_manager, tmp_path):
+    spill_path = str(tmp_path / "spill.jsonl")
+    flaky = FlakyDatabase(db_manager, failures=10 ** 6)
+    write_behind = TranslationWriteBehind(
+        flaky, flush_interval_ms=5, max_retries=1, max_backoff_seconds=0.01, spill_path=spill_path
+    )
+    write_behind.start()
+    ids = write_behind.submit(make_records(5))
+    assert not write_behind.flush(timeout=0.2)
+
+    health = write_behind.get_health()
+    assert not health["healthy"]
+    assert health["queue_length"] == 5
+    assert "database is locked" in health["last_error"]
+
+    write_behind.close(timeout=5)
+    with open(spill_path, encoding="utf-8") as spill:
+        assert [json.loads(line)["id"] for line in spill] == ids
+    assert stored_ids(db_manager) == []
+
+    # The next start replays the spilled rows with their original IDs
+    replay = TranslationWriteBehind(db_manager, flush_interval_ms=5, spill_path=spill_path)
+    replay.start()
+    try:
+        assert replay.flush(timeout=5)
+    finally:
+        replay.close()
+
+    assert stored_ids(db_manager) == ids
+    assert replay.rows_replayed == 5
+    assert not (tmp_path / "spill.jsonl").exists()
+
+
+def test_rejected_batch_is_set_aside(db_manager, tmp_path):
+    spill_path = str(tmp_path / "spill.jsonl")
+    flaky = FlakyDatabase(db_manager, failures=1, error=sqlite3.IntegrityError("UNIQUE constraint failed"))
+    write_behind = TranslationWriteBehind(flaky, flush_interval_ms=5, spill_path=spill_path)
+    write_behind.start()
+    try:
+        rejected = write_behind.submit(make_records(2, "bad"))
+        assert write_behind.flush(timeout=5)
+        accepted = write_behind.submit(make_records(2, "good"))
+        assert write_behind.flush(timeout=5)
+    finally:
+        write_behind.close()
+
+    assert stored_ids(db_manager) == accepted
+    with open(spill_path + ".rejected", encoding="utf-8") as spill:
+        assert [json.loads(line)["id"] for line in spill] == rejected
+    assert write_behind.rows_rejected == 2
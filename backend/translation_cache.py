@@ -0,0 +1,323 @@
+"""
+Content-addressed translation cache
+In-process LRU tier with a byte budget, backed by a persistent SQLite tier
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Rough per-entry bookkeeping cost (OrderedDict node, tuple, float) in bytes
+ENTRY_OVERHEAD_BYTES = 120
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keys: NFC unicode form and collapsed whitespace"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def make_cache_key(
+    text: str,
+    source_language: str,
+    target_language: str,
+    model_id: str,
+    decoding_params: Dict[str, Any]
+) -> str:
+    """
+    Build a content-addressed cache key
+
+    Args:
+        text: Source text (normalized before hashing)
+        source_language: Source language code
+        target_language: Target language code
+        model_id: Identifier of the model that produces the translation
+        decoding_params: Generation parameters that influence the output
+
+    Returns:
+        Hex SHA-256 digest identifying the translation
+    """
+    payload = json.dumps(
+        [normalize_text(text), source_language, target_language, model_id, decoding_params],
+        ensure_ascii=False,
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TranslationCache:
+    """
+    Two-tier translation cache: in-process LRU plus persistent table via DatabaseManager
+
+    The LRU tier is cheap enough to use on the event loop. The persistent tier does
+    blocking SQLite I/O, so get_persistent and persist are meant to run off the loop
+    (e.g. in an executor); the LRU tier is guarded by a lock for that reason.
+
+    Rows from put_many stay pending until persist writes them. invalidate drops pending
+    rows for its keys, so a persist that was still queued when a correction came in
+    cannot write the stale translation back.
+    """
+
+    def __init__(self, db_manager=None, max_bytes: int = 64 * 1024 * 1024, ttl_seconds: float = 0):
+        """
+        Args:
+            db_manager: Optional DatabaseManager used for the persistent tier
+            max_bytes: Byte budget of the in-process LRU tier
+            ttl_seconds: Entry lifetime in seconds (0 disables expiry)
+        """
+        self.db_manager = db_manager
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        # cache_key -> (translated_text, created_at, size_bytes)
+        self._entries: "OrderedDict[str, Tuple[str, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.RLock()
+
+        # cache_key -> created_at of the put_many row not yet persisted. persist and
+        # invalidate (both off the loop) serialize on _write_lock so a persist cannot
+        # interleave with an invalidation; put_many only needs _lock
+        self._pending: Dict[str, float] = {}
+        self._write_lock = threading.Lock()
+        self._last_created_at = 0.0
+
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl_seconds > 0 and time.time() - created_at > self.ttl_seconds
+
+    def _entry_size(self, cache_key: str, translated_text: str) -> int:
+        return len(cache_key) + len(translated_text.encode("utf-8")) + ENTRY_OVERHEAD_BYTES
+
+    def _remember(self, cache_key: str, translated_text: str, created_at: float):
+        """Insert into the LRU tier and evict least recently used entries over budget"""
+        size = self._entry_size(cache_key, translated_text)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(cache_key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+
+            self._entries[cache_key] = (translated_text, created_at, size)
+            self._bytes += size
+
+            while self._bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def _forget(self, cache_key: str):
+        with self._lock:
+            entry = self._entries.pop(cache_key, None)
+            if entry is not None:
+                self._bytes -= entry[2]
+
+    def get_from_memory(self, cache_key: str) -> Optional[str]:
+        """
+        Look up a translation in the LRU tier only (no I/O)
+
+        Args:
+            cache_key: Key from make_cache_key
+
+        Returns:
+            Cached translated text, or None if it is not in memory
+        """
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            if not self._is_expired(entry[1]):
+                self._entries.move_to_end(cache_key)
+                self.memory_hits += 1
+                return entry[0]
+            self._forget(cache_key)
+            self.expirations += 1
+            return None
+
+    def get_persistent(self, cache_keys: List[str]) -> Dict[str, str]:
+        """
+        Look up keys that missed the LRU tier in the persistent tier with one query.
+        Blocking; run it off the event loop.
+
+        Args:
+            cache_keys: Keys from make_cache_key
+
+        Returns:
+            Mapping of the keys found to their translated text; the rest count as misses
+        """
+        found: Dict[str, str] = {}
+        if self.db_manager is not None and cache_keys:
+            try:
+                rows = self.db_manager.get_cached_translations(cache_keys)
+            except Exception as e:
+                logger.warning(f"Persistent cache lookup failed: {str(e)}")
+                rows = {}
+
+            expired = []
+            for cache_key, row in rows.items():
+                if self._is_expired(row["created_at"]):
+                    expired.append(cache_key)
+                    continue
+                self._remember(cache_key, row["translated_text"], row["created_at"])
+                found[cache_key] = row["translated_text"]
+            self._delete_persistent(expired)
+
+            with self._lock:
+                self.persistent_hits += len(found)
+                self.expirations += len(expired)
+
+        with self._lock:
+            self.misses += len(cache_keys) - len(found)
+        return found
+
+    def get(self, cache_key: str) -> Optional[str]:
+        """
+        Look up a translation, checking the LRU tier before the persistent tier (blocking)
+
+        Args:
+            cache_key: Key from make_cache_key
+
+        Returns:
+            Cached translated text, or None on a miss
+        """
+        translated_text = self.get_from_memory(cache_key)
+        if translated_text is not None:
+            return translated_text
+        return self.get_persistent([cache_key]).get(cache_key)
+
+    def put_many(self, entries: List[Tuple[str, str, str, str]]) -> List[Tuple[str, str, str, str, float]]:
+        """
+        Store translations in the LRU tier
+
+        Args:
+            entries: (cache_key, translated_text, source_language, target_language) tuples
+
+        Returns:
+            Timestamped rows to hand to persist (off the event loop)
+        """
+        with self._lock:
+            # Strictly increasing, so created_at also tells apart rows pending for the same key
+            created_at = max(time.time(), self._last_created_at + 1e-6)
+            self._last_created_at = created_at
+            rows = []
+            for cache_key, translated_text, source_language, target_language in entries:
+                self._remember(cache_key, translated_text, created_at)
+                rows.append((cache_key, translated_text, source_language, target_language, created_at))
+                if self.db_manager is not None:
+                    self._pending[cache_key] = created_at
+        return rows
+
+    def persist(self, rows: List[Tuple[str, str, str, str, float]]):
+        """
+        Write rows from put_many to the persistent tier in one transaction (blocking)
+
+        Args:
+            rows: (cache_key, translated_text, source_language, target_language, created_at) tuples
+        """
+        if self.db_manager is None or not rows:
+            return
+        with self._write_lock:
+            # Skip rows invalidated (or superseded by a newer put) since put_many
+            with self._lock:
+                current = []
+                for row in rows:
+                    if self._pending.get(row[0]) == row[4]:
+                        del self._pending[row[0]]
+                        current.append(row)
+            if not current:
+                return
+            try:
+                self.db_manager.store_cached_translations(current)
+            except Exception as e:
+                logger.warning(f"Persistent cache write failed: {str(e)}")
+
+    def put(self, cache_key: str, translated_text: str, source_language: str, target_language: str):
+        """
+        Store a translation in both tiers (blocking)
+
+        Args:
+            cache_key: Key from make_cache_key
+            translated_text: Model output to cache
+            source_language: Source language code (kept for inspection and invalidation)
+            target_language: Target language code
+        """
+        self.persist(self.put_many([(cache_key, translated_text, source_language, target_language)]))
+
+    def invalidate(self, cache_keys: List[str]):
+        """Drop translations from both tiers, e.g. after a correction was submitted (blocking)"""
+        with self._write_lock:
+            with self._lock:
+                for cache_key in cache_keys:
+                    self._pending.pop(cache_key, None)
+                    self._forget(cache_key)
+            self._delete_persistent(cache_keys)
+        with self._lock:
+            self.invalidations += len(cache_keys)
+
+    def _delete_persistent(self, cache_keys: List[str]):
+        if self.db_manager is None or not cache_keys:
+            return
+        try:
+            self.db_manager.delete_cached_translations(cache_keys)
+        except Exception as e:
+            logger.warning(f"Persistent cache delete failed: {str(e)}")
+
+    def warm_up(self, cache_keys: Iterable[str]) -> int:
+        """
+        Load persisted entries into the LRU tier
+
+        Args:
+            cache_keys: Keys to preload, most important first
+
+        Returns:
+            Number of entries loaded
+        """
+        if self.db_manager is None:
+            return 0
+
+        cache_keys = [cache_key for cache_key in cache_keys if cache_key not in self._entries]
+        rows = self.db_manager.get_cached_translations(cache_keys)
+
+        loaded = 0
+        for cache_key in cache_keys:
+            if self._bytes >= self.max_bytes:
+                break
+            row = rows.get(cache_key)
+            if row is None or self._is_expired(row["created_at"]):
+                continue
+            self._remember(cache_key, row["translated_text"], row["created_at"])
+            loaded += 1
+        return loaded
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and LRU occupancy"""
+        lookups = self.memory_hits + self.persistent_hits + self.misses
+        hits = self.memory_hits + self.persistent_hits
+        with self._lock:
+            entries = len(self._entries)
+        return {
+            "entries": entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "memory_hits": self.memory_hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "hit_rate": (hits / lookups) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,393 @@
+"""
+Translation memory with fuzzy source matching
+MinHash/LSH index over past translations and accepted corrections, consulted before the model
+"""
+
+import logging
+import re
+import threading
+import time
+import unicodedata
+import zlib
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Any run of decimal digits in any script (Python's \d is Unicode-aware)
+NUMBER_PATTERN = re.compile(r"\d+(?:[.,]\d+)*")
+
+# Mersenne prime for the universal hash family h(x) = (a * x + b) mod p
+MERSENNE_PRIME = (1 << 61) - 1
+
+
+def normalize_segment(text: str) -> str:
+    """NFC, case-folded, whitespace-collapsed form used for matching"""
+    return " ".join(unicodedata.normalize("NFC", text).casefold().split())
+
+
+def mask_numbers(text: str) -> str:
+    """Replace every number with a placeholder so segments differing only by numbers match exactly"""
+    return NUMBER_PATTERN.sub("#", text)
+
+
+def shingles(text: str, size: int) -> set:
+    """Character n-grams of a segment (the whole segment if it is shorter than n)"""
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _number_value(token: str) -> Optional[int]:
+    digits = "".join(str(unicodedata.digit(ch)) for ch in token if unicodedata.digit(ch, None) is not None)
+    return int(digits) if digits else None
+
+
+def _in_script_of(template: str, number: str) -> str:
+    """Write a number with the digit script (and separators) of a template number"""
+    zero = next((ord(ch) - unicodedata.digit(ch) for ch in template if unicodedata.digit(ch, None) is not None), ord("0"))
+    return "".join(
+        chr(zero + unicodedata.digit(ch)) if unicodedata.digit(ch, None) is not None else ch
+        for ch in number
+    )
+
+
+def substitute_numbers(stored_source: str, stored_translation: str, new_source: str) -> Optional[str]:
+    """
+    Carry the numbers of a new source segment into a stored translation
+
+    Only safe when the stored translation contains the stored source's numbers in the
+    same order; digits keep the translation's script (e.g. Devanagari numerals).
+
+    Returns:
+        Adapted translation, or None if the numbers cannot be mapped
+    """
+    old_numbers = NUMBER_PATTERN.findall(stored_source)
+    new_numbers = NUMBER_PATTERN.findall(new_source)
+    if len(old_numbers) != len(new_numbers):
+        return None
+
+    translated_numbers = list(NUMBER_PATTERN.finditer(stored_translation))
+    if [_number_value(n) for n in old_numbers] != [_number_value(m.group()) for m in translated_numbers]:
+        return None
+
+    pieces = []
+    last = 0
+    for match, new_number in zip(translated_numbers, new_numbers):
+        pieces.append(stored_translation[last:match.start()])
+        pieces.append(_in_script_of(match.group(), new_number))
+        last = match.end()
+    pieces.append(stored_translation[last:])
+    return "".join(pieces)
+
+
+@dataclass
+class MemoryEntry:
+    """One source segment and its best known translation"""
+    source_text: str
+    translated_text: str
+    corrected: bool
+    translation_id: Optional[int]
+
+
+@dataclass
+class MemoryMatch:
+    """Result of a translation-memory lookup"""
+    translated_text: str
+    similarity: float
+    match_type: str  # "exact", "numbers" or "fuzzy"
+    corrected: bool
+    translation_id: Optional[int]
+
+    @property
+    def servable(self) -> bool:
+        """
+        Whether the translation can be returned as-is. Fuzzy matches differ from the query
+        by more than numbers (e.g. "size L" vs "size XL") and are only suggestions.
+        """
+        return self.match_type in ("exact", "numbers")
+
+
+class TranslationMemory:
+    """
+    Per-language-pair translation memory.
+
+    Exact lookups go through a dict keyed by the number-masked normalized source.
+    Fuzzy lookups use MinHash signatures of character shingles, split into LSH
+    bands; candidates sharing a band are verified with exact Jaccard similarity.
+    Once max_entries segments are held, the least recently used one is evicted.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 3,
+        max_candidates: int = 32,
+        max_entries: int = 200000,
+        seed: int = 1
+    ):
+        """
+        Args:
+            threshold: Minimum Jaccard similarity of masked sources for a fuzzy hit
+            num_perm: MinHash signature length
+            bands: Number of LSH bands (num_perm must be divisible by it)
+            shingle_size: Character n-gram size
+            max_candidates: Maximum LSH candidates verified per lookup
+            max_entries: Maximum segments held across all language pairs (0 for unbounded)
+            seed: Seed of the hash family, fixed so signatures are reproducible
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_candidates = max_candidates
+        self.max_entries = max_entries
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=num_perm, dtype=np.uint64)
+
+        # (source_lang, target_lang) -> masked key -> entry
+        self._entries: Dict[Tuple[str, str], Dict[str, MemoryEntry]] = {}
+        # (source_lang, target_lang, band index, band hash) -> masked keys
+        self._buckets: Dict[Tuple[str, str, int, int], List[str]] = {}
+        # (source_lang, target_lang, masked key) -> band hashes, least recently used first
+        self._lru: "OrderedDict[Tuple[str, str, str], List[int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.lookups = 0
+        self.exact_hits = 0
+        self.number_hits = 0
+        self.fuzzy_matches = 0
+        self.misses = 0
+        self.evictions = 0
+        self._latencies_ms: Deque[float] = deque(maxlen=1000)
+
+    def _signature(self, shingle_set: set) -> np.ndarray:
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingle_set), dtype=np.uint64, count=len(shingle_set)
+        )
+        # a, b and x are below 2^32, so a * x + b stays within uint64
+        values = (np.outer(self._a, hashes) + self._b[:, None]) % MERSENNE_PRIME
+        return values.min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[int]:
+        return [
+            hash(signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def add(
+        self,
+        source_text: str,
+        source_language: str,
+        target_language: str,
+        translated_text: str,
+        translation_id: Optional[int] = None,
+        corrected: bool = False,
+        replace: bool = True,
+        recent: bool = True
+    ):
+        """
+        Add or update a segment
+
+        Args:
+            source_text: Source segment
+            source_language: Source language code
+            target_language: Target language code
+            translated_text: Translation (the corrected text for corrections)
+            translation_id: ID of the stored translation, if any
+            corrected: Whether the translation is an accepted human correction
+            replace: Replace an existing machine translation of the same segment
+            recent: Treat the segment as most recently used (False when bulk-loading
+                history newest first, so older rows are evicted first)
+        """
+        if not source_text or not translated_text:
+            return
+
+        pair = (source_language, target_language)
+        key = mask_numbers(normalize_segment(source_text))
+        entry = MemoryEntry(source_text, translated_text, corrected, translation_id)
+        band_keys = self._band_keys(self._signature(shingles(key, self.shingle_size)))
+
+        with self._lock:
+            entries = self._entries.setdefault(pair, {})
+            existing = entries.get(key)
+            if existing is not None:
+                # Corrections always win; machine output never overwrites a correction
+                if (corrected or (replace and not existing.corrected)):
+                    entries[key] = entry
+                return
+
+            entries[key] = entry
+            for band, band_key in enumerate(band_keys):
+                self._buckets.setdefault((source_language, target_language, band, band_key), []).append(key)
+            self._lru[pair + (key,)] = band_keys
+            self._lru.move_to_end(pair + (key,), last=recent)
+
+            while self.max_entries and len(self._lru) > self.max_entries:
+                self._evict()
+
+    def _evict(self):
+        """Drop the least recently used segment (caller holds the lock)"""
+        (source_language, target_language, key), band_keys = self._lru.popitem(last=False)
+        pair = (source_language, target_language)
+        entries = self._entries[pair]
+        del entries[key]
+        if not entries:
+            del self._entries[pair]
+        for band, band_key in enumerate(band_keys):
+            bucket_id = (source_language, target_language, band, band_key)
+            bucket = self._buckets[bucket_id]
+            bucket.remove(key)
+            if not bucket:
+                del self._buckets[bucket_id]
+        self.evictions += 1
+
+    def load(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Bulk-load stored translations, newest first
+
+        Args:
+            rows: Dictionaries with id, original_text, translated_text, source_language,
+                target_language and corrected_text (None if uncorrected)
+
+        Returns:
+            Number of rows processed
+        """
+        count = 0
+        for row in rows:
+            corrected = row.get("corrected_text") is not None
+            self.add(
+                row["original_text"],
+                row["source_language"],
+                row["target_language"],
+                row["corrected_text"] if corrected else row["translated_text"],
+                translation_id=row.get("id"),
+                corrected=corrected,
+                replace=False,
+                recent=False
+            )
+            count += 1
+        return count
+
+    def lookup(self, source_text: str, source_language: str, target_language: str) -> Optional[MemoryMatch]:
+        """
+        Find the stored translation of the closest source segment
+
+        Args:
+            source_text: Segment to translate
+            source_language: Source language code
+            target_language: Target language code
+
+        Returns:
+            MemoryMatch for exact, number-only or fuzzy matches above the threshold; None
+            otherwise. Only servable matches (see MemoryMatch.servable) may be used as the
+            translation.
+        """
+        start = time.perf_counter()
+        with self._lock:
+            try:
+                return self._lookup(source_text, source_language, target_language)
+            finally:
+                self.lookups += 1
+                self._latencies_ms.append((time.perf_counter() - start) * 1000.0)
+
+    def _lookup(self, source_text: str, source_language: str, target_language: str) -> Optional[MemoryMatch]:
+        entries = self._entries.get((source_language, target_language))
+        if not entries:
+            self.misses += 1
+            return None
+
+        normalized = normalize_segment(source_text)
+        key = mask_numbers(normalized)
+
+        entry = entries.get(key)
+        if entry is not None:
+            match = self._adapt(entry, normalized, 1.0)
+            if match is not None:
+                self._lru.move_to_end((source_language, target_language, key))
+                return match
+
+        shingle_set = shingles(key, self.shingle_size)
+        candidates: Dict[str, None] = {}
+        for band, band_key in enumerate(self._band_keys(self._signature(shingle_set))):
+            for candidate in self._buckets.get((source_language, target_language, band, band_key), ()):
+                if candidate != key:
+                    candidates[candidate] = None
+            if len(candidates) >= self.max_candidates:
+                break
+
+        best_key, best_similarity = None, 0.0
+        for candidate in list(candidates)[:self.max_candidates]:
+            candidate_shingles = shingles(candidate, self.shingle_size)
+            similarity = len(shingle_set & candidate_shingles) / len(shingle_set | candidate_shingles)
+            if similarity > best_similarity:
+                best_key, best_similarity = candidate, similarity
+
+        if best_key is not None and best_similarity >= self.threshold:
+            match = self._adapt(entries[best_key], normalized, best_similarity)
+            if match is not None:
+                return match
+
+        self.misses += 1
+        return None
+
+    def _adapt(self, entry: MemoryEntry, normalized_source: str, similarity: float) -> Optional[MemoryMatch]:
+        """Return the entry's translation, carrying over numbers when they differ"""
+        stored_source = normalize_segment(entry.source_text)
+        translated_text = entry.translated_text
+        match_type = "exact" if similarity >= 1.0 else "fuzzy"
+
+        if NUMBER_PATTERN.findall(stored_source) != NUMBER_PATTERN.findall(normalized_source):
+            translated_text = substitute_numbers(stored_source, entry.translated_text, normalized_source)
+            if translated_text is None:
+                return None
+            if match_type == "exact":
+                match_type = "numbers"
+
+        if match_type == "exact":
+            self.exact_hits += 1
+        elif match_type == "numbers":
+            self.number_hits += 1
+        else:
+            self.fuzzy_matches += 1
+
+        return MemoryMatch(translated_text, similarity, match_type, entry.corrected, entry.translation_id)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._lru)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit counters, size and lookup latency"""
+        with self._lock:
+            entries = len(self._lru)
+            language_pairs = len(self._entries)
+            latencies = sorted(self._latencies_ms)
+        hits = self.exact_hits + self.number_hits
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "language_pairs": language_pairs,
+            "threshold": self.threshold,
+            "lookups": self.lookups,
+            "exact_hits": self.exact_hits,
+            "number_hits": self.number_hits,
+            "fuzzy_matches": self.fuzzy_matches,
+            "misses": self.misses,
+            "hit_rate": (hits / self.lookups) if self.lookups else 0.0,
+            "avg_lookup_ms": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            "p99_lookup_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))], 3)
+            if latencies else 0.0,
+        }
@@ -4,7 +4,10 @@ Handles language detection and translation between Indian languages
 """
 
 import asyncio
+import gc
 import logging
+import threading
+import time
 from typing import Dict, List, Optional, Any
 import torch
 try:
@@ -17,6 +20,11 @@ import os
 import requests
 from dotenv import load_dotenv
 from models import SUPPORTED_LANGUAGES
+from micro_batcher import MicroBatcher
+from inference_executor import InferenceExecutor, InferenceOverloadedError, InferenceTimeoutError
+from translation_cache import TranslationCache, make_cache_key
+from translation_memory import TranslationMemory
+from model_precision import load_seq2seq_model, resident_memory_mb, resolve_precision
 
 # Load environment variables
 load_dotenv()
@@ -27,14 +35,23 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 # --- Model Configuration ---
+CT2_COMPUTE_TYPES = {
+    "default", "auto", "int8", "int8_float32", "int8_float16", "int8_bfloat16",
+    "int16", "float16", "bfloat16", "float32"
+}
+# Attribute prefix of the model/tokenizer pair serving each translation direction
+DIRECTION_ATTRIBUTES = {"en-indic": "en_indic", "indic-en": "indic_en"}
 FASTTEXT_MODEL_URL = "https://dl.fbaipublicfiles.com/fasttext/supervised-models/lid.176.bin"
 FASTTEXT_MODEL_PATH = os.path.join(os.path.dirname(__file__), "lid.176.bin")
+# Confidence stored with translations served from the translation memory (and same-language
+# passthroughs); rows stored with it are not reloaded into the memory as new entries
+MEMORY_HIT_CONFIDENCE = 1.0
 
 
 class TranslationService:
     """Service for handling language detection and translation using IndicTrans2"""
     
-    def __init__(self):
+    def __init__(self, db_manager=None):
         self.en_indic_model = None
         self.en_indic_tokenizer = None
         self.indic_en_model = None
@@ -45,6 +62,15 @@ class TranslationService:
         self.model_loaded = False
         self.model_type = os.getenv("MODEL_TYPE", "mock")  # Read here instead
         
+        # CTranslate2 compute type; int8 keeps CPU-only nodes fast and small
+        default_compute_type = "int8" if self.device == "cpu" else "default"
+        self.ct2_compute_type = os.getenv("CT2_COMPUTE_TYPE", default_compute_type)
+        if self.ct2_compute_type not in CT2_COMPUTE_TYPES:
+            logger.warning(f"Unknown CT2_COMPUTE_TYPE '{self.ct2_compute_type}', using '{default_compute_type}'")
+            self.ct2_compute_type = default_compute_type
+        # Paragraphs per pipeline chunk for large engine batches (0 disables pipelining)
+        self.engine_pipeline_chunk_size = int(os.getenv("ENGINE_PIPELINE_CHUNK_SIZE", "64"))
+        
         # Try to import transformers when needed
         self.transformers_available = False
         try:
@@ -93,27 +119,213 @@ class TranslationService:
         
         # Reverse mapping for response
         self.reverse_lang_map = {v: k for k, v in self.lang_code_map.items()}
+        
+        # Decoding parameters shared by single and batched generation
+        self.generation_config = {"max_length": 512, "num_beams": 5, "do_sample": False}
+        
+        # Limits for length-bucketed batch generation
+        self.batch_token_budget = int(os.getenv("BATCH_TOKEN_BUDGET", "4096"))
+        self.max_batch_sentences = int(os.getenv("BATCH_MAX_SENTENCES", "64"))
+        
+        # Numeric precision applied to the Hugging Face models at load time
+        self.model_precision = resolve_precision(os.getenv("MODEL_PRECISION", "fp32"), self.device)
+        self.model_load_stats: Dict[str, Dict[str, Any]] = {}
+        
+        # Lazy per-direction loading state
+        self.direction_state = {direction: "unloaded" for direction in DIRECTION_ATTRIBUTES}
+        self.direction_errors: Dict[str, str] = {}
+        self.direction_last_used = {direction: 0.0 for direction in DIRECTION_ATTRIBUTES}
+        self.direction_in_flight = {direction: 0 for direction in DIRECTION_ATTRIBUTES}
+        # Jobs running on the inference threads; a job whose request timed out keeps
+        # running, so the idle reaper must also wait for these
+        self.direction_running = {direction: 0 for direction in DIRECTION_ATTRIBUTES}
+        self._running_lock = threading.Lock()
+        self._direction_locks: Dict[str, asyncio.Lock] = {}
+        self._idle_unload_task: Optional[asyncio.Task] = None
+        self.model_idle_timeout = float(os.getenv("MODEL_IDLE_TIMEOUT", "0"))
+        self.preload_directions = [
+            direction.strip() for direction in os.getenv("MODEL_PRELOAD", "").split(",")
+            if direction.strip() in DIRECTION_ATTRIBUTES
+        ]
+        
+        # Content-addressed cache of model outputs (LRU in memory, persisted via DatabaseManager)
+        self.model_id = f"{self.model_type}:{self.model_dir}"
+        if self.model_type == "ctranslate2":
+            self.model_id += f":{self.ct2_compute_type}"
+        else:
+            self.model_id += f":{self.model_precision}"
+        self.cache_enabled = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+        self.cache = TranslationCache(
+            db_manager=db_manager,
+            max_bytes=int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            ttl_seconds=float(os.getenv("CACHE_TTL_SECONDS", "0"))
+        )
+        
+        # Fuzzy translation memory over past translations and corrections, checked before the model
+        self.db_manager = db_manager
+        self.tm_enabled = os.getenv("TM_ENABLED", "true").lower() == "true"
+        self.translation_memory = TranslationMemory(
+            threshold=float(os.getenv("TM_THRESHOLD", "0.9")),
+            num_perm=int(os.getenv("TM_NUM_PERM", "64")),
+            bands=int(os.getenv("TM_BANDS", "16")),
+            max_entries=int(os.getenv("TM_MAX_ENTRIES", "200000"))
+        )
+        
+        # Bounded inference pool keeps generate() off the event loop; limits give backpressure
+        self.inference = InferenceExecutor(
+            max_workers=int(os.getenv("INFERENCE_WORKERS", "1")),
+            max_pending=int(os.getenv("INFERENCE_MAX_PENDING", "32"))
+        )
+        self.max_queue_size = int(os.getenv("INFERENCE_MAX_QUEUE", "256"))
+        self.inference_timeout = float(os.getenv("INFERENCE_TIMEOUT", "120"))
+        self.inference_timeouts = 0
+        self.queue_rejections = 0
+        self._queued_requests = 0
+        
+        # Coalesce concurrent translate calls into shared model batches per direction
+        self.batcher = MicroBatcher(
+            self._generate_batch_async,
+            max_batch_size=int(os.getenv("BATCH_SIZE", "8")),
+            max_wait_ms=float(os.getenv("BATCH_MAX_WAIT_MS", "5"))
+        )
     
     async def load_models(self):
-        """Load IndicTrans2 model and language detector based on MODEL_TYPE"""
+        """
+        Initialize the language detector and model configuration based on MODEL_TYPE
+        
+        Translation models are loaded per direction on first use (see _ensure_direction_loaded)
+        unless listed in MODEL_PRELOAD.
+        """
         if self.model_loaded:
             return
             
         logger.info(f"Starting model loading process (Mode: {self.model_type}, Device: {self.device})...")
         
-        if self.model_type == "indictrans2" and self.transformers_available:
-            try:
-                await self._load_language_detector()
-                await self._load_indictrans2_model()
-                self.model_loaded = True
-                logger.info("✅ Real IndicTrans2 models loaded successfully!")
-            except Exception as e:
-                logger.error(f"❌ Failed to load real models: {str(e)}")
-                logger.warning("Falling back to mock implementation.")
-                self._use_mock_implementation()
+        if (self.model_type == "indictrans2" and self.transformers_available) or self.model_type == "ctranslate2":
+            await self._load_language_detector()
+            self.model_loaded = True
+            
+            for direction in self.preload_directions:
+                try:
+                    await self._ensure_direction_loaded(direction)
+                except Exception:
+                    logger.warning(f"Preloading {direction} failed; requests for it will use the mock fallback.")
+            
+            logger.info(f"✅ Translation service ready; models load lazily per direction "
+                        f"(idle unload after {self.model_idle_timeout or 'never'}s)")
         else:
             self._use_mock_implementation()
+    
+    async def _ensure_direction_loaded(self, direction: str):
+        """
+        Load a direction's model/tokenizer pair on first use
+        
+        A per-direction lock makes concurrent first requests wait for a single load.
+        
+        Args:
+            direction: "en-indic" or "indic-en"
+        """
+        if self.direction_state.get(direction) in ("loaded", "mock"):
+            return
+        
+        lock = self._direction_locks.get(direction)
+        if lock is None:
+            lock = self._direction_locks[direction] = asyncio.Lock()
+        
+        async with lock:
+            state = self.direction_state[direction]
+            if state in ("loaded", "mock"):
+                return
+            if state == "failed":
+                raise RuntimeError(f"{direction} model failed to load: {self.direction_errors.get(direction)}")
+            
+            self.direction_state[direction] = "loading"
+            try:
+                # Loading takes seconds to minutes; keep the event loop responsive meanwhile
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self._load_direction, direction)
+            except Exception as e:
+                self.direction_state[direction] = "failed"
+                self.direction_errors[direction] = str(e)
+                raise
             
+            self.direction_state[direction] = "loaded"
+            self.direction_last_used[direction] = time.monotonic()
+            
+            if self.model_idle_timeout > 0 and (self._idle_unload_task is None or self._idle_unload_task.done()):
+                self._idle_unload_task = loop.create_task(self._idle_unload_loop())
+    
+    def _load_direction(self, direction: str):
+        """Load the model/tokenizer pair of one direction (blocking)"""
+        if self.model_type == "ctranslate2":
+            model, tokenizer = self._load_ctranslate2_model(direction)
+        else:
+            model, tokenizer = self._load_indictrans2_model(direction)
+        
+        prefix = DIRECTION_ATTRIBUTES[direction]
+        setattr(self, f"{prefix}_tokenizer", tokenizer)
+        setattr(self, f"{prefix}_model", model)
+    
+    def _unload_direction(self, direction: str):
+        """Release a direction's model/tokenizer pair"""
+        prefix = DIRECTION_ATTRIBUTES[direction]
+        model = getattr(self, f"{prefix}_model")
+        if hasattr(model, "close"):
+            # Stops the engine's sentence splitter processes
+            model.close()
+        setattr(self, f"{prefix}_model", None)
+        setattr(self, f"{prefix}_tokenizer", None)
+        self.direction_state[direction] = "unloaded"
+        
+        gc.collect()
+        if self.device == "cuda":
+            torch.cuda.empty_cache()
+        logger.info(f"Unloaded idle {direction} model")
+    
+    async def _idle_unload_loop(self):
+        """Periodically unload directions that have been idle longer than MODEL_IDLE_TIMEOUT"""
+        interval = max(1.0, min(60.0, self.model_idle_timeout / 2))
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            for direction, state in self.direction_state.items():
+                if state != "loaded" or self.direction_in_flight[direction] > 0 or self.direction_running[direction] > 0:
+                    continue
+                if now - self.direction_last_used[direction] < self.model_idle_timeout:
+                    continue
+                
+                async with self._direction_locks[direction]:
+                    # Re-check under the locks: a request or an orphaned job may have started meanwhile
+                    with self._running_lock:
+                        idle = time.monotonic() - self.direction_last_used[direction]
+                        if (self.direction_state[direction] == "loaded"
+                                and self.direction_in_flight[direction] == 0
+                                and self.direction_running[direction] == 0
+                                and idle >= self.model_idle_timeout):
+                            self._unload_direction(direction)
+    
+    def get_readiness(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Report per-direction model readiness
+        
+        Returns:
+            Mapping of direction to its state (unloaded, loading, loaded, failed, mock),
+            in-flight request count and idle time
+        """
+        now = time.monotonic()
+        readiness = {}
+        for direction, state in self.direction_state.items():
+            last_used = self.direction_last_used.get(direction)
+            readiness[direction] = {
+                "state": state,
+                "ready": state in ("loaded", "mock"),
+                "in_flight": self.direction_in_flight[direction],
+                "running": self.direction_running[direction],
+                "idle_seconds": round(now - last_used, 1) if state == "loaded" and last_used else None,
+                "error": self.direction_errors.get(direction) if state == "failed" else None
+            }
+        return readiness
+    
     def _use_mock_implementation(self):
         """Sets up the service to use mock implementations."""
         logger.info("Using mock implementation for development.")
@@ -122,6 +334,8 @@ class TranslationService:
         self.en_indic_tokenizer = "mock"
         self.indic_en_model = "mock"
         self.indic_en_tokenizer = "mock"
+        for direction in self.direction_state:
+            self.direction_state[direction] = "mock"
         self.model_loaded = True
 
     async def _download_fasttext_model(self):
@@ -156,44 +370,101 @@ class TranslationService:
             logger.warning("Falling back to rule-based detection")
             self.language_detector = "rule_based"
 
-    async def _load_indictrans2_model(self):
-        """Load IndicTrans2 translation models using Hugging Face transformers"""
-        try:
-            # Import transformers here to avoid import-time errors
-            from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
-            
-            logger.info(f"Loading IndicTrans2 models from: {self.model_dir}...")
+    def _load_indictrans2_model(self, direction: str):
+        """
+        Load one direction's IndicTrans2 model using Hugging Face transformers
+        
+        Args:
+            direction: "en-indic" or "indic-en"
             
+        Returns:
+            Tuple of (model, tokenizer)
+        """
+        try:
             # Get the correct model paths (relative to the project root, not backend folder)
-            import os
-            # Get the project root (one level up from backend)
             current_dir = os.path.dirname(__file__)  # backend directory
             project_root = os.path.dirname(current_dir)  # project root
+            model_name = {
+                "en-indic": "indictrans2-en-indic-1B",
+                "indic-en": "indictrans2-indic-en-1B"
+            }[direction]
+            model_path = os.path.join(project_root, "models", "indictrans2", model_name)
             
-            en_indic_path = os.path.join(project_root, "models", "indictrans2", "indictrans2-en-indic-1B")
-            indic_en_path = os.path.join(project_root, "models", "indictrans2", "indictrans2-indic-en-1B")
-            
-            logger.info(f"Loading EN→Indic model from {en_indic_path}...")
-            self.en_indic_tokenizer = AutoTokenizer.from_pretrained(en_indic_path, trust_remote_code=True)
-            self.en_indic_model = AutoModelForSeq2SeqLM.from_pretrained(en_indic_path, trust_remote_code=True)
-            self.en_indic_model.to(self.device)
-            self.en_indic_model.eval()
-            
-            logger.info(f"Loading Indic→EN model from {indic_en_path}...")
-            self.indic_en_tokenizer = AutoTokenizer.from_pretrained(indic_en_path, trust_remote_code=True)
-            self.indic_en_model = AutoModelForSeq2SeqLM.from_pretrained(indic_en_path, trust_remote_code=True)
-            self.indic_en_model.to(self.device)
-            self.indic_en_model.eval()
-            
-            logger.info("✅ IndicTrans2 models loaded successfully.")
+            logger.info(f"Loading {direction} model from {model_path} (precision: {self.model_precision})...")
+            tokenizer, model, stats = load_seq2seq_model(model_path, self.device, self.model_precision)
+            self._log_model_load(direction, stats)
+            return model, tokenizer
         except Exception as e:
-            logger.error(f"❌ Failed to load IndicTrans2 models: {str(e)}")
+            logger.error(f"❌ Failed to load IndicTrans2 {direction} model: {str(e)}")
             logger.error("Make sure you have:")
             logger.error("1. Downloaded the IndicTrans2 model files")
             logger.error("2. Set the correct MODEL_PATH in .env")
             logger.error("3. Installed all required dependencies")
             raise
     
+    def _log_model_load(self, direction: str, stats: Dict[str, Any]):
+        """Record and log load time and memory footprint of a direction's model"""
+        self.model_load_stats[direction] = stats
+        logger.info(
+            f"Loaded {direction} model in {stats['load_seconds']}s "
+            f"(precision: {stats['precision']}, weights: {stats['model_size_mb']} MB, "
+            f"resident memory: {stats['rss_mb']} MB, +{stats['rss_delta_mb']} MB)"
+        )
+    
+    def _load_ctranslate2_model(self, direction: str):
+        """
+        Load one direction's CTranslate2 checkpoint through indictrans2.engine.Model
+        
+        Args:
+            direction: "en-indic" or "indic-en"
+            
+        Returns:
+            Tuple of (engine model, None); the engine does its own tokenization
+        """
+        try:
+            # Import the engine here; it pulls in indic-nlp, moses and ctranslate2
+            from indictrans2.engine import Model
+            
+            project_root = os.path.dirname(os.path.dirname(__file__))
+            ct2_dir = os.path.join(project_root, "models", "indictrans2", "ct2")
+            if direction == "en-indic":
+                model_path = os.getenv("CT2_EN_INDIC_PATH", os.path.join(ct2_dir, "en-indic"))
+            else:
+                model_path = os.getenv("CT2_INDIC_EN_PATH", os.path.join(ct2_dir, "indic-en"))
+            
+            logger.info(f"Loading CTranslate2 {direction} model from {model_path} (compute type: {self.ct2_compute_type})...")
+            rss_before = resident_memory_mb()
+            start = time.perf_counter()
+            model = Model(
+                model_path,
+                device=self.device,
+                input_lang_code_format="flores",
+                model_type="ctranslate2",
+                sentence_cache_size=int(os.getenv("SENTENCE_CACHE_SIZE", "10000")),
+                compute_type=self.ct2_compute_type,
+                sentence_splitter_pool_size=int(
+                    os.getenv("SENTENCE_SPLITTER_POOL_SIZE", os.getenv("INFERENCE_WORKERS", "1"))
+                ),
+                preprocess_workers=int(os.getenv("PREPROCESS_WORKERS", "0")),
+                preprocess_min_batch=int(os.getenv("PREPROCESS_MIN_BATCH", "64")),
+                # Only the languages this service exposes need warm normalizers
+                warm_up_languages=sorted(set(self.lang_code_map.values()))
+            )
+            rss_after = resident_memory_mb()
+            self._log_model_load(direction, {
+                "precision": self.ct2_compute_type,
+                "load_seconds": round(time.perf_counter() - start, 2),
+                "model_size_mb": None,
+                "rss_mb": round(rss_after, 1),
+                "rss_delta_mb": round(rss_after - rss_before, 1)
+            })
+            return model, None
+        except Exception as e:
+            logger.error(f"❌ Failed to load CTranslate2 {direction} model: {str(e)}")
+            logger.error("Make sure the converted CTranslate2 checkpoints (with vocab/model.SRC and vocab/model.TGT)")
+            logger.error("exist at CT2_EN_INDIC_PATH / CT2_INDIC_EN_PATH and ctranslate2 is installed")
+            raise
+    
     async def detect_language(self, text: str) -> Dict[str, Any]:
         """
         Detect language of input text
@@ -289,56 +560,381 @@ class TranslationService:
             
             logger.info(f"Using IndicTrans2 codes: {src_code} -> {tgt_code}")
             
-            # Choose the right model and tokenizer based on direction
-            if src_lang_code == "en" and tgt_lang_code != "en":
-                # English to Indic
-                model = self.en_indic_model
-                tokenizer = self.en_indic_tokenizer
-                input_text = f"{src_code} {tgt_code} {text}"
-            elif src_lang_code != "en" and tgt_lang_code == "en":
-                # Indic to English
-                model = self.indic_en_model
-                tokenizer = self.indic_en_tokenizer
-                input_text = f"{src_code} {tgt_code} {text}"
+            # Serve from cache, otherwise queue for the micro-batcher, which shares
+            # one generate call across concurrent requests. Indic to Indic pivots through English.
+            results = await self._translate_many([text], source_lang, [target_lang], use_batcher=True)
+            return results[target_lang][0]
+            
+        except (InferenceOverloadedError, InferenceTimeoutError):
+            raise
+        except Exception as e:
+            logger.error(f"Translation failed: {str(e)}")
+            # Fallback to mock translation
+            return self._mock_translate(text, source_lang, target_lang)
+    
+    def _cache_key(self, text: str, src_code: str, tgt_code: str) -> str:
+        """Build the cache key for a translation with the current model and decoding parameters"""
+        return make_cache_key(text, src_code, tgt_code, self.model_id, self.generation_config)
+    
+    async def _translate_payloads(self, direction: str, payloads: List[tuple], use_batcher: bool = False) -> List[str]:
+        """
+        Translate payloads of one direction, serving repeated texts from the cache
+        
+        Args:
+            direction: "en-indic" or "indic-en"
+            payloads: List of (text, src_code, tgt_code) tuples using IndicTrans2 codes
+            use_batcher: Route misses through the micro-batcher instead of one direct batch
+            
+        Returns:
+            Translated texts in the same order as the payloads
+        """
+        if not self.cache_enabled:
+            return await self._run_direction(direction, payloads, use_batcher)
+        
+        keys = [self._cache_key(*payload) for payload in payloads]
+        translations: List[Optional[str]] = [self.cache.get_from_memory(key) for key in keys]
+        
+        # Keys that missed the LRU tier are read from SQLite in one query off the event loop
+        loop = asyncio.get_running_loop()
+        memory_misses = list(dict.fromkeys(key for key, text in zip(keys, translations) if text is None))
+        if memory_misses and self.cache.db_manager is not None:
+            persisted = await loop.run_in_executor(None, self.cache.get_persistent, memory_misses)
+            translations = [
+                translated_text if translated_text is not None else persisted.get(key)
+                for key, translated_text in zip(keys, translations)
+            ]
+        elif memory_misses:
+            self.cache.get_persistent(memory_misses)
+        
+        # Translate each distinct missing key once
+        missing: Dict[str, int] = {}
+        for index, translated_text in enumerate(translations):
+            if translated_text is None and keys[index] not in missing:
+                missing[keys[index]] = index
+        
+        if missing:
+            miss_payloads = [payloads[index] for index in missing.values()]
+            generated = await self._run_direction(direction, miss_payloads, use_batcher)
+            
+            generated_by_key = {}
+            entries = []
+            for (key, index), translated_text in zip(missing.items(), generated):
+                _, src_code, tgt_code = payloads[index]
+                entries.append((key, translated_text, src_code, tgt_code))
+                generated_by_key[key] = translated_text
+            
+            # The response does not wait for the persistent write: one transaction per batch
+            # runs in the background
+            rows = self.cache.put_many(entries)
+            if self.cache.db_manager is not None:
+                loop.run_in_executor(None, self.cache.persist, rows)
+            
+            translations = [
+                translated_text if translated_text is not None else generated_by_key[key]
+                for key, translated_text in zip(keys, translations)
+            ]
+        
+        return translations
+    
+    async def _run_direction(self, direction: str, payloads: List[tuple], use_batcher: bool) -> List[str]:
+        """
+        Run the model of one direction, loading it first if needed
+        
+        The in-flight counter keeps the idle reaper from unloading a model mid-batch.
+        """
+        await self._ensure_direction_loaded(direction)
+        
+        if use_batcher and self._queued_requests + len(payloads) > self.max_queue_size:
+            self.queue_rejections += 1
+            raise InferenceOverloadedError(
+                f"Translation queue is full ({self._queued_requests}/{self.max_queue_size} requests waiting)"
+            )
+        
+        queued = len(payloads) if use_batcher else 0
+        self._queued_requests += queued
+        self.direction_in_flight[direction] += 1
+        try:
+            if use_batcher:
+                work = asyncio.gather(*(self.batcher.submit(direction, p) for p in payloads))
             else:
-                # For Indic to Indic, use English as pivot (not ideal but works)
-                if src_lang_code != "en":
-                    # First translate to English
-                    intermediate_result = await self.translate(text, src_lang_code, "en")
-                    intermediate_text = intermediate_result["translated_text"]
-                    # Then translate from English to target
-                    return await self.translate(intermediate_text, "en", tgt_lang_code)
-                else:
-                    # Same language, return as is
-                    return {
-                        "translated_text": text,
-                        "source_language": source_lang,
-                        "target_language": target_lang,
-                        "model": "IndicTrans2 (No translation needed)",
-                        "confidence": 1.0
-                    }
+                work = self._generate_batch_async(direction, payloads)
+            
+            try:
+                return list(await asyncio.wait_for(work, timeout=self.inference_timeout or None))
+            except asyncio.TimeoutError:
+                self.inference_timeouts += 1
+                raise InferenceTimeoutError(
+                    f"{direction} translation timed out after {self.inference_timeout:g}s"
+                )
+        finally:
+            self._queued_requests -= queued
+            self.direction_in_flight[direction] -= 1
+            self.direction_last_used[direction] = time.monotonic()
+    
+    async def _generate_batch_async(self, direction: str, payloads: List[tuple]) -> List[str]:
+        """Run _generate_batch on the inference pool so the event loop stays responsive"""
+        return await self.inference.run(self._generate_batch, direction, payloads)
+    
+    def get_inference_stats(self) -> Dict[str, Any]:
+        """Return inference pool load, rejections and timeouts"""
+        return {
+            **self.inference.get_stats(),
+            "queue_depth": self.batcher.queue_depth(),
+            "queued_requests": self._queued_requests,
+            "max_queue_size": self.max_queue_size,
+            "queue_rejections": self.queue_rejections,
+            "timeout_seconds": self.inference_timeout,
+            "timeouts": self.inference_timeouts
+        }
+    
+    def invalidate_cached_translation(self, original_text: str, source_lang: str, target_lang: str):
+        """
+        Drop a cached translation, e.g. after a correction was submitted for it
+        
+        Indic to Indic translations are cached as two pivot legs through English; both
+        legs are dropped. The second leg's key depends on the English intermediate, so it
+        can only be found while the first leg is still cached. Blocking (SQLite I/O).
+        
+        Args:
+            original_text: Source text of the translation
+            source_lang: Source language code or name
+            target_lang: Target language code or name
+        """
+        src_lang_code = self.lang_name_to_code.get(source_lang, source_lang)
+        tgt_lang_code = self.lang_name_to_code.get(target_lang, target_lang)
+        src_code = self.lang_code_map.get(src_lang_code, src_lang_code)
+        tgt_code = self.lang_code_map.get(tgt_lang_code, tgt_lang_code)
+        
+        if src_lang_code == "en" or tgt_lang_code == "en":
+            self.cache.invalidate([self._cache_key(original_text, src_code, tgt_code)])
+            return
+        
+        en_code = self.lang_code_map["en"]
+        first_leg = self._cache_key(original_text, src_code, en_code)
+        keys = [first_leg]
+        english_text = self.cache.get(first_leg)
+        if english_text is not None:
+            keys.append(self._cache_key(english_text, en_code, tgt_code))
+        self.cache.invalidate(keys)
+    
+    def remember_correction(
+        self,
+        original_text: str,
+        corrected_text: str,
+        source_lang: str,
+        target_lang: str,
+        translation_id: Optional[int] = None
+    ):
+        """
+        Make an accepted correction the translation memory entry for its source text
+        
+        Args:
+            original_text: Source text of the corrected translation
+            corrected_text: Corrected translation
+            source_lang: Source language code or name
+            target_lang: Target language code or name
+            translation_id: ID of the corrected translation
+        """
+        if not self.tm_enabled:
+            return
+        self.translation_memory.add(
+            original_text,
+            self.lang_name_to_code.get(source_lang, source_lang),
+            self.lang_name_to_code.get(target_lang, target_lang),
+            corrected_text,
+            translation_id=translation_id,
+            corrected=True
+        )
+    
+    def load_translation_memory(self, limit: Optional[int] = None) -> int:
+        """
+        Build the translation memory from stored translations and corrections
+        
+        Args:
+            limit: Maximum number of most recent translations to index (None for all)
+            
+        Returns:
+            Number of translations read
+        """
+        if not self.tm_enabled or self.db_manager is None:
+            return 0
+        
+        try:
+            start = time.perf_counter()
+            rows = (
+                {
+                    **row,
+                    "source_language": self.lang_name_to_code.get(row["source_language"], row["source_language"]),
+                    "target_language": self.lang_name_to_code.get(row["target_language"], row["target_language"]),
+                }
+                for row in self.db_manager.iter_translation_memory(
+                    limit=limit, max_confidence=MEMORY_HIT_CONFIDENCE
+                )
+            )
+            loaded = self.translation_memory.load(rows)
+            logger.info(
+                f"Translation memory loaded {loaded} translations into "
+                f"{len(self.translation_memory)} entries in {time.perf_counter() - start:.1f}s"
+            )
+            return loaded
+        except Exception as e:
+            logger.warning(f"Translation memory load failed: {str(e)}")
+            return 0
+    
+    def get_translation_memory_stats(self) -> Dict[str, Any]:
+        """Return translation memory size, hit counters and lookup latency"""
+        return {"enabled": self.tm_enabled, **self.translation_memory.get_stats()}
+    
+    def warm_up_cache(self, limit: int = 1000) -> int:
+        """
+        Preload the in-memory cache tier with the most frequently translated texts
+        
+        Args:
+            limit: Number of frequent (text, language pair) rows to consider
+            
+        Returns:
+            Number of cache entries loaded
+        """
+        if not self.cache_enabled or self.cache.db_manager is None or self.en_indic_model == "mock":
+            return 0
+        
+        try:
+            rows = self.cache.db_manager.get_frequent_translations(limit)
+            keys = []
+            for row in rows:
+                src_code = self.lang_code_map.get(row["source_language"], row["source_language"])
+                tgt_code = self.lang_code_map.get(row["target_language"], row["target_language"])
+                keys.append(self._cache_key(row["original_text"], src_code, tgt_code))
+            
+            loaded = self.cache.warm_up(keys)
+            logger.info(f"Translation cache warmed up with {loaded} entries")
+            return loaded
+        except Exception as e:
+            logger.warning(f"Translation cache warm-up failed: {str(e)}")
+            return 0
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Return translation cache hit/miss counters"""
+        return self.cache.get_stats()
+    
+    def get_model_load_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return load time and memory footprint per model direction"""
+        return dict(self.model_load_stats)
+    
+    def get_engine_stats(self) -> Dict[str, Any]:
+        """Return sentence dedupe/cache statistics of the CTranslate2 engines"""
+        if self.model_type != "ctranslate2":
+            return {}
+        stats = {}
+        for direction in ("en-indic", "indic-en"):
+            model, _ = self._get_direction_model(direction)
+            if hasattr(model, "get_sentence_cache_stats"):
+                stats[direction] = {
+                    **model.get_sentence_cache_stats(),
+                    "sentence_splitters": model.get_sentence_splitter_stats(),
+                    "text_init": model.get_text_init_report()
+                }
+        return stats
+    
+    def _get_direction_model(self, direction: str):
+        """Return the (model, tokenizer) pair serving a translation direction"""
+        if direction == "en-indic":
+            return self.en_indic_model, self.en_indic_tokenizer
+        if direction == "indic-en":
+            return self.indic_en_model, self.indic_en_tokenizer
+        raise ValueError(f"Unknown translation direction: {direction}")
+    
+    def _generate_batch(self, direction: str, payloads: List[tuple]) -> List[str]:
+        """
+        Translate a batch of texts that share a model direction on the current thread
+        
+        The job counts as running until it returns, even if the request that submitted
+        it has already timed out, so the idle reaper cannot unload the model under it.
+        """
+        with self._running_lock:
+            self.direction_running[direction] += 1
+            model, tokenizer = self._get_direction_model(direction)
+        try:
+            return self._generate_with_model(model, tokenizer, payloads)
+        finally:
+            with self._running_lock:
+                self.direction_running[direction] -= 1
+                self.direction_last_used[direction] = time.monotonic()
+    
+    def _generate_with_model(self, model, tokenizer, payloads: List[tuple]) -> List[str]:
+        """
+        Translate a batch of texts with one direction's model and tokenizer
+        
+        The batch is tokenized once, sorted by length and decoded in chunks whose
+        padded size stays within the token budget, so short texts are not padded
+        up to the longest one. Results are returned in the original order.
+        
+        Args:
+            model: Loaded model of the direction
+            tokenizer: Its tokenizer (None for CTranslate2)
+            payloads: List of (text, src_code, tgt_code) tuples using IndicTrans2 codes
             
-            # Tokenize and translate
-            inputs = tokenizer(input_text, return_tensors="pt", padding=True, truncation=True, max_length=512)
+        Returns:
+            Translated texts in the same order as the payloads
+        """
+        if self.model_type == "ctranslate2":
+            # The engine handles sentence splitting, pre/post-processing and token-based batching.
+            # Large batches run as a pipeline so preprocessing overlaps with decoding.
+            if self.engine_pipeline_chunk_size and len(payloads) > self.engine_pipeline_chunk_size:
+                return list(model.paragraphs_translate_stream(
+                    list(payloads), chunk_size=self.engine_pipeline_chunk_size
+                ))
+            return model.paragraphs_batch_translate__multilingual(list(payloads))
+        
+        input_texts = [f"{src_code} {tgt_code} {text}" for text, src_code, tgt_code in payloads]
+        
+        # Tokenize the whole list at once; padding happens per chunk
+        encodings = tokenizer(input_texts, truncation=True, max_length=512)
+        lengths = [len(ids) for ids in encodings["input_ids"]]
+        order = sorted(range(len(input_texts)), key=lambda i: lengths[i])
+        
+        translations: List[Optional[str]] = [None] * len(input_texts)
+        for chunk in self._length_buckets(order, lengths):
+            features = [{key: encodings[key][i] for key in encodings.keys()} for i in chunk]
+            inputs = tokenizer.pad(features, padding=True, return_tensors="pt")
             inputs = {k: v.to(self.device) for k, v in inputs.items()}
             
             with torch.no_grad():
-                outputs = model.generate(**inputs, max_length=512, num_beams=5, do_sample=False)
-            
-            translated_text = tokenizer.decode(outputs[0], skip_special_tokens=True)
+                outputs = model.generate(**inputs, **self.generation_config)
             
-            return {
-                "translated_text": translated_text,
-                "source_language": source_lang,
-                "target_language": target_lang,
-                "model": "IndicTrans2",
-                "confidence": 0.92
-            }
+            decoded = tokenizer.batch_decode(outputs, skip_special_tokens=True)
+            for index, translated_text in zip(chunk, decoded):
+                translations[index] = translated_text
+        
+        return translations
+    
+    def _length_buckets(self, order: List[int], lengths: List[int]) -> List[List[int]]:
+        """
+        Split length-sorted indices into chunks under the token budget
+        
+        Args:
+            order: Indices sorted by ascending token length
+            lengths: Token length of each input
             
-        except Exception as e:
-            logger.error(f"Translation failed: {str(e)}")
-            # Fallback to mock translation
-            return self._mock_translate(text, source_lang, target_lang)
+        Returns:
+            List of index chunks; each chunk's padded size (count x longest) fits the budget
+        """
+        chunks = []
+        current: List[int] = []
+        for index in order:
+            # Sorted ascending, so the incoming item is the longest in the chunk
+            padded_tokens = (len(current) + 1) * lengths[index]
+            if current and (padded_tokens > self.batch_token_budget or len(current) >= self.max_batch_sentences):
+                chunks.append(current)
+                current = []
+            current.append(index)
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    def get_batching_stats(self) -> Dict[str, Any]:
+        """Return micro-batching queue depth and achieved batch sizes"""
+        return self.batcher.get_stats()
     
     def _mock_translate(self, text: str, source_lang: str, target_lang: str) -> Dict[str, Any]:
         """Mock translation for development and fallback"""
@@ -367,26 +963,200 @@ class TranslationService:
     async def batch_translate(self, texts: List[str], source_lang: str, target_lang: str) -> List[Dict[str, Any]]:
         """
         Translate multiple texts in batch for efficiency
+        
+        The whole list is tokenized once and decoded in length-bucketed chunks
+        instead of running one beam search per text.
+        """
+        results = await self.translate_multi(texts, source_lang, [target_lang])
+        return results[target_lang]
+    
+    async def translate_multi(self, texts: List[str], source_lang: str, target_langs: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Translate texts from one source language into several target languages
+        
+        All texts share one batch per model leg: for an Indic source the Indic→English
+        step runs once and its English output fans out to every Indic target in a
+        single English→Indic batch.
+        
+        Args:
+            texts: Texts in the source language
+            source_lang: Source language code or name
+            target_langs: Target language codes or names
+            
+        Returns:
+            Mapping of each target language to per-text result dictionaries
         """
         await self.load_models()
         
         if self.model_type == "mock" or self.en_indic_model == "mock":
-            return [self._mock_translate(text, source_lang, target_lang) for text in texts]
+            return {
+                target_lang: [self._mock_translate(text, source_lang, target_lang) for text in texts]
+                for target_lang in target_langs
+            }
         
         try:
-            results = []
-            for text in texts:
-                result = await self.translate(text, source_lang, target_lang)
-                result["original_text"] = text
-                results.append(result)
-            
-            return results
+            return await self._translate_many(texts, source_lang, target_langs)
             
+        except (InferenceOverloadedError, InferenceTimeoutError):
+            raise
         except Exception as e:
             logger.error(f"Batch translation failed: {str(e)}")
             # Fallback to individual mock translations
-            return [self._mock_translate(text, source_lang, target_lang) for text in texts]
-
+            return {
+                target_lang: [self._mock_translate(text, source_lang, target_lang) for text in texts]
+                for target_lang in target_langs
+            }
+    
+    async def _translate_many(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_langs: List[str],
+        use_batcher: bool = False
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Translate texts into several targets, running each model leg once
+        
+        Args:
+            texts: Texts in the source language
+            source_lang: Source language code or name
+            target_langs: Target language codes or names
+            use_batcher: Route model work through the micro-batcher (single requests)
+            
+        Returns:
+            Mapping of each target language to per-text result dictionaries
+        """
+        src_lang_code = self.lang_name_to_code.get(source_lang, source_lang)
+        src_code = self.lang_code_map.get(src_lang_code, src_lang_code)
+        en_code = self.lang_code_map["en"]
+        
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        if not texts:
+            return {target_lang: [] for target_lang in target_langs}
+        
+        # Resolve targets; same-language targets need no model work
+        model_targets = []
+        for target_lang in dict.fromkeys(target_langs):
+            tgt_lang_code = self.lang_name_to_code.get(target_lang, target_lang)
+            if tgt_lang_code == src_lang_code:
+                results[target_lang] = [
+                    self._build_result(text, text, source_lang, target_lang,
+                                       "IndicTrans2 (No translation needed)", MEMORY_HIT_CONFIDENCE)
+                    for text in texts
+                ]
+            else:
+                model_targets.append((target_lang, tgt_lang_code))
+        
+        if not model_targets:
+            return results
+        
+        # Serve exact and numbers-only matches from the translation memory; only the
+        # remaining (text, target) pairs go through the model legs. Fuzzy matches can
+        # differ in a size or colour word, so they are attached as suggestions only.
+        memory_hits = {}
+        memory_suggestions = {}
+        if self.tm_enabled:
+            for target_lang, tgt_lang_code in model_targets:
+                for index, text in enumerate(texts):
+                    match = self.translation_memory.lookup(text, src_lang_code, tgt_lang_code)
+                    if match is None:
+                        continue
+                    if match.servable:
+                        memory_hits[(target_lang, index)] = match
+                    else:
+                        memory_suggestions[(target_lang, index)] = match
+        pending = [
+            index for index in range(len(texts))
+            if any((target_lang, index) not in memory_hits for target_lang, _ in model_targets)
+        ]
+        
+        # First leg: get English text. For an Indic source this runs once for all targets,
+        # and the intermediate is cached under the Indic→English key for later requests.
+        if src_lang_code == "en":
+            english_texts = {index: texts[index] for index in pending}
+        elif pending:
+            english_texts = dict(zip(pending, await self._translate_payloads(
+                "indic-en", [(texts[index], src_code, en_code) for index in pending], use_batcher=use_batcher
+            )))
+        else:
+            english_texts = {}
+        
+        # Second leg: fan the English text out to every Indic target in one batch
+        slots = [
+            (target_lang, tgt_lang_code, index)
+            for target_lang, tgt_lang_code in model_targets if tgt_lang_code != "en"
+            for index in pending if (target_lang, index) not in memory_hits
+        ]
+        payloads = [
+            (english_texts[index], en_code, self.lang_code_map.get(tgt_lang_code, tgt_lang_code))
+            for _, tgt_lang_code, index in slots
+        ]
+        translated = await self._translate_payloads("en-indic", payloads, use_batcher=use_batcher) if payloads else []
+        generated = {(target_lang, index): text for (target_lang, _, index), text in zip(slots, translated)}
+        
+        for target_lang, tgt_lang_code in model_targets:
+            target_results = []
+            for index, text in enumerate(texts):
+                match = memory_hits.get((target_lang, index))
+                if match is not None:
+                    model = "Translation Memory (corrected)" if match.corrected else "Translation Memory"
+                    target_results.append(self._build_result(
+                        text, match.translated_text, source_lang, target_lang, model, MEMORY_HIT_CONFIDENCE
+                    ))
+                    continue
+                
+                translated_text = english_texts[index] if tgt_lang_code == "en" else generated[(target_lang, index)]
+                if self.tm_enabled:
+                    self.translation_memory.add(text, src_lang_code, tgt_lang_code, translated_text)
+                result = self._build_result(text, translated_text, source_lang, target_lang, "IndicTrans2", 0.92)
+                suggestion = memory_suggestions.get((target_lang, index))
+                if suggestion is not None:
+                    result["memory_suggestion"] = {
+                        "translated_text": suggestion.translated_text,
+                        "similarity": round(suggestion.similarity, 4),
+                        "corrected": suggestion.corrected,
+                        "translation_id": suggestion.translation_id
+                    }
+                target_results.append(result)
+            results[target_lang] = target_results
+        
+        return results
+    
+    def _build_result(
+        self,
+        original_text: str,
+        translated_text: str,
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        confidence: float
+    ) -> Dict[str, Any]:
+        """Build a translation result dictionary"""
+        return {
+            "original_text": original_text,
+            "translated_text": translated_text,
+            "source_language": source_lang,
+            "target_language": target_lang,
+            "model": model,
+            "confidence": confidence
+        }
+    
+    async def close(self):
+        """Stop background tasks (micro-batcher workers, idle unloader, inference pool, engine subprocesses)"""
+        if self._idle_unload_task is not None:
+            self._idle_unload_task.cancel()
+            try:
+                await self._idle_unload_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._idle_unload_task = None
+        await self.batcher.close()
+        self.inference.shutdown()
+        for direction in ("en-indic", "indic-en"):
+            model, _ = self._get_direction_model(direction)
+            if hasattr(model, "close"):
+                model.close()
+    
     def get_supported_languages(self) -> Dict[str, str]:
         """Return supported languages"""
         return SUPPORTED_LANGUAGES
@@ -0,0 +1,338 @@
+"""
+Write-behind buffer for translation history inserts
+Hands out translation IDs immediately and commits rows in batches on a background thread
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# A zero interval would make the flush thread spin on an idle queue
+MIN_FLUSH_INTERVAL_MS = 1.0
+
+
+class TranslationWriteBehind:
+    """
+    Buffers translation records and flushes them in batched transactions.
+
+    IDs come from blocks reserved up front with DatabaseManager.reserve_translation_ids,
+    so callers get their translation_id without waiting for the commit. Because those IDs
+    are already in client responses, a batch that cannot be written is never dropped: it
+    stays queued and is retried with exponential backoff, and whatever is still unwritten
+    at shutdown is spilled to a JSONL file that is replayed on the next start.
+    """
+
+    def __init__(
+        self,
+        db_manager,
+        enabled: bool = True,
+        max_batch_size: int = 256,
+        flush_interval_ms: float = 50.0,
+        id_block_size: int = 1000,
+        max_retries: int = 3,
+        max_backoff_seconds: float = 30.0,
+        spill_path: Optional[str] = None
+    ):
+        """
+        Args:
+            db_manager: DatabaseManager that owns the translations table
+            enabled: When False, submit() writes synchronously on the caller's thread
+            max_batch_size: Flush as soon as this many records are buffered
+            flush_interval_ms: Flush buffered records at least this often (at least 1 ms)
+            id_block_size: Number of IDs reserved per round-trip to the database
+            max_retries: Immediate attempts per flush before the batch is requeued for a later retry
+            max_backoff_seconds: Longest pause between retries of a failing batch
+            spill_path: JSONL file receiving records still unwritten at shutdown (None to keep
+                them only in memory)
+        """
+        self.db_manager = db_manager
+        self.enabled = enabled
+        self.max_batch_size = max(1, max_batch_size)
+        self.flush_interval = max(MIN_FLUSH_INTERVAL_MS, flush_interval_ms) / 1000.0
+        self.id_block_size = max(1, id_block_size)
+        self.max_retries = max(1, max_retries)
+        self.max_backoff_seconds = max_backoff_seconds
+        self.spill_path = spill_path
+
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopping = False
+
+        # Reserved ID block: next ID to hand out and last ID of the block
+        self._id_lock = threading.Lock()
+        self._next_id = 0
+        self._last_reserved_id = -1
+
+        # Sequence numbers let flush() wait for everything submitted before it
+        self._submitted = 0
+        self._completed = 0
+
+        # Backoff state while the database rejects writes
+        self._retry_at = 0.0
+        self.consecutive_failures = 0
+        self.failed_flushes = 0
+        self.last_error: Optional[str] = None
+
+        self.flushes = 0
+        self.rows_written = 0
+        self.rows_spilled = 0
+        self.rows_replayed = 0
+        self.rows_rejected = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    def start(self):
+        """Start the background flush thread"""
+        if not self.enabled or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._replay_spill()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="translation-write-behind", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Write-behind started (batch={self.max_batch_size}, "
+            f"interval={self.flush_interval * 1000:.0f}ms)"
+        )
+
+    def _allocate_ids(self, count: int) -> List[int]:
+        """Hand out IDs from the reserved block, reserving a new block when it runs out"""
+        with self._id_lock:
+            ids = []
+            while len(ids) < count:
+                if self._next_id > self._last_reserved_id:
+                    block = max(self.id_block_size, count - len(ids))
+                    self._next_id = self.db_manager.reserve_translation_ids(block)
+                    self._last_reserved_id = self._next_id + block - 1
+                take = min(count - len(ids), self._last_reserved_id - self._next_id + 1)
+                ids.extend(range(self._next_id, self._next_id + take))
+                self._next_id += take
+            return ids
+
+    def submit(self, records: List[Dict[str, Any]]) -> List[int]:
+        """
+        Queue translation records for insertion
+
+        Args:
+            records: Dictionaries with original_text, translated_text, source_language,
+                target_language and optional model_confidence
+
+        Returns:
+            Translation IDs in the same order as the records
+        """
+        if not records:
+            return []
+        if not self.enabled:
+            first_id, last_id = self.db_manager.store_translations_bulk(records)
+            return list(range(first_id, last_id + 1))
+
+        ids = self._allocate_ids(len(records))
+        created_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+        with self._condition:
+            for translation_id, record in zip(ids, records):
+                self._queue.append({**record, "id": translation_id, "created_at": created_at})
+            self._submitted += len(records)
+            if len(self._queue) >= self.max_batch_size:
+                self._condition.notify_all()
+
+        return ids
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Wait until every record submitted so far has been written
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the buffer was drained in time
+        """
+        if not self.enabled:
+            return True
+
+        if self._thread is None or not self._thread.is_alive():
+            # No flush thread (not started or already stopped): write inline
+            while self._queue:
+                if not self._flush_batch():
+                    return False
+            return True
+
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            target = self._submitted
+            self._condition.notify_all()
+            while self._completed < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(timeout=remaining)
+        return True
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        """Pop up to max_batch_size records; caller holds the condition"""
+        size = min(len(self._queue), self.max_batch_size)
+        return [self._queue.popleft() for _ in range(size)]
+
+    def _flush_batch(self) -> bool:
+        """
+        Write one batch, retrying transient failures
+
+        Returns:
+            True if the batch was written; a failed batch goes back to the front of the queue
+        """
+        with self._condition:
+            batch = self._take_batch()
+        if not batch:
+            return True
+
+        start = time.perf_counter()
+        written = False
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                self.db_manager.insert_translations_with_ids(batch)
+                written = True
+                break
+            except sqlite3.IntegrityError as e:
+                # Retrying cannot fix bad rows; set them aside instead of blocking the queue
+                logger.error(f"Write-behind batch rejected by the database: {str(e)}")
+                self._write_records(self.spill_path + ".rejected" if self.spill_path else None, batch)
+                with self._condition:
+                    self.rows_rejected += len(batch)
+                    self._completed += len(batch)
+                    self._condition.notify_all()
+                return True
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"Write-behind flush failed (attempt {attempt}/{self.max_retries}): {str(e)}")
+                if attempt < self.max_retries:
+                    time.sleep(min(0.1 * attempt, 1.0))
+
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        with self._condition:
+            if written:
+                self.flushes += 1
+                self.rows_written += len(batch)
+                self.last_flush_ms = elapsed_ms
+                self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+                self._total_flush_ms += elapsed_ms
+                self.consecutive_failures = 0
+                self.last_error = None
+                self._retry_at = 0.0
+                self._completed += len(batch)
+            else:
+                # Clients already hold these IDs: keep the rows and retry after a backoff
+                self._queue.extendleft(reversed(batch))
+                self.failed_flushes += 1
+                self.consecutive_failures += 1
+                backoff = min(self.max_backoff_seconds, 0.5 * 2 ** (self.consecutive_failures - 1))
+                self._retry_at = time.monotonic() + backoff
+                logger.error(
+                    f"Keeping {len(batch)} translation records queued after {self.max_retries} attempts; "
+                    f"retrying in {backoff:.1f}s"
+                )
+            self._condition.notify_all()
+        return written
+
+    def _run(self):
+        """Flush loop: wake on a full batch, an explicit flush or the interval; back off while failing"""
+        while True:
+            with self._condition:
+                backoff = self._retry_at - time.monotonic()
+                if backoff > 0 and not self._stopping:
+                    self._condition.wait(timeout=backoff)
+                    continue
+                if len(self._queue) < self.max_batch_size and not self._stopping:
+                    # Give a partial batch up to one interval to fill up
+                    self._condition.wait(timeout=self.flush_interval)
+                if self._stopping and not self._queue:
+                    return
+
+            if not self._flush_batch() and self._stopping:
+                # The database is still failing at shutdown; close() spills the rest
+                return
+
+    def close(self, timeout: float = 30.0):
+        """Flush everything still buffered, stop the background thread and spill what could not be written"""
+        if not self.enabled or self._thread is None:
+            return
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join(timeout=timeout)
+        if not self._thread.is_alive():
+            self._spill()
+        logger.info(f"Write-behind stopped ({self.rows_written} rows written, {len(self._queue)} left)")
+
+    def _spill(self):
+        """Append unwritten records to the spill file"""
+        with self._condition:
+            records = list(self._queue)
+            self._queue.clear()
+        if not records:
+            return
+        if self._write_records(self.spill_path, records):
+            self.rows_spilled += len(records)
+            logger.warning(f"Spilled {len(records)} unwritten translation records to {self.spill_path}")
+
+    @staticmethod
+    def _write_records(path: Optional[str], records: List[Dict[str, Any]]) -> bool:
+        """Append records to a JSONL file; returns False (and logs the loss) without a path"""
+        if path is None:
+            logger.error(f"Lost {len(records)} unwritten translation records (no spill file configured)")
+            return False
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as spill:
+            for record in records:
+                spill.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return True
+
+    def _replay_spill(self):
+        """Queue the records spilled by a previous shutdown ahead of new submissions"""
+        if self.spill_path is None or not os.path.exists(self.spill_path):
+            return
+        with open(self.spill_path, encoding="utf-8") as spill:
+            records = [json.loads(line) for line in spill if line.strip()]
+        os.remove(self.spill_path)
+        with self._condition:
+            self._queue.extendleft(reversed(records))
+            self._submitted += len(records)
+        self.rows_replayed += len(records)
+        logger.info(f"Replaying {len(records)} spilled translation records")
+
+    def get_health(self) -> Dict[str, Any]:
+        """Whether buffered history is reaching the database (reported by /ready)"""
+        return {
+            "healthy": self.consecutive_failures == 0,
+            "queue_length": len(self._queue),
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return queue length and flush latency statistics"""
+        return {
+            "enabled": self.enabled,
+            "queue_length": len(self._queue),
+            "max_batch_size": self.max_batch_size,
+            "flush_interval_ms": self.flush_interval * 1000.0,
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "failed_flushes": self.failed_flushes,
+            "consecutive_failures": self.consecutive_failures,
+            "rows_spilled": self.rows_spilled,
+            "rows_replayed": self.rows_replayed,
+            "rows_rejected": self.rows_rejected,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "max_flush_ms": round(self.max_flush_ms, 2),
+            "avg_flush_ms": round(self._total_flush_ms / self.flushes, 2) if self.flushes else 0.0,
+        }
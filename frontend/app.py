@@ -10,6 +10,7 @@ import pandas as pd
 from datetime import datetime
 import time
 from typing import Dict, List, Optional
+from urllib.parse import urlencode
 
 # Configure Streamlit page
 st.set_page_config(
@@ -196,44 +197,34 @@ def process_translations(title: str, description: str, category: str, source_lan
             source_lang = detection_result.get("language", "en")
             st.info(f"🔍 Detected source language: {SUPPORTED_LANGUAGES.get(source_lang, source_lang)}")
     
-    # Translate to each target language
-    for target_lang in target_languages:
-        if target_lang == source_lang:
-            # Skip if source and target are the same
-            continue
-        
-        translations[target_lang] = {}
-        
-        # Translate title
-        title_result = make_api_request("/translate", "POST", {
-            "text": title,
-            "source_language": source_lang,
-            "target_language": target_lang
-        })
-        
-        if title_result:
-            translations[target_lang]["title"] = title_result
-        
-        # Translate description
-        description_result = make_api_request("/translate", "POST", {
-            "text": description,
-            "source_language": source_lang,
-            "target_language": target_lang
-        })
-        
-        if description_result:
-            translations[target_lang]["description"] = description_result
-        
-        # Translate category if provided
-        if category:
-            category_result = make_api_request("/translate", "POST", {
-                "text": category,
-                "source_language": source_lang,
-                "target_language": target_lang
-            })
+    # Targets equal to the source need no translation; the API requires at least one target
+    target_languages = [lang for lang in target_languages if lang != source_lang]
+    if not target_languages:
+        st.info("ℹ️ No translation needed: every selected target language is the source language")
+        return translations
+    
+    # Translate every field into all target languages with one request
+    result = make_api_request("/translate-product", "POST", {
+        "item": {
+            "title": title,
+            "description": description,
+            "category": category or None
+        },
+        "source_language": None if source_lang == "auto-detect" else source_lang,
+        "target_languages": target_languages
+    })
+    
+    if result:
+        for item in result.get("translations", []):
+            target_lang = item["target_language"]
+            translations[target_lang] = {}
             
-            if category_result:
-                translations[target_lang]["category"] = category_result
+            for field, translation_id in item["translation_ids"].items():
+                translations[target_lang][field] = {
+                    "translated_text": item[f"translated_{field}"],
+                    "translation_id": translation_id,
+                    "confidence": item.get("confidence_scores", {}).get(field, 0.0)
+                }
     
     return translations
 
@@ -379,61 +370,83 @@ def translation_history_page():
     
     st.dataframe(filtered_df, use_container_width=True)
     
-    # Download option
-    csv = filtered_df.to_csv(index=False)
-    st.download_button(
-        "📥 Download CSV",
-        csv,
-        "translation_history.csv",
-        "text/csv",
-        key='download-csv'
-    )
+    # Download option: the backend streams the full history, so large exports
+    # never pass through this page's memory
+    export_params = {"format": "csv"}
+    if source_filter != "All":
+        export_params["source_language"] = source_filter
+    if target_filter != "All":
+        export_params["target_language"] = target_filter
+    if correction_filter == "Corrected":
+        export_params["corrected_only"] = "true"
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.link_button("📥 Download CSV", f"{API_BASE_URL}/export?{urlencode(export_params)}")
+    with col2:
+        st.link_button(
+            "📥 Download JSONL (fine-tuning)",
+            f"{API_BASE_URL}/export?{urlencode({**export_params, 'format': 'jsonl'})}"
+        )
 
 def analytics_page():
     """Analytics and statistics page"""
     
     st.header("📈 Analytics & Statistics")
     
-    # Fetch statistics from API (mock for now)
+    # Fetch statistics from API
+    stats = make_api_request("/statistics?days=30")
+    
+    if not stats:
+        st.info("Statistics are not available yet.")
+        return
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Translations", "1,234", "+12%")
+        st.metric("Total Translations", f"{stats['total_translations']:,}",
+                  f"{stats['recent_translations']:,} this week")
     
     with col2:
-        st.metric("Corrections Submitted", "89", "+5%")
+        st.metric("Corrections Submitted", f"{stats['total_corrections']:,}")
     
     with col3:
         st.metric("Languages Supported", len(SUPPORTED_LANGUAGES))
     
     with col4:
-        st.metric("Avg. Confidence", "92.5%", "+2.1%")
+        st.metric("Avg. Confidence", f"{stats['average_confidence']:.1%}")
     
     # Language pair popularity chart
     st.subheader("🔀 Popular Language Pairs")
     
-    # Mock data for demonstration
-    language_pairs_data = {
-        "Language Pair": ["Hindi → English", "Tamil → English", "Bengali → Hindi", "English → Hindi", "Gujarati → English"],
-        "Translation Count": [450, 280, 220, 180, 140]
-    }
-    
-    df_pairs = pd.DataFrame(language_pairs_data)
-    st.bar_chart(df_pairs.set_index("Language Pair"))
+    if stats["language_pairs"]:
+        language_pairs_data = {
+            "Language Pair": [
+                f"{SUPPORTED_LANGUAGES.get(pair['source'], pair['source'])} → "
+                f"{SUPPORTED_LANGUAGES.get(pair['target'], pair['target'])}"
+                for pair in stats["language_pairs"][:10]
+            ],
+            "Translation Count": [pair["count"] for pair in stats["language_pairs"][:10]]
+        }
+        
+        df_pairs = pd.DataFrame(language_pairs_data)
+        st.bar_chart(df_pairs.set_index("Language Pair"))
+    else:
+        st.info("No translations yet.")
     
     # Daily translation trend
     st.subheader("📅 Daily Translation Trend")
     
-    # Mock time series data
-    dates = pd.date_range(start="2025-01-18", end="2025-01-25", freq="D")
-    translations_per_day = [45, 52, 38, 61, 47, 55, 49, 58]
-    
-    df_trend = pd.DataFrame({
-        "Date": dates,
-        "Translations": translations_per_day
-    })
-    
-    st.line_chart(df_trend.set_index("Date"))
+    if stats["daily"]:
+        df_trend = pd.DataFrame({
+            "Date": pd.to_datetime([day["date"] for day in stats["daily"]]),
+            "Translations": [day["translations"] for day in stats["daily"]],
+            "Corrections": [day["corrections"] for day in stats["daily"]]
+        })
+        
+        st.line_chart(df_trend.set_index("Date").sort_index())
+    else:
+        st.info("No activity in the last 30 days.")
 
 def settings_page():
     """Settings and configuration page"""